@@ -0,0 +1,181 @@
+"""
+Benchmark suite for DashboardGenerator
+Times the workbook loader and the HTML generator on synthetic workbooks of
+4 to 500 categories, saves the timings as a baseline and compares later
+runs against it, flagging any case that got slower than the threshold.
+
+Cases:
+    load_data         DashboardGenerator._load_data (pandas read + parse)
+    load_cached       DashboardGenerator(...) served from the parse cache
+    generate_html     DashboardGenerator.generate_html
+
+Usage:
+    python bench_dashboard.py --save-baseline bench_baseline.json
+    python bench_dashboard.py --baseline bench_baseline.json
+    python bench_dashboard.py --sizes 4 500 --repeat 10 --threshold 0.25 --report report.json
+
+Exit code 1 means at least one case regressed against the baseline.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from bench_load_data import build_sheet
+from sprint_dashboard import DashboardGenerator
+
+DEFAULT_SIZES = [4, 40, 200, 500]
+
+# A case regresses when it is this fraction slower than its baseline...
+DEFAULT_THRESHOLD = 0.20
+
+# ...and also at least this many milliseconds slower, so timer noise on
+# sub-millisecond cases is not reported
+MIN_REGRESSION_MS = 0.5
+
+
+def write_workbook(directory: str, categories: int, items_per_category: int) -> str:
+    """Write a synthetic dashboard workbook and return its path."""
+    path = os.path.join(directory, f'bench_{categories}.xlsx')
+    build_sheet(categories, items_per_category).to_excel(path, index=False)
+    return path
+
+
+def measure(func: Callable[[], object], repeat: int) -> Dict:
+    """Run ``func`` ``repeat`` times; return the best and median time in milliseconds."""
+    timings = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {'best_ms': round(min(timings), 4), 'median_ms': round(statistics.median(timings), 4)}
+
+
+def run_cases(sizes: List[int], items: int, repeat: int) -> Dict[str, Dict]:
+    """
+    Time every case at every size.
+
+    Returns:
+        Results keyed by "case/size", e.g. "generate_html/500"
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        # Cache entries for the throwaway workbooks go with them
+        cache_dir = os.path.join(directory, 'cache')
+        for size in sizes:
+            path = write_workbook(directory, size, items)
+            generator = DashboardGenerator(path, use_cache=True, cache_dir=cache_dir)
+            cases = {
+                'load_data': generator._load_data,
+                'load_cached': lambda: DashboardGenerator(path, use_cache=True, cache_dir=cache_dir),
+                'generate_html': generator.generate_html,
+            }
+            for name, func in cases.items():
+                func()  # warm up imports and the compiled page template
+                results[f'{name}/{size}'] = measure(func, repeat)
+    return results
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[Dict]:
+    """
+    Compare best times against a baseline.
+
+    Returns:
+        One row per case with the baseline and current times, the relative
+        change and a status of ok, faster, REGRESSION or new
+    """
+    rows = []
+    for key, current in results.items():
+        row = {'case': key, 'current_ms': current['best_ms'], 'baseline_ms': None,
+               'change': None, 'status': 'new'}
+        previous = baseline.get(key)
+        if previous is not None:
+            before, after = previous['best_ms'], current['best_ms']
+            row['baseline_ms'] = before
+            row['change'] = round(after / before - 1, 4) if before else None
+            if after > before * (1 + threshold) and after - before >= MIN_REGRESSION_MS:
+                row['status'] = 'REGRESSION'
+            elif after < before * (1 - threshold):
+                row['status'] = 'faster'
+            else:
+                row['status'] = 'ok'
+        rows.append(row)
+    return rows
+
+
+def print_results(results: Dict[str, Dict]) -> None:
+    """Print the timings of a run without a baseline."""
+    print(f"{'case':<22} {'best (ms)':>10} {'median (ms)':>12}")
+    for key, result in results.items():
+        print(f"{key:<22} {result['best_ms']:>10.2f} {result['median_ms']:>12.2f}")
+
+
+def print_comparison(rows: List[Dict]) -> None:
+    """Print the comparison report table."""
+    print(f"{'case':<22} {'baseline (ms)':>14} {'current (ms)':>13} {'change':>8}  status")
+    for row in rows:
+        baseline = f"{row['baseline_ms']:.2f}" if row['baseline_ms'] is not None else '-'
+        change = f"{row['change']:+.0%}" if row['change'] is not None else '-'
+        print(f"{row['case']:<22} {baseline:>14} {row['current_ms']:>13.2f} {change:>8}  {row['status']}")
+
+
+def environment() -> Dict:
+    """Describe the machine, so baselines from different hosts can be told apart."""
+    return {'python': platform.python_version(), 'machine': platform.machine(),
+            'platform': platform.platform()}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite; return 1 if any case regressed against the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Category counts to benchmark')
+    parser.add_argument('--items', type=int, default=5, help='Items per category')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement')
+    parser.add_argument('--baseline', metavar='FILE', help='Compare against a saved baseline')
+    parser.add_argument('--save-baseline', metavar='FILE', help='Save this run as the baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Fraction slower than the baseline that counts as a regression')
+    parser.add_argument('--report', metavar='FILE', help='Write the comparison report as JSON')
+    args = parser.parse_args(argv)
+
+    results = run_cases(args.sizes, args.items, args.repeat)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({'created': datetime.now().isoformat(timespec='seconds'),
+                       'environment': environment(), 'repeat': args.repeat,
+                       'results': results}, f, indent=2)
+
+    if not args.baseline:
+        print_results(results)
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline['results'], args.threshold)
+    print(f"baseline {args.baseline} ({baseline.get('created', 'unknown date')}), "
+          f"threshold {args.threshold:.0%}")
+    print_comparison(rows)
+
+    regressions = [row['case'] for row in rows if row['status'] == 'REGRESSION']
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'baseline': args.baseline, 'threshold': args.threshold,
+                       'environment': environment(), 'rows': rows,
+                       'regressions': regressions}, f, indent=2)
+    if regressions:
+        print(f"FAIL: {len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
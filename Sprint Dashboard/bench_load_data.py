@@ -0,0 +1,99 @@
+"""
+Benchmark for DashboardGenerator._parse_data
+Times the grouped parser against the original row-by-row parser on
+synthetic sheets of increasing size and checks both produce the same data.
+
+Usage:
+    python bench_load_data.py
+    python bench_load_data.py --sizes 10 100 1000 --items 20 --repeat 5
+"""
+
+import argparse
+import time
+from typing import Dict
+
+import pandas as pd
+
+from sprint_dashboard import DashboardGenerator
+
+
+def build_sheet(categories: int, items_per_category: int) -> pd.DataFrame:
+    """Build a sheet with the dashboard layout and the given dimensions."""
+    rows = [
+        {'Category': 'Sprint', 'Item': None, 'Metric': None, 'Value': '17.1 - 17.1'},
+        {'Category': 'Increment', 'Item': None, 'Metric': None, 'Value': '17'},
+    ]
+    for c in range(categories):
+        rows.append({'Category': f'CATEGORY {c}', 'Item': None, 'Metric': None, 'Value': None})
+        for i in range(items_per_category):
+            rows.append({'Category': None, 'Item': f'ITEM {c}.{i}', 'Metric': None, 'Value': None})
+        rows.append({'Category': None, 'Item': None, 'Metric': 'Delivered', 'Value': c % 10})
+        rows.append({'Category': None, 'Item': None, 'Metric': 'Total', 'Value': 40 + c % 7})
+        rows.append({'Category': None, 'Item': None, 'Metric': 'Health', 'Value': 3.0 + (c % 9) / 10})
+    return pd.DataFrame(rows, columns=['Category', 'Item', 'Metric', 'Value'])
+
+
+def parse_rowwise(df: pd.DataFrame) -> Dict:
+    """Reference parser: the original iterrows implementation."""
+    data = {
+        'sprint': df.iloc[0]['Value'],
+        'increment': df.iloc[1]['Value'],
+        'categories': []
+    }
+    current_category = None
+    for idx, row in df.iloc[2:].iterrows():
+        if pd.notna(row['Category']):
+            if current_category:
+                data['categories'].append(current_category)
+            current_category = {
+                'name': row['Category'],
+                'items': [],
+                'delivered': 0,
+                'total': 0,
+                'health': 0.0
+            }
+        elif pd.notna(row['Item']) and current_category:
+            current_category['items'].append(row['Item'])
+        elif pd.notna(row['Metric']) and current_category:
+            if row['Metric'] == 'Delivered':
+                current_category['delivered'] = int(row['Value'])
+            elif row['Metric'] == 'Total':
+                current_category['total'] = int(row['Value'])
+            elif row['Metric'] == 'Health':
+                current_category['health'] = float(row['Value'])
+    if current_category:
+        data['categories'].append(current_category)
+    return data
+
+
+def best_time(func, df: pd.DataFrame, repeat: int) -> float:
+    """Return the fastest of ``repeat`` runs in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Run the benchmark and print a scaling table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[4, 40, 400, 2000],
+                        help='Category counts to benchmark')
+    parser.add_argument('--items', type=int, default=10, help='Items per category')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement')
+    args = parser.parse_args()
+
+    print(f"{'categories':>10} {'rows':>8} {'row-by-row (ms)':>16} {'grouped (ms)':>13} {'speed-up':>9}")
+    for size in args.sizes:
+        df = build_sheet(size, args.items)
+        assert DashboardGenerator._parse_data(df) == parse_rowwise(df), "parsers disagree"
+        rowwise = best_time(parse_rowwise, df, args.repeat)
+        grouped = best_time(DashboardGenerator._parse_data, df, args.repeat)
+        print(f"{size:>10} {len(df):>8} {rowwise * 1000:>16.2f} {grouped * 1000:>13.2f} "
+              f"{rowwise / grouped:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Start-up benchmark for sprint_dashboard
+Imports the module in a fresh interpreter, keeps the best of several runs
+and fails if the import is over budget or loads pandas, the process pool or
+the unit test framework, which are only needed on first use.
+
+Usage:
+    python bench_startup.py
+    python bench_startup.py --repeat 10 --budget 150
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Budget in milliseconds, measured inside the child interpreter so Python's
+# own start-up is not counted
+DEFAULT_BUDGET_MS = 60
+
+LAZY_MODULES = ('pandas', 'concurrent.futures', 'unittest')
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import sprint_dashboard
+elapsed = time.perf_counter() - started
+print(json.dumps({'seconds': elapsed, 'loaded': [m for m in %r if m in sys.modules]}))
+"""
+
+
+def measure_import() -> dict:
+    """Import sprint_dashboard in a new interpreter and report time and lazy modules loaded."""
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE % (LAZY_MODULES,)],
+        cwd=Path(__file__).resolve().parent,
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main() -> int:
+    """Run the benchmark; return 1 if the budget is exceeded."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreters to start')
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS, help='Budget in milliseconds')
+    args = parser.parse_args()
+
+    runs = [measure_import() for _ in range(max(1, args.repeat))]
+    best_ms = min(run['seconds'] for run in runs) * 1000
+    loaded = sorted({name for run in runs for name in run['loaded']})
+
+    print(f"import sprint_dashboard: best {best_ms:.1f} ms of {len(runs)} (budget {args.budget:.0f} ms)")
+    if loaded:
+        print(f"FAIL: import loaded {', '.join(loaded)}")
+        return 1
+    if best_ms > args.budget:
+        print("FAIL: import time over budget")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
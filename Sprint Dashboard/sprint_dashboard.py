@@ -1,12 +1,146 @@
 """
 Sprint Metrics Dashboard Generator
 Reads Excel data and generates an HTML dashboard matching the design specifications.
+
+Usage:
+    python sprint_dashboard.py                       # sample workbook + unit tests
+    python sprint_dashboard.py --batch teams/        # every workbook in a directory
+    python sprint_dashboard.py --batch "teams/*.xlsx" --output-dir out --workers 4
+    python sprint_dashboard.py --watch dashboard_data.xlsx --output sprint_dashboard.html
+    python sprint_dashboard.py --render dashboard_data.xlsx --output - > dashboard.html
+    python sprint_dashboard.py --render dashboard_data.xlsx --metrics metrics.jsonl
 """
 
-import pandas as pd
-from typing import Dict, List
-import unittest
-from io import StringIO
+import argparse
+import glob
+import hashlib
+import json
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import IO, TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Union
+
+# pandas is imported where it is used: it dominates start-up time and is not
+# needed at all when a workbook's parsed data comes from the parse cache
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class CompiledTemplate:
+    """
+    Template text split once into static chunks and slots.
+    
+    Slots are written into the source with slot(). The compiled form is a
+    list of strings in which every slot occurrence owns one position, so
+    render() only drops the values into those positions and joins.
+    """
+    
+    MARK = '\x00'
+    
+    @classmethod
+    def slot(cls, name: str) -> str:
+        """Placeholder for the named value in template source."""
+        return f"{cls.MARK}{name}{cls.MARK}"
+    
+    def __init__(self, source: str):
+        """Compile source containing slot() placeholders."""
+        # Even positions are static text, odd positions are slot names
+        self._parts = source.split(self.MARK)
+        self.slots = tuple(self._parts[1::2])
+    
+    def render(self, values: List[str]) -> str:
+        """Fill the slots with formatted values given in ``slots`` order."""
+        out = self._parts.copy()
+        out[1::2] = values
+        return ''.join(out)
+    
+    def stream(self, values: List[Union[str, Iterable[str]]]) -> Iterator[str]:
+        """
+        Yield the static chunks and slot values in order without joining them.
+        
+        A value may itself be an iterable of strings, such as a generator of
+        cards, which is consumed lazily as the output is written.
+        """
+        parts = self._parts
+        yield parts[0]
+        for index, value in enumerate(values):
+            if isinstance(value, str):
+                yield value
+            else:
+                yield from value
+            yield parts[2 * index + 2]
+
+
+def rss_bytes() -> Optional[int]:
+    """Resident memory of this process, or its peak where only that is available."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class StageTimer:
+    """
+    Wall time and memory for each stage of one render.
+    
+    Stages are recorded in the order they finish, so a stage that encloses
+    others (load_data around read_excel and parse_data) comes after them.
+    record() gives one JSON-serialisable record per render; append_to()
+    adds it as a line to a metrics file.
+    """
+    
+    def __init__(self, render: str, **context):
+        self.render = render
+        self.context = context
+        self.stages: List[Dict] = []
+        self.started_at = datetime.now().isoformat()
+        self._start = time.perf_counter()
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block; recorded even if it raises."""
+        rss_before = rss_bytes()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            rss = rss_bytes()
+            entry = {'name': name, 'seconds': round(time.perf_counter() - start, 6), 'rss_bytes': rss}
+            if rss is not None and rss_before is not None:
+                entry['rss_delta_bytes'] = rss - rss_before
+            self.stages.append(entry)
+    
+    def record(self, status: str = 'ok', error: Optional[str] = None) -> Dict:
+        """Return the render's timing record."""
+        return {
+            'render': self.render,
+            'started_at': self.started_at,
+            'status': status,
+            'error': error,
+            'total_seconds': round(time.perf_counter() - self._start, 6),
+            'context': self.context,
+            'stages': list(self.stages),
+        }
+    
+    @staticmethod
+    def append_to(path: str, record: Dict) -> None:
+        """Append a record to a JSON-lines metrics file."""
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, separators=(',', ':')) + '\n')
 
 
 class DashboardGenerator:
@@ -27,47 +161,157 @@ class DashboardGenerator:
         'weight_normal': '400'
     }
     
-    def __init__(self, excel_path: str):
-        """Initialize with path to Excel file."""
+    # Bump when _parse_data output changes so stale cache entries are ignored
+    PARSE_CACHE_VERSION = 2
+    
+    def __init__(self, excel_path: str, use_cache: bool = True, timer: Optional[StageTimer] = None,
+                 cache_dir: Optional[str] = None):
+        """
+        Initialize with path to Excel file.
+        
+        With use_cache, parsed data is kept as JSON in a private per-user
+        cache directory (cache_dir, default parse_cache_dir()) and reused
+        while the workbook is unchanged. A timer records the load_data,
+        read_excel and parse_data stages.
+        """
         self.excel_path = excel_path
-        self.data = self._load_data()
+        self.timer = timer
+        self.cache_dir = cache_dir or parse_cache_dir()
+        self.data = self._load_cached_data() if use_cache else self._load_data()
+    
+    def _stage(self, name: str):
+        """Time a block as a stage of self.timer, if there is one."""
+        return self.timer.stage(name) if self.timer is not None else nullcontext()
+    
+    @property
+    def cache_path(self) -> str:
+        """Path of the cache entry holding the parsed workbook, named by its path hash."""
+        key = hashlib.sha256(os.path.abspath(self.excel_path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _load_cached_data(self) -> Dict:
+        """
+        Load parsed data from the parse cache, parsing the workbook on a miss.
+        
+        An entry is valid when the workbook's size and mtime match, or, if
+        those changed, when its SHA-256 content hash still matches.
+        """
+        stat = os.stat(self.excel_path)
+        cached = self._read_cache()
+        if cached is not None and (cached['size'], cached['mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+            return cached['data']
+        
+        digest = self._hash_file()
+        if cached is not None and cached['sha256'] == digest:
+            data = cached['data']
+        else:
+            data = self._load_data()
+        self._write_cache(stat, digest, data)
+        return data
+    
+    def _read_cache(self) -> Optional[Dict]:
+        """Read the cache entry for this workbook, if usable."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(cached, dict)
+                or cached.get('version') != self.PARSE_CACHE_VERSION
+                or cached.get('path') != os.path.abspath(self.excel_path)):
+            return None
+        return cached
+    
+    def _write_cache(self, stat: os.stat_result, digest: str, data: Dict) -> None:
+        """Write the cache entry atomically; failure to write is not an error."""
+        entry = {
+            'version': self.PARSE_CACHE_VERSION,
+            'path': os.path.abspath(self.excel_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': digest,
+            'data': data
+        }
+        try:
+            os.makedirs(self.cache_dir, mode=PARSE_CACHE_MODE, exist_ok=True)
+            # Entries stay 0600 as mkstemp creates them: the cache is private
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        except OSError:
+            # An unwritable cache just means the next run parses again
+            return
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, default=_json_scalar)
+            os.replace(tmp_path, self.cache_path)
+        except (OSError, TypeError):
+            # Nor is a cell value JSON cannot hold
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _hash_file(self) -> str:
+        """Return the SHA-256 hex digest of the workbook contents."""
+        return file_sha256(self.excel_path)
     
     def _load_data(self) -> Dict:
         """Load and parse Excel data into structured format."""
-        df = pd.read_excel(self.excel_path)
+        with self._stage('load_data'):
+            with self._stage('read_excel'):
+                import pandas as pd
+                
+                df = pd.read_excel(self.excel_path)
+            with self._stage('parse_data'):
+                return self._parse_data(df)
+    
+    @staticmethod
+    def _parse_data(df: 'pd.DataFrame') -> Dict:
+        """
+        Parse the sheet layout into the dashboard data structure.
+        
+        The first two rows hold the sprint and increment. Below them, a row
+        with a Category starts a new category; following rows either add an
+        Item to it or set one of its Delivered/Total/Health metrics. Rows are
+        grouped with a running count of category rows instead of being
+        walked one at a time.
+        """
+        import pandas as pd
         
-        # Parse the data structure
         data = {
             'sprint': df.iloc[0]['Value'],
             'increment': df.iloc[1]['Value'],
             'categories': []
         }
         
-        # Parse categories starting from row with 'DIGITAL'
-        current_category = None
-        for idx, row in df.iloc[2:].iterrows():
-            if pd.notna(row['Category']):
-                if current_category:
-                    data['categories'].append(current_category)
-                current_category = {
-                    'name': row['Category'],
-                    'items': [],
-                    'delivered': 0,
-                    'total': 0,
-                    'health': 0.0
-                }
-            elif pd.notna(row['Item']) and current_category:
-                current_category['items'].append(row['Item'])
-            elif pd.notna(row['Metric']) and current_category:
-                if row['Metric'] == 'Delivered':
-                    current_category['delivered'] = int(row['Value'])
-                elif row['Metric'] == 'Total':
-                    current_category['total'] = int(row['Value'])
-                elif row['Metric'] == 'Health':
-                    current_category['health'] = float(row['Value'])
-        
-        if current_category:
-            data['categories'].append(current_category)
+        body = df.iloc[2:]
+        is_category = body['Category'].notna()
+        # Category group of every row: 1 for the first category and its rows, ...
+        group = is_category.cumsum()
+        # Rows before the first category belong to no category
+        in_category = group > 0
+        
+        is_item = ~is_category & body['Item'].notna() & in_category
+        is_metric = ~is_category & body['Item'].isna() & body['Metric'].notna() & in_category
+        
+        items = body.loc[is_item, 'Item'].groupby(group[is_item]).agg(list).to_dict()
+        
+        # One column per metric, one row per category; the last value wins
+        metric_rows = body.loc[is_metric, ['Metric', 'Value']].assign(group=group[is_metric])
+        metric_rows = metric_rows[metric_rows['Metric'].isin(['Delivered', 'Total', 'Health'])]
+        metric_rows = metric_rows.drop_duplicates(['group', 'Metric'], keep='last')
+        metrics = metric_rows.pivot(index='group', columns='Metric', values='Value').to_dict('index')
+        
+        names = body.loc[is_category, 'Category']
+        for group_id, name in zip(group[is_category], names):
+            values = metrics.get(group_id, {})
+            delivered = values.get('Delivered')
+            total = values.get('Total')
+            health = values.get('Health')
+            data['categories'].append({
+                'name': name,
+                'items': items.get(group_id, []),
+                'delivered': int(delivered) if pd.notna(delivered) else 0,
+                'total': int(total) if pd.notna(total) else 0,
+                'health': float(health) if pd.notna(health) else 0.0
+            })
         
         return data
     
@@ -76,12 +320,11 @@ class DashboardGenerator:
         sprints = ['17.1', '17.2', '17.3', '17.4', '17.5', '17.6']
         current = '17.1'
         
-        html = '<div class="progress-container">'
-        for sprint in sprints:
-            active = 'active' if sprint == current else ''
-            html += f'<div class="progress-item {active}">{sprint}</div>'
-        html += '</div>'
-        return html
+        items = ''.join([
+            f'<div class="progress-item {"active" if sprint == current else ""}">{sprint}</div>'
+            for sprint in sprints
+        ])
+        return f'<div class="progress-container">{items}</div>'
     
     def _generate_category_card(self, category: Dict, index: int) -> str:
         """Generate HTML for a single category card."""
@@ -117,19 +360,31 @@ class DashboardGenerator:
         </div>
         '''
     
-    def generate_html(self) -> str:
-        """Generate complete HTML dashboard."""
-        cards_html = ''.join([
-            self._generate_category_card(cat, idx) 
-            for idx, cat in enumerate(self.data['categories'])
-        ])
+    @classmethod
+    def _page_template(cls) -> 'CompiledTemplate':
+        """
+        Return the compiled page template for this class.
         
-        html = f'''<!DOCTYPE html>
+        The stylesheet interpolates COLORS and FONTS, so the page is built
+        once per class on first use instead of on every generate_html()
+        call. A subclass with its own palette gets its own compiled page.
+        """
+        template = cls.__dict__.get('_compiled_page')
+        if template is None:
+            template = CompiledTemplate(cls._page_source())
+            cls._compiled_page = template
+        return template
+    
+    @classmethod
+    def _page_source(cls) -> str:
+        """Build the page template source with slots for the per-dashboard values."""
+        slot = CompiledTemplate.slot
+        return f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Digital Technology - Increment {self.data['increment']}</title>
+    <title>Digital Technology - Increment {slot('increment')}</title>
     <style>
         * {{
             margin: 0;
@@ -138,8 +393,8 @@ class DashboardGenerator:
         }}
         
         body {{
-            font-family: {self.FONTS['primary']};
-            background-color: {self.COLORS['light_gray']};
+            font-family: {cls.FONTS['primary']};
+            background-color: {cls.COLORS['light_gray']};
             padding: 20px;
         }}
         
@@ -160,29 +415,29 @@ class DashboardGenerator:
         
         .title {{
             font-size: 36px;
-            font-weight: {self.FONTS['weight_bold']};
-            color: {self.COLORS['primary_blue']};
+            font-weight: {cls.FONTS['weight_bold']};
+            color: {cls.COLORS['primary_blue']};
         }}
         
         .title .increment {{
-            color: {self.COLORS['orange']};
+            color: {cls.COLORS['orange']};
         }}
         
         .subtitle {{
             font-size: 18px;
-            color: {self.COLORS['orange']};
+            color: {cls.COLORS['orange']};
             margin-bottom: 5px;
         }}
 
         .subtitle .sprintrange {{
-            font-weight: {self.FONTS['weight_bold']};;
-            color: {self.COLORS['primary_blue']};
+            font-weight: {cls.FONTS['weight_bold']};;
+            color: {cls.COLORS['primary_blue']};
         }}
         
         .logo {{
             font-size: 32px;
-            font-weight: {self.FONTS['weight_bold']};
-            color: {self.COLORS['primary_blue']};
+            font-weight: {cls.FONTS['weight_bold']};
+            color: {cls.COLORS['primary_blue']};
         }}
         
         .logo .industrial {{
@@ -194,7 +449,7 @@ class DashboardGenerator:
         
         .progress-container {{
             display: flex;
-            background: {self.COLORS['light_gray']};
+            background: {cls.COLORS['light_gray']};
             border-radius: 25px;
             padding: 8px;
             margin-bottom: 30px;
@@ -206,13 +461,13 @@ class DashboardGenerator:
             text-align: center;
             padding: 8px;
             color: #999;
-            font-weight: {self.FONTS['weight_bold']};
+            font-weight: {cls.FONTS['weight_bold']};
             position: relative;
             z-index: 1;
         }}
         
         .progress-item.active {{
-            background: {self.COLORS['orange']};
+            background: {cls.COLORS['orange']};
             color: white;
             border-radius: 20px;
             position: relative;
@@ -226,7 +481,7 @@ class DashboardGenerator:
             transform: translateY(-50%);
             width: 18px;
             height: 18px;
-            background: {self.COLORS['primary_blue']};
+            background: {cls.COLORS['primary_blue']};
             border-radius: 50%;
             border: 3px solid white;
         }}
@@ -238,7 +493,7 @@ class DashboardGenerator:
         }}
         
         .card {{
-            border: 3px solid {self.COLORS['primary_blue']};
+            border: 3px solid {cls.COLORS['primary_blue']};
             border-radius: 15px;
             overflow: hidden;
             background: white;
@@ -251,16 +506,16 @@ class DashboardGenerator:
         }}
         
         .card-header-primary {{
-            background: {self.COLORS['primary_blue']};
+            background: {cls.COLORS['primary_blue']};
         }}
         
         .card-header-secondary {{
-            background: linear-gradient(135deg, {self.COLORS['secondary_blue']} 0%, {self.COLORS['primary_blue']} 100%);
+            background: linear-gradient(135deg, {cls.COLORS['secondary_blue']} 0%, {cls.COLORS['primary_blue']} 100%);
         }}
         
         .card-header h2 {{
             font-size: 24px;
-            font-weight: {self.FONTS['weight_bold']};
+            font-weight: {cls.FONTS['weight_bold']};
             margin-bottom: 15px;
             line-height: 1.2;
         }}
@@ -278,27 +533,27 @@ class DashboardGenerator:
         
         .metric-large {{
             font-size: 120px;
-            font-weight: {self.FONTS['weight_bold']};
-            color: {self.COLORS['primary_blue']};
+            font-weight: {cls.FONTS['weight_bold']};
+            color: {cls.COLORS['primary_blue']};
             line-height: 1;
             display: inline;
         }}
         
         .metric-divider {{
             height: 4px;
-            background: {self.COLORS['orange']};
+            background: {cls.COLORS['orange']};
             margin: 10px 40px;
         }}
         
         .metric-label {{
             font-size: 16px;
-            font-weight: {self.FONTS['weight_bold']};
-            color: {self.COLORS['primary_blue']};
+            font-weight: {cls.FONTS['weight_bold']};
+            color: {cls.COLORS['primary_blue']};
             margin-top: 15px;
         }}
         
         .card-footer {{
-            background: {self.COLORS['orange']};
+            background: {cls.COLORS['orange']};
             padding: 20px;
             text-align: center;
             color: white;
@@ -306,24 +561,24 @@ class DashboardGenerator:
         
         .health-score {{
             font-size: 48px;
-            font-weight: {self.FONTS['weight_bold']};
+            font-weight: {cls.FONTS['weight_bold']};
             display: inline;
         }}
         
         .health-divider {{
             height: 3px;
-            background: {self.COLORS['primary_blue']};
+            background: {cls.COLORS['primary_blue']};
             margin: 8px 40px;
         }}
         
         .health-max {{
             font-size: 36px;
-            font-weight: {self.FONTS['weight_bold']};
+            font-weight: {cls.FONTS['weight_bold']};
         }}
         
         .health-label {{
             font-size: 14px;
-            font-weight: {self.FONTS['weight_bold']};
+            font-weight: {cls.FONTS['weight_bold']};
             margin-top: 8px;
             letter-spacing: 1px;
         }}
@@ -333,8 +588,8 @@ class DashboardGenerator:
     <div class="container">
         <div class="header">
             <div>                
-                <div class="title">DIGITAL TECHNOLOGY – <span class="increment">INCREMENT {self.data['increment']}</span></div>
-                <div class="subtitle">Delivery metrics for Sprint {self.data['sprint']}</div>
+                <div class="title">DIGITAL TECHNOLOGY – <span class="increment">INCREMENT {slot('increment')}</span></div>
+                <div class="subtitle">Delivery metrics for Sprint {slot('sprint')}</div>
             </div>
             <div class="logo">
                 SIME
@@ -342,25 +597,235 @@ class DashboardGenerator:
             </div>
         </div>
         
-        {self._generate_progress_bar()}
+        {slot('progress')}
         
         <div class="cards-container">
-            {cards_html}
+            {slot('cards')}
         </div>
     </div>
 </body>
 </html>'''
-        return html
+    
+    def _page_values(self, cards: Union[str, Iterable[str]]) -> List:
+        """Return the page slot values, in template order, around the given cards."""
+        increment = f"{self.data['increment']}"
+        return [
+            increment,
+            increment,
+            f"{self.data['sprint']}",
+            self._generate_progress_bar(),
+            cards,
+        ]
+    
+    def _iter_cards(self) -> Iterator[str]:
+        """Yield the HTML of each category card in order."""
+        for idx, cat in enumerate(self.data['categories']):
+            yield self._generate_category_card(cat, idx)
+    
+    def generate_html(self) -> str:
+        """Generate complete HTML dashboard."""
+        cards_html = ''.join([
+            self._generate_category_card(cat, idx) 
+            for idx, cat in enumerate(self.data['categories'])
+        ])
+        return self._page_template().render(self._page_values(cards_html))
+    
+    def iter_html(self) -> Iterator[str]:
+        """
+        Yield the HTML dashboard in chunks.
+        
+        Chunks are the static template text, the progress bar and one chunk
+        per category card, so the full document is never held in memory.
+        Joining the chunks gives exactly generate_html().
+        """
+        return self._page_template().stream(self._page_values(self._iter_cards()))
+    
+    def write_html(self, out: IO, encoding: Optional[str] = None) -> int:
+        """
+        Stream the HTML dashboard into a writable file object.
+        
+        Args:
+            out: Text stream (an open file, sys.stdout), or a binary stream
+                 such as an HTTP handler's wfile when ``encoding`` is given
+            encoding: Encode each chunk with this codec before writing
+        
+        Returns:
+            Number of characters (or bytes, when encoding) written
+        """
+        written = 0
+        for chunk in self.iter_html():
+            if encoding is not None:
+                chunk = chunk.encode(encoding)
+            out.write(chunk)
+            written += len(chunk)
+        return written
     
     def save_html(self, output_path: str) -> None:
-        """Generate and save HTML to file."""
-        html = self.generate_html()
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        """
+        Generate and save HTML to file.
+        
+        The HTML is streamed into a temporary file that then replaces the
+        output, so a browser reloading the page never sees a partial file
+        and the whole document is never built in memory.
+        """
+        directory = os.path.dirname(os.path.abspath(output_path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                self.write_html(f)
+            os.chmod(tmp_path, _replacement_mode(output_path))
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def _current_umask() -> int:
+    """Return the process umask (reading it means briefly setting it)."""
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: os.umask() is process-wide, so probing it from
+# several threads later could leave files with the wrong mode
+_UMASK = _current_umask()
+
+
+def _replacement_mode(target: str) -> int:
+    """
+    Permission bits for a file about to replace ``target``.
+
+    Temporary files are created private (0600); chmod-ing them to this
+    before the swap keeps an existing file's mode, and gives a new file
+    the usual 0666 less the umask.
+    """
+    try:
+        return stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+# Environment variable that moves the parse cache, e.g. for tests
+PARSE_CACHE_ENV = 'SPRINT_DASHBOARD_CACHE_DIR'
+
+# Mode of a newly created parse cache directory: owner only
+PARSE_CACHE_MODE = 0o700
+
+
+def parse_cache_dir() -> str:
+    """
+    Per-user directory for parsed-workbook cache entries.
+    
+    Kept out of the workbook's folder, so nobody who can write there can
+    plant a cache entry. Set SPRINT_DASHBOARD_CACHE_DIR to move it.
+    """
+    override = os.environ.get(PARSE_CACHE_ENV)
+    if override:
+        return override
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'sprint-dashboard', 'parsed')
+
+
+def _json_scalar(value: object) -> object:
+    """json.dump fallback turning NumPy scalars from pandas into Python ones."""
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def file_sha256(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class WorkbookWatcher:
+    """
+    Regenerates a dashboard whenever its workbook changes.
+    
+    The workbook is polled with os.stat. A burst of saves (Excel often
+    writes a file several times) is coalesced: regeneration waits until
+    the file has been quiet for ``debounce`` seconds, and is skipped if
+    the content hash is the same as the last generated version.
+    """
+    
+    def __init__(self, excel_path: str, output_path: str, poll_interval: float = 0.5,
+                 debounce: float = 1.0, clock=time.monotonic):
+        """Initialize the watcher; nothing is generated until check() or run()."""
+        self.excel_path = excel_path
+        self.output_path = output_path
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self._clock = clock
+        self._last_stat = None
+        self._last_change = None
+        self._last_digest = None
+        self.regenerations = 0
+    
+    def _stat_signature(self):
+        """Size and mtime of the workbook, or None while it is missing."""
+        try:
+            stat = os.stat(self.excel_path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+    
+    def check(self) -> bool:
+        """
+        Poll the workbook once and regenerate if a settled change is pending.
+        
+        Returns:
+            True if the dashboard was regenerated on this call.
+        """
+        signature = self._stat_signature()
+        now = self._clock()
+        if signature != self._last_stat:
+            self._last_stat = signature
+            self._last_change = now
+        
+        if signature is None or self._last_change is None:
+            return False
+        # The initial dashboard is built straight away; later changes wait
+        # until the workbook has been quiet for the debounce period
+        if self._last_digest is not None and now - self._last_change < self.debounce:
+            return False
+        self._last_change = None
+        
+        digest = file_sha256(self.excel_path)
+        if digest == self._last_digest:
+            return False
+        
+        try:
+            DashboardGenerator(self.excel_path).save_html(self.output_path)
+        except Exception as e:
+            # Keep serving the last good dashboard; the next save retries
+            print(f"Could not regenerate {self.output_path}: {type(e).__name__}: {e}")
+            return False
+        self._last_digest = digest
+        self.regenerations += 1
+        return True
+    
+    def run(self, stop_event: Optional[threading.Event] = None) -> None:
+        """Poll until stop_event is set (or forever), printing each regeneration."""
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            if self.check():
+                print(f"[{time.strftime('%H:%M:%S')}] Dashboard regenerated: {self.output_path}")
+            stop_event.wait(self.poll_interval)
 
 
 def create_sample_excel(output_path: str) -> None:
     """Create a sample Excel file with the expected structure."""
+    import pandas as pd
+    
     data = {
         'Category': ['Sprint', 'Increment', 'DIGITAL TECHNOLOGY', None, None, None, 
                      'DIGITAL', None, None, None, None,
@@ -397,72 +862,191 @@ def create_sample_excel(output_path: str) -> None:
     df.to_excel(output_path, index=False)
 
 
-# Unit Tests
-class TestDashboardGenerator(unittest.TestCase):
-    """Unit tests for DashboardGenerator class."""
+def collect_workbooks(source: str) -> List[str]:
+    """
+    Resolve a directory or glob pattern into a sorted list of workbooks.
+    
+    Excel lock files (``~$name.xlsx``) are skipped.
+    """
+    pattern = os.path.join(source, '*.xlsx') if os.path.isdir(source) else source
+    return sorted(
+        path for path in glob.glob(pattern)
+        if os.path.isfile(path) and not os.path.basename(path).startswith('~$')
+    )
+
+
+def batch_output_path(excel_path: str, output_dir: Optional[str] = None) -> str:
+    """Return the HTML path for a workbook: same name, .html, in output_dir or beside it."""
+    stem = os.path.splitext(os.path.basename(excel_path))[0]
+    return os.path.join(output_dir or os.path.dirname(excel_path), f"{stem}.html")
+
+
+def is_up_to_date(excel_path: str, output_path: str) -> bool:
+    """True if the output exists and is newer than its workbook."""
+    try:
+        return os.path.getmtime(output_path) >= os.path.getmtime(excel_path)
+    except OSError:
+        return False
+
+
+def render_workbook(excel_path: str, output_path: str) -> Dict:
+    """
+    Load one workbook and write its dashboard, timing each step.
+    
+    Runs inside a worker process, so errors are captured in the returned
+    summary entry rather than raised. The entry's 'trace' holds the
+    StageTimer record (load, read_excel, parse_data, save_html stages).
+    """
+    entry = {'workbook': excel_path, 'output': output_path, 'status': 'ok',
+             'load_seconds': None, 'render_seconds': None, 'error': None}
+    timer = StageTimer('workbook', workbook=excel_path)
+    try:
+        start = time.perf_counter()
+        with timer.stage('load'):
+            generator = DashboardGenerator(excel_path, timer=timer)
+        entry['load_seconds'] = round(time.perf_counter() - start, 4)
+        
+        start = time.perf_counter()
+        with timer.stage('save_html'):
+            generator.save_html(output_path)
+        entry['render_seconds'] = round(time.perf_counter() - start, 4)
+    except Exception as e:
+        entry['status'] = 'failed'
+        entry['error'] = f"{type(e).__name__}: {e}"
+        entry['traceback'] = traceback.format_exc()
+    entry['trace'] = timer.record(entry['status'], entry['error'])
+    return entry
+
+
+def run_batch(source: str, output_dir: Optional[str] = None, workers: Optional[int] = None,
+              force: bool = False, summary_path: Optional[str] = None,
+              metrics_path: Optional[str] = None) -> Dict:
+    """
+    Generate dashboards for every workbook matching a directory or glob.
+    
+    Workbooks whose HTML is newer than the workbook are skipped unless
+    force is set. The rest are rendered in a process pool; a failing
+    workbook is recorded in the summary and does not stop the batch.
+    
+    Returns:
+        The summary, which is also written as JSON to summary_path
+        (default: batch_summary.json in the output directory, else the
+        source directory, else the current directory). With metrics_path,
+        each rendered workbook's stage timings are appended there as one
+        JSON line.
+    """
+    start = time.perf_counter()
+    workbooks = collect_workbooks(source)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    entries = []
+    pending = []
+    for excel_path in workbooks:
+        output_path = batch_output_path(excel_path, output_dir)
+        if not force and is_up_to_date(excel_path, output_path):
+            entries.append({'workbook': excel_path, 'output': output_path, 'status': 'skipped',
+                            'load_seconds': None, 'render_seconds': None, 'error': None})
+        else:
+            pending.append((excel_path, output_path))
+    
+    if pending:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(render_workbook, *job) for job in pending]
+            for (excel_path, output_path), future in zip(pending, futures):
+                try:
+                    entries.append(future.result())
+                except Exception as e:
+                    # The worker process itself died (e.g. out of memory)
+                    entries.append({'workbook': excel_path, 'output': output_path,
+                                    'status': 'failed', 'load_seconds': None,
+                                    'render_seconds': None, 'error': f"{type(e).__name__}: {e}"})
+    
+    if metrics_path:
+        for entry in entries:
+            if 'trace' in entry:
+                StageTimer.append_to(metrics_path, entry['trace'])
+    
+    summary = {
+        'source': source,
+        'generated': sum(1 for e in entries if e['status'] == 'ok'),
+        'skipped': sum(1 for e in entries if e['status'] == 'skipped'),
+        'failed': sum(1 for e in entries if e['status'] == 'failed'),
+        'total_seconds': round(time.perf_counter() - start, 4),
+        'files': sorted(entries, key=lambda e: e['workbook'])
+    }
+    
+    if summary_path is None:
+        summary_dir = output_dir or (source if os.path.isdir(source) else '.')
+        summary_path = os.path.join(summary_dir, 'batch_summary.json')
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main execution function.
+    
+    Without --batch, --watch or --render, creates the sample workbook and
+    generates its dashboard.
+    """
+    parser = argparse.ArgumentParser(description="Generate sprint dashboards from Excel workbooks.")
+    parser.add_argument('--batch', metavar='DIR_OR_GLOB',
+                        help="Generate a dashboard for every workbook in a directory or glob")
+    parser.add_argument('--output-dir', help="Where to write batch HTML (default: beside each workbook)")
+    parser.add_argument('--workers', type=int, help="Worker processes for batch mode (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="Regenerate even up-to-date dashboards")
+    parser.add_argument('--summary', help="Batch summary path (default: batch_summary.json)")
+    parser.add_argument('--watch', metavar='WORKBOOK',
+                        help="Regenerate the dashboard whenever this workbook changes")
+    parser.add_argument('--render', metavar='WORKBOOK',
+                        help="Generate the dashboard for one workbook")
+    parser.add_argument('--output', default='sprint_dashboard.html',
+                        help="HTML written by --watch or --render; '-' streams --render to "
+                             "stdout (default: sprint_dashboard.html)")
+    parser.add_argument('--metrics', metavar='FILE',
+                        help="Append per-stage timings and memory of --render/--batch "
+                             "as one JSON line per workbook")
+    parser.add_argument('--debounce', type=float, default=1.0,
+                        help="Seconds a workbook must be unchanged before regenerating (default: 1.0)")
+    args = parser.parse_args(argv)
+    
+    if args.watch:
+        print(f"Watching {args.watch} -> {args.output} (Ctrl+C to stop)")
+        try:
+            WorkbookWatcher(args.watch, args.output, debounce=args.debounce).run()
+        except KeyboardInterrupt:
+            pass
+        return 0
+    
+    if args.render:
+        timer = StageTimer('render', workbook=args.render)
+        with timer.stage('load'):
+            generator = DashboardGenerator(args.render, timer=timer)
+        with timer.stage('write_html'):
+            if args.output == '-':
+                generator.write_html(sys.stdout)
+            else:
+                generator.save_html(args.output)
+        if args.output != '-':
+            print(f"Dashboard generated: {args.output}")
+        if args.metrics:
+            StageTimer.append_to(args.metrics, timer.record())
+        return 0
+    
+    if args.batch:
+        summary = run_batch(args.batch, args.output_dir, args.workers, args.force, args.summary,
+                            args.metrics)
+        print(f"Generated {summary['generated']}, skipped {summary['skipped']}, "
+              f"failed {summary['failed']} in {summary['total_seconds']:.2f}s")
+        for entry in summary['files']:
+            if entry['status'] == 'failed':
+                print(f"  FAILED {entry['workbook']}: {entry['error']}")
+        return 1 if summary['failed'] else 0
     
-    @classmethod
-    def setUpClass(cls):
-        """Create test Excel file before running tests."""
-        cls.test_excel = 'test_dashboard_data.xlsx'
-        create_sample_excel(cls.test_excel)
-    
-    def test_load_data_structure(self):
-        """Test that data loads with correct structure."""
-        generator = DashboardGenerator(self.test_excel)
-        self.assertIn('sprint', generator.data)
-        self.assertIn('increment', generator.data)
-        self.assertIn('categories', generator.data)
-        self.assertIsInstance(generator.data['categories'], list)
-    
-    def test_category_count(self):
-        """Test correct number of categories are loaded."""
-        generator = DashboardGenerator(self.test_excel)
-        self.assertEqual(len(generator.data['categories']), 4)
-    
-    def test_category_structure(self):
-        """Test that each category has required fields."""
-        generator = DashboardGenerator(self.test_excel)
-        for category in generator.data['categories']:
-            self.assertIn('name', category)
-            self.assertIn('items', category)
-            self.assertIn('delivered', category)
-            self.assertIn('total', category)
-            self.assertIn('health', category)
-    
-    def test_html_generation(self):
-        """Test that HTML is generated without errors."""
-        generator = DashboardGenerator(self.test_excel)
-        html = generator.generate_html()
-        self.assertIsInstance(html, str)
-        self.assertGreater(len(html), 1000)
-        self.assertIn('<!DOCTYPE html>', html)
-    
-    def test_html_contains_data(self):
-        """Test that generated HTML contains actual data."""
-        generator = DashboardGenerator(self.test_excel)
-        html = generator.generate_html()
-        self.assertIn('INCREMENT 17', html)
-        self.assertIn('DIGITAL TECHNOLOGY', html)
-        self.assertIn('FEATURES DELIVERED', html)
-        self.assertIn('HEALTH METRICS', html)
-    
-    def test_color_constants(self):
-        """Test that color constants are properly defined."""
-        self.assertEqual(DashboardGenerator.COLORS['primary_blue'], '#003d5c')
-        self.assertEqual(DashboardGenerator.COLORS['orange'], '#ff6633')
-    
-    def test_progress_bar_generation(self):
-        """Test progress bar HTML generation."""
-        generator = DashboardGenerator(self.test_excel)
-        progress_html = generator._generate_progress_bar()
-        self.assertIn('17.1', progress_html)
-        self.assertIn('17.6', progress_html)
-        self.assertIn('active', progress_html)
-
-
-def main():
-    """Main execution function."""
     # Create sample Excel file
     excel_file = 'dashboard_data.xlsx'
     create_sample_excel(excel_file)
@@ -473,12 +1057,18 @@ def main():
     output_file = 'sprint_dashboard.html'
     generator.save_html(output_file)
     print(f"Dashboard generated: {output_file}")
+    return 0
 
 
 if __name__ == '__main__':
+    # Command line options select batch mode; no options keeps the demo run
+    if len(sys.argv) > 1:
+        sys.exit(main(sys.argv[1:]))
+    
     # Run main program
-    main()
+    main([])
     
     # Run unit tests
+    import unittest
     print("\nRunning unit tests...")
-    unittest.main(argv=[''], exit=False, verbosity=2)
+    unittest.main(module='test_sprint_dashboard', argv=[''], exit=False, verbosity=2)
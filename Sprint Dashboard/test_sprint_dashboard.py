@@ -0,0 +1,322 @@
+"""
+Unit tests for sprint_dashboard.
+
+Run with ``python -m unittest test_sprint_dashboard`` or as part of the demo
+run (``python sprint_dashboard.py`` with no options).
+"""
+
+import io
+import json
+import os
+import shutil
+import stat
+import tempfile
+import tracemalloc
+import unittest
+import unittest.mock
+
+import pandas as pd
+
+from sprint_dashboard import (
+    PARSE_CACHE_ENV, DashboardGenerator, StageTimer, WorkbookWatcher, create_sample_excel, run_batch,
+)
+
+
+def setUpModule():
+    """Keep the parse cache in a scratch directory instead of the user's cache."""
+    global _cache_env
+    _cache_env = unittest.mock.patch.dict(os.environ, {PARSE_CACHE_ENV: tempfile.mkdtemp(prefix='test_cache_')})
+    _cache_env.start()
+
+
+def tearDownModule():
+    """Remove the scratch parse cache."""
+    shutil.rmtree(os.environ[PARSE_CACHE_ENV], ignore_errors=True)
+    _cache_env.stop()
+
+
+class TestDashboardGenerator(unittest.TestCase):
+    """Unit tests for DashboardGenerator class."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create test Excel file before running tests."""
+        cls.test_excel = 'test_dashboard_data.xlsx'
+        create_sample_excel(cls.test_excel)
+    
+    def test_load_data_structure(self):
+        """Test that data loads with correct structure."""
+        generator = DashboardGenerator(self.test_excel)
+        self.assertIn('sprint', generator.data)
+        self.assertIn('increment', generator.data)
+        self.assertIn('categories', generator.data)
+        self.assertIsInstance(generator.data['categories'], list)
+    
+    def test_category_count(self):
+        """Test correct number of categories are loaded."""
+        generator = DashboardGenerator(self.test_excel)
+        self.assertEqual(len(generator.data['categories']), 4)
+    
+    def test_category_structure(self):
+        """Test that each category has required fields."""
+        generator = DashboardGenerator(self.test_excel)
+        for category in generator.data['categories']:
+            self.assertIn('name', category)
+            self.assertIn('items', category)
+            self.assertIn('delivered', category)
+            self.assertIn('total', category)
+            self.assertIn('health', category)
+    
+    def test_parse_matches_row_rules(self):
+        """Test grouping of items and metrics, including edge-case rows."""
+        df = pd.DataFrame({
+            'Category': ['Sprint', 'Increment', None, 'ALPHA', None, None, None, None, 'BETA', None],
+            'Item': [None, None, 'ORPHAN', None, 'A1', None, None, 'A2', None, None],
+            'Metric': [None, None, None, None, None, 'Delivered', 'Delivered', None, None, 'Health'],
+            'Value': ['18.1 - 18.2', '18', None, None, None, 4, 6, None, None, 3.5]
+        })
+        data = DashboardGenerator._parse_data(df)
+        self.assertEqual(data['increment'], '18')
+        self.assertEqual(data['categories'], [
+            {'name': 'ALPHA', 'items': ['A1', 'A2'], 'delivered': 6, 'total': 0, 'health': 0.0},
+            {'name': 'BETA', 'items': [], 'delivered': 0, 'total': 0, 'health': 3.5},
+        ])
+    
+    def test_parse_cache_skips_excel_reader(self):
+        """Test that an unchanged workbook is served from the parse cache."""
+        first = DashboardGenerator(self.test_excel)
+        self.assertTrue(os.path.exists(first.cache_path))
+        with unittest.mock.patch('pandas.read_excel', side_effect=AssertionError("re-parsed")):
+            second = DashboardGenerator(self.test_excel)
+        self.assertEqual(first.data, second.data)
+    
+    def test_parse_cache_is_private_json(self):
+        """Test that the cache is JSON in a private directory, away from the workbook."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache_dir = os.path.join(directory, 'cache')
+            generator = DashboardGenerator(self.test_excel, cache_dir=cache_dir)
+            self.assertEqual(os.path.dirname(generator.cache_path), cache_dir)
+            with open(generator.cache_path, encoding='utf-8') as f:
+                self.assertEqual(json.load(f)['data']['categories'], generator.data['categories'])
+            if os.name != 'nt':
+                self.assertEqual(stat.S_IMODE(os.stat(cache_dir).st_mode), 0o700)
+        self.assertEqual([name for name in os.listdir('.') if name.startswith(self.test_excel + '.')], [])
+    
+    def test_parse_cache_invalidated_on_change(self):
+        """Test that changing the workbook invalidates the parse cache."""
+        excel = 'test_dashboard_cache.xlsx'
+        create_sample_excel(excel)
+        try:
+            DashboardGenerator(excel)
+            df = pd.read_excel(excel)
+            df.loc[1, 'Value'] = '18'
+            df.to_excel(excel, index=False)
+            self.assertEqual(str(DashboardGenerator(excel).data['increment']), '18')
+        finally:
+            os.remove(excel)
+    
+    def test_stage_timer_records_load_stages(self):
+        """Test that loading with a timer records read_excel and parse_data inside load_data."""
+        timer = StageTimer('render', workbook=self.test_excel)
+        DashboardGenerator(self.test_excel, use_cache=False, timer=timer)
+        record = timer.record()
+        self.assertEqual([s['name'] for s in record['stages']], ['read_excel', 'parse_data', 'load_data'])
+        by_name = {s['name']: s['seconds'] for s in record['stages']}
+        self.assertGreaterEqual(by_name['load_data'], by_name['read_excel'] + by_name['parse_data'])
+        self.assertEqual(record['context'], {'workbook': self.test_excel})
+        json.dumps(record)
+    
+    def test_html_generation(self):
+        """Test that HTML is generated without errors."""
+        generator = DashboardGenerator(self.test_excel)
+        html = generator.generate_html()
+        self.assertIsInstance(html, str)
+        self.assertGreater(len(html), 1000)
+        self.assertIn('<!DOCTYPE html>', html)
+    
+    def test_html_contains_data(self):
+        """Test that generated HTML contains actual data."""
+        generator = DashboardGenerator(self.test_excel)
+        html = generator.generate_html()
+        self.assertIn('INCREMENT 17', html)
+        self.assertIn('DIGITAL TECHNOLOGY', html)
+        self.assertIn('FEATURES DELIVERED', html)
+        self.assertIn('HEALTH METRICS', html)
+    
+    def test_color_constants(self):
+        """Test that color constants are properly defined."""
+        self.assertEqual(DashboardGenerator.COLORS['primary_blue'], '#003d5c')
+        self.assertEqual(DashboardGenerator.COLORS['orange'], '#ff6633')
+    
+    def test_progress_bar_generation(self):
+        """Test progress bar HTML generation."""
+        generator = DashboardGenerator(self.test_excel)
+        progress_html = generator._generate_progress_bar()
+        self.assertIn('17.1', progress_html)
+        self.assertIn('17.6', progress_html)
+        self.assertIn('active', progress_html)
+    
+    def test_page_template_compiled_once_per_palette(self):
+        """Test that the stylesheet is built once and follows a subclass palette."""
+        generator = DashboardGenerator(self.test_excel)
+        generator.generate_html()
+        with unittest.mock.patch.object(DashboardGenerator, '_page_source',
+                                        side_effect=AssertionError("rebuilt")):
+            html = generator.generate_html()
+        self.assertIn('INCREMENT 17', html)
+        
+        class GreenDashboard(DashboardGenerator):
+            COLORS = dict(DashboardGenerator.COLORS, orange='#00aa55')
+        
+        green = GreenDashboard(self.test_excel)
+        self.assertIn('#00aa55', green.generate_html())
+        self.assertNotIn('#00aa55', generator.generate_html())
+    
+    def test_streamed_html_matches_generate_html(self):
+        """Test that streaming to text and binary sinks gives the same document."""
+        generator = DashboardGenerator(self.test_excel)
+        expected = generator.generate_html()
+        self.assertEqual(''.join(generator.iter_html()), expected)
+        
+        text = io.StringIO()
+        self.assertEqual(generator.write_html(text), len(expected))
+        self.assertEqual(text.getvalue(), expected)
+        
+        binary = io.BytesIO()
+        generator.write_html(binary, encoding='utf-8')
+        self.assertEqual(binary.getvalue(), expected.encode('utf-8'))
+    
+    def test_streaming_memory_stays_flat(self):
+        """Test that peak memory while streaming does not grow with categories."""
+        def peak_bytes(categories):
+            generator = DashboardGenerator(self.test_excel)
+            generator.data = dict(generator.data, categories=[
+                {'name': f'CATEGORY {i}', 'items': [f'ITEM {j}' for j in range(10)],
+                 'delivered': 1, 'total': 2, 'health': 3.0}
+                for i in range(categories)
+            ])
+            with open(os.devnull, 'w', encoding='utf-8') as sink:
+                tracemalloc.start()
+                try:
+                    generator.write_html(sink)
+                    return tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+        
+        small, large = peak_bytes(10), peak_bytes(1000)
+        self.assertLess(large, small * 2)
+    
+    @unittest.skipIf(os.name == 'nt', "POSIX permission bits")
+    def test_save_html_keeps_file_mode(self):
+        """Test that regenerating a dashboard keeps the existing file's permissions."""
+        generator = DashboardGenerator(self.test_excel)
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'dashboard.html')
+            with open(output, 'w') as f:
+                f.write('old')
+            os.chmod(output, 0o644)
+            generator.save_html(output)
+            self.assertEqual(os.stat(output).st_mode & 0o777, 0o644)
+
+
+class TestWorkbookWatcher(unittest.TestCase):
+    """Unit tests for watch mode, driven by a fake clock."""
+    
+    def setUp(self):
+        """Create a workbook and a watcher with a controllable clock."""
+        self.directory = tempfile.mkdtemp(prefix='test_watch_')
+        self.excel = os.path.join(self.directory, 'watched.xlsx')
+        self.output = os.path.join(self.directory, 'watched.html')
+        create_sample_excel(self.excel)
+        self.now = 100.0
+        self.watcher = WorkbookWatcher(self.excel, self.output, debounce=1.0,
+                                       clock=lambda: self.now)
+    
+    def tearDown(self):
+        """Remove the scratch directory."""
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+    
+    def _touch(self, mtime_ns: int) -> None:
+        os.utime(self.excel, ns=(mtime_ns, mtime_ns))
+    
+    def test_initial_generation(self):
+        """Test that the first poll builds the dashboard."""
+        self.assertTrue(self.watcher.check())
+        self.assertTrue(os.path.exists(self.output))
+    
+    def test_burst_of_saves_is_debounced(self):
+        """Test that regeneration waits until saves stop for the debounce period."""
+        self.watcher.check()
+        df = pd.read_excel(self.excel)
+        df.loc[1, 'Value'] = '18'
+        df.to_excel(self.excel, index=False)
+        for step in range(3):
+            self._touch(10 ** 18 + step)
+            self.now += 0.5
+            self.assertFalse(self.watcher.check())
+        self.now += 1.0
+        self.assertTrue(self.watcher.check())
+        self.assertEqual(self.watcher.regenerations, 2)
+        with open(self.output, encoding='utf-8') as f:
+            self.assertIn('INCREMENT 18', f.read())
+    
+    def test_unchanged_content_not_regenerated(self):
+        """Test that touching the workbook without changing it is ignored."""
+        self.watcher.check()
+        self._touch(10 ** 18)
+        self.now += 0.1
+        self.watcher.check()
+        self.now += 1.0
+        self.assertFalse(self.watcher.check())
+        self.assertEqual(self.watcher.regenerations, 1)
+
+
+class TestBatchMode(unittest.TestCase):
+    """Unit tests for directory batch generation."""
+    
+    def setUp(self):
+        """Create a directory with two good workbooks and one broken one."""
+        self.directory = tempfile.mkdtemp(prefix='test_batch_')
+        for name in ('team_a.xlsx', 'team_b.xlsx'):
+            create_sample_excel(os.path.join(self.directory, name))
+        with open(os.path.join(self.directory, 'broken.xlsx'), 'w') as f:
+            f.write('not a workbook')
+    
+    def tearDown(self):
+        """Remove the scratch directory."""
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+    
+    def test_batch_generates_and_reports_failures(self):
+        """Test that one bad workbook is reported without stopping the batch."""
+        summary = run_batch(self.directory, workers=2)
+        self.assertEqual(summary['generated'], 2)
+        self.assertEqual(summary['failed'], 1)
+        self.assertTrue(os.path.exists(os.path.join(self.directory, 'team_a.html')))
+        self.assertTrue(os.path.exists(os.path.join(self.directory, 'batch_summary.json')))
+    
+    def test_batch_metrics_one_line_per_workbook(self):
+        """Test that --metrics style output holds one stage record per rendered workbook."""
+        metrics_path = os.path.join(self.directory, 'metrics.jsonl')
+        run_batch(self.directory, workers=2, metrics_path=metrics_path)
+        with open(metrics_path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 3)
+        statuses = sorted(r['status'] for r in records)
+        self.assertEqual(statuses, ['failed', 'ok', 'ok'])
+        ok = next(r for r in records if r['status'] == 'ok')
+        self.assertEqual([s['name'] for s in ok['stages']][-1], 'save_html')
+    
+    def test_batch_skips_up_to_date_outputs(self):
+        """Test that a second run skips workbooks whose HTML is current."""
+        run_batch(self.directory, workers=2)
+        summary = run_batch(self.directory, workers=2)
+        self.assertEqual(summary['skipped'], 2)
+        self.assertEqual(summary['generated'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Atomic File - Permissions for Swapped-In Files
+==============================================
+
+The history log and the render cache write files atomically: the data
+goes to a temporary file in the same directory, which then replaces the
+target with os.replace(). tempfile.mkstemp() creates that temporary file
+readable only by its owner, and the replace keeps its mode, so without
+care every rewrite would turn a shared 0644 file private.
+
+replacement_mode() gives the mode to chmod the temporary file to first:
+the target's own mode when it exists, otherwise the usual default for a
+new file (0666 less the umask).
+
+Usage:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    ...
+    os.chmod(tmp_path, replacement_mode(path))
+    os.replace(tmp_path, path)
+"""
+
+import os
+import stat
+
+
+def _current_umask():
+    """int: The process umask (reading it means briefly setting it)."""
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: os.umask() is process-wide, so probing it while other
+# threads create files could give those files the wrong mode
+_UMASK = _current_umask()
+
+
+def replacement_mode(target):
+    """
+    Permission bits for a file about to replace another.
+
+    Args:
+        target (str or Path): File that will be replaced
+
+    Returns:
+        int: The target's permission bits, or 0666 less the umask if it
+             does not exist yet
+    """
+    try:
+        return stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
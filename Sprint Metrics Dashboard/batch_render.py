@@ -0,0 +1,419 @@
+"""
+Sprint Metrics Dashboard - Headless Batch Renderer
+==================================================
+
+Renders HTML and PNG dashboards for saved history records without opening
+the Tk window, so dashboards can be regenerated from cron jobs.
+
+Usage:
+    python batch_render.py                                  # every record
+    python batch_render.py --increment 17                   # one increment
+    python batch_render.py --from-sprint 17.2 --to-sprint 17.4 --latest
+    python batch_render.py --no-png --output-dir dashboards
+    python batch_render.py --cache-dir .render_cache       # reuse unchanged renders
+    python batch_render.py --embed-font                     # offline, deterministic fonts
+    python batch_render.py --formats png,png@2x,thumbnail,pdf # several exports per page load
+    python batch_render.py --metrics-file render_metrics.jsonl # per-stage timings per render
+    python batch_render.py --trends                         # sparklines from the history
+    python batch_render.py --forecast                       # P50/P85 completion sprints
+
+Every export format for a record is written from a single load of its
+page (see dashboard_export). A manifest (manifest.json in the output
+directory by default) lists every file written together with per-record
+timings (including how long each PNG capture waited for fonts and
+layout), any errors, and how many browser processes were reaped. The
+exit code is 1 if any record failed to render.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from browser_lifecycle import BrowserLifecycle
+from browser_pool import BrowserPool
+from dashboard_export import PNG, RENDER_READY_TIMEOUT, export_dashboard, parse_exports
+from dashboard_template import render_dashboard, template_version
+from font_embed import FONT_DIR, EmbeddedFont
+from history_store import SqliteHistoryStore, open_history_store, sprint_key
+from render_cache import RenderCache, render_key
+from render_trace import MetricsLog, RenderTrace
+from sparklines import latest_by_sprint, trend_series
+
+# Default seconds a record's browser work may take before the browser is killed
+RENDER_TIMEOUT = 120.0
+
+
+def load_records(history_file, increment=None, from_sprint=None, to_sprint=None, latest=False):
+    """
+    Read the history records matching the filters from a history file.
+
+    SQLite histories are filtered inside the database; other formats are
+    loaded in full and filtered with filter_records().
+
+    Args:
+        history_file (str or Path): sprint_history.json, its .jsonl log, or
+                                    a .db/.sqlite history database
+        increment, from_sprint, to_sprint, latest: See filter_records()
+
+    Returns:
+        list: Matching history records, most recent first
+    """
+    store = open_history_store(history_file)
+    if isinstance(store, SqliteHistoryStore):
+        try:
+            return store.query(increment=increment, from_sprint=from_sprint, to_sprint=to_sprint,
+                               latest=latest, newest_first=True)
+        finally:
+            store.close()
+
+    records = store.load()
+    records.reverse()
+    return filter_records(records, increment, from_sprint, to_sprint, latest)
+
+
+def filter_records(records, increment=None, from_sprint=None, to_sprint=None, latest=False):
+    """
+    Select the history records that should be rendered.
+
+    Args:
+        records (list): History records, most recent first
+        increment (int): Only keep records for this increment
+        from_sprint (str): Only keep sprints at or after this one
+        to_sprint (str): Only keep sprints at or before this one
+        latest (bool): Keep only the most recent snapshot of each sprint
+
+    Returns:
+        list: Matching records in their original order
+    """
+    selected = []
+    seen_sprints = set()
+    for record in records:
+        sprint = sprint_key(record['current_sprint'])
+        if increment is not None and record['increment'] != increment:
+            continue
+        if from_sprint is not None and sprint < sprint_key(from_sprint):
+            continue
+        if to_sprint is not None and sprint > sprint_key(to_sprint):
+            continue
+        if latest:
+            if sprint in seen_sprints:
+                continue
+            seen_sprints.add(sprint)
+        selected.append(record)
+    return selected
+
+
+def output_stem(record, latest=False):
+    """
+    Build the output file name (without extension) for a record.
+
+    Snapshots of the same sprint are told apart by their timestamp unless
+    only the latest snapshot per sprint is being rendered.
+    """
+    stem = f"sprint-dashboard-{record['increment']}-{record['current_sprint']}"
+    if latest:
+        return stem
+    stamp = datetime.fromisoformat(record['timestamp']).strftime('%Y%m%d-%H%M%S')
+    return f"{stem}-{stamp}"
+
+
+def render_record(record, output_dir, browser_pool=None, latest=False, cache=None,
+                  ready_timeout=RENDER_READY_TIMEOUT, font=None, exports=(PNG,), metrics_log=None,
+                  trend_index=None, forecast_cube=None):
+    """
+    Render one history record to HTML and, if a pool is given, its exports.
+
+    Args:
+        record (dict): History record to render
+        output_dir (Path): Directory to write the files into
+        browser_pool (BrowserPool): Pool used for PNG capture, or None for HTML only
+        latest (bool): Whether file names omit the snapshot timestamp
+        cache (RenderCache): Optional cache consulted before rendering
+        ready_timeout (float): Seconds to wait for fonts and layout before a capture
+        font (EmbeddedFont): Font to inline into the HTML, or None for system fonts
+        exports (list): ExportTarget objects written from one page load
+        metrics_log (MetricsLog): Receives the record's per-stage trace, if given
+        trend_index (list): sparklines.latest_by_sprint() of the history, to
+                            draw trend sparklines into the cards; None for none
+        forecast_cube (MetricsCube): History cube to forecast each card's
+                                     completion sprint from, using only the
+                                     sprints before the record's; None for none
+
+    Returns:
+        dict: Manifest entry describing the outputs, timings and status
+    """
+    inc = record['increment']
+    current = record['current_sprint']
+    sprints = [f"{inc}.{i}" for i in range(1, 7)]
+    stem = output_stem(record, latest)
+
+    entry = {
+        'increment': inc,
+        'current_sprint': current,
+        'timestamp': record.get('timestamp'),
+        'html': None,
+        'png': None,
+        'exports': {},
+        'html_seconds': None,
+        'png_seconds': None,
+        'ready_seconds': None,
+        'cached': False,
+        'status': 'ok',
+        'error': None,
+    }
+
+    trace = RenderTrace('batch', increment=inc, sprint=current, timestamp=record.get('timestamp'))
+    error = None
+    try:
+        started = time.perf_counter()
+        key = None
+        html = None
+        with trace.stage('generate_html'):
+            trends = None
+            if trend_index is not None:
+                trends = trend_series(trend_index, current, record['metrics'])
+            forecast = None
+            if forecast_cube is not None:
+                from forecast import forecast_completion
+                forecast = forecast_completion(forecast_cube, current, sprints, record['metrics'])
+            if cache is not None:
+                key = render_key(inc, current, sprints, record['metrics'],
+                                 record['sprint_range'], template_version(font), trends, forecast)
+                html = cache.get_html(key)
+            if html is None:
+                html = render_dashboard(inc, current, sprints, record['metrics'],
+                                        record['sprint_range'], font=font, trends=trends,
+                                        forecast=forecast)
+                if cache is not None:
+                    cache.put_html(key, html)
+        html_path = output_dir / f"{stem}.html"
+        with trace.stage('write_html'):
+            with open(html_path, 'w', encoding='utf-8') as f:
+                f.write(html)
+        entry['html'] = str(html_path)
+        entry['html_seconds'] = round(time.perf_counter() - started, 4)
+
+        if browser_pool is not None and exports:
+            started = time.perf_counter()
+            targets = list(exports)
+            png_path = str(output_dir / f"{stem}{PNG.suffix}")
+            if PNG in targets and cache is not None and cache.copy_png(key, png_path):
+                entry['cached'] = True
+                entry['exports'][PNG.spec] = png_path
+                targets.remove(PNG)
+            if targets:
+                acquiring = time.perf_counter()
+                with browser_pool.session() as driver:
+                    trace.add('chrome_launch', time.perf_counter() - acquiring)
+                    outputs, waited = export_dashboard(driver, str(html_path), targets,
+                                                       ready_timeout=ready_timeout, trace=trace)
+                entry['exports'].update(outputs)
+                entry['ready_seconds'] = round(waited, 4)
+                if cache is not None and PNG.spec in outputs:
+                    cache.put_png(key, outputs[PNG.spec])
+            entry['png'] = entry['exports'].get(PNG.spec)
+            entry['png_seconds'] = round(time.perf_counter() - started, 4)
+    except Exception as e:
+        error = e
+        entry['status'] = 'error'
+        entry['error'] = f"{type(e).__name__}: {e}"
+
+    if metrics_log is not None:
+        metrics_log.write(trace.finish(error))
+    return entry
+
+
+def render_batch(records, output_dir, workers=2, make_png=True, latest=False,
+                 driver_factory=None, cache=None, ready_timeout=RENDER_READY_TIMEOUT, font=None,
+                 exports=(PNG,), render_timeout=None, lifecycle=None, metrics_log=None,
+                 trend_index=None, forecast_cube=None):
+    """
+    Render many history records with a bounded pool of workers.
+
+    Each worker renders one record at a time; PNG capture shares a browser
+    pool of the same size so no more than ``workers`` Chrome sessions run.
+
+    Args:
+        records (list): History records to render
+        output_dir (str or Path): Directory to write the files into
+        workers (int): Maximum number of records rendered concurrently
+        make_png (bool): Also write the browser exports for each record
+        latest (bool): Whether file names omit the snapshot timestamp
+        driver_factory (callable): Optional driver factory for the browser pool
+        cache (RenderCache): Optional render cache shared by all workers
+        ready_timeout (float): Seconds each capture may wait for fonts and layout
+        font (EmbeddedFont): Font to inline into every dashboard, or None
+        exports (list): ExportTarget objects to write per record, PNG by default
+        render_timeout (float): Seconds a record's browser work may take before
+                                its browser is killed, or None for no limit
+        lifecycle (BrowserLifecycle): Tracker for the browser processes, so
+                                      the caller can read its counts afterwards
+        metrics_log (MetricsLog): Receives one per-stage trace per record, if given
+        trend_index (list): History index for trend sparklines, see render_record()
+        forecast_cube (MetricsCube): History cube for completion forecasts, see render_record()
+
+    Returns:
+        list: One manifest entry per record, in input order
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    browser_pool = None
+    if make_png:
+        browser_pool = BrowserPool(size=workers, driver_factory=driver_factory,
+                                   render_timeout=render_timeout, lifecycle=lifecycle)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda record: render_record(record, output_dir, browser_pool, latest, cache,
+                                             ready_timeout, font, exports, metrics_log, trend_index,
+                                             forecast_cube),
+                records
+            ))
+    finally:
+        if browser_pool is not None:
+            browser_pool.shutdown()
+
+
+def write_manifest(manifest_path, history_file, filters, entries, total_seconds, browsers=None):
+    """
+    Write the batch manifest as JSON.
+
+    Args:
+        manifest_path (str or Path): Where to write the manifest
+        history_file (str): History file the records came from
+        filters (dict): Filters that were applied
+        entries (list): Manifest entries from render_batch()
+        total_seconds (float): Wall time for the whole batch
+        browsers (dict): BrowserLifecycle.stats() after the batch, if any
+    """
+    manifest = {
+        'generated_at': datetime.now().isoformat(),
+        'history_file': str(history_file),
+        'filters': filters,
+        'rendered': sum(1 for e in entries if e['status'] == 'ok'),
+        'failed': sum(1 for e in entries if e['status'] != 'ok'),
+        'total_seconds': round(total_seconds, 4),
+        'browsers': browsers,
+        'renders': entries,
+    }
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def parse_args(argv=None):
+    """Parse command line arguments for the batch renderer."""
+    parser = argparse.ArgumentParser(
+        description="Render sprint dashboards from a history file without the GUI."
+    )
+    parser.add_argument('history_file', nargs='?', default='sprint_history.json',
+                        help="History file or its .jsonl log (default: sprint_history.json)")
+    parser.add_argument('--increment', type=int, help="Only render this increment")
+    parser.add_argument('--from-sprint', help="First sprint to render, e.g. 17.2")
+    parser.add_argument('--to-sprint', help="Last sprint to render, e.g. 17.4")
+    parser.add_argument('--latest', action='store_true',
+                        help="Only render the most recent snapshot of each sprint")
+    parser.add_argument('--output-dir', default='dashboards',
+                        help="Directory for generated files (default: dashboards)")
+    parser.add_argument('--workers', type=int, default=2,
+                        help="Number of concurrent renders (default: 2)")
+    parser.add_argument('--no-png', action='store_true', help="Only write HTML files")
+    parser.add_argument('--formats', type=parse_exports, default=PNG.spec,
+                        help="Comma-separated exports per record, from one page load: "
+                             "png, jpeg, webp (each optionally @2x etc.), thumbnail, pdf "
+                             "(default: png)")
+    parser.add_argument('--cache-dir', help="Reuse and store renders in this render cache directory")
+    parser.add_argument('--ready-timeout', type=float, default=RENDER_READY_TIMEOUT,
+                        help=f"Seconds to wait for fonts and layout before each PNG capture "
+                             f"(default: {RENDER_READY_TIMEOUT:g})")
+    parser.add_argument('--render-timeout', type=float, default=RENDER_TIMEOUT,
+                        help=f"Seconds a record's browser work may take before the browser is "
+                             f"killed (default: {RENDER_TIMEOUT:g})")
+    parser.add_argument('--embed-font', nargs='?', const=str(FONT_DIR), metavar='FONT_DIR',
+                        help="Inline a subset of the bundled font (default directory: fonts/) "
+                             "so rendering needs no network or system fonts")
+    parser.add_argument('--metrics-file',
+                        help="Append one JSON line of per-stage timings and memory per render")
+    parser.add_argument('--trends', action='store_true',
+                        help="Draw delivered and health sparklines from the history into each card")
+    parser.add_argument('--forecast', action='store_true',
+                        help="Show Monte Carlo P50/P85 completion sprints from the history in each card "
+                             "(requires NumPy)")
+    parser.add_argument('--manifest', help="Manifest path (default: <output-dir>/manifest.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Returns:
+        int: Process exit code (0 if every record rendered, 1 otherwise)
+    """
+    args = parse_args(argv)
+    filters = {
+        'increment': args.increment,
+        'from_sprint': args.from_sprint,
+        'to_sprint': args.to_sprint,
+        'latest': args.latest,
+    }
+
+    records = load_records(args.history_file, **filters)
+
+    cache = RenderCache(args.cache_dir) if args.cache_dir else None
+    font = None
+    if args.embed_font:
+        try:
+            font = EmbeddedFont.from_directory(args.embed_font)
+        except FileNotFoundError as e:
+            print(f"Cannot embed font: {e}. See fonts/README.md.", file=sys.stderr)
+            return 1
+    lifecycle = BrowserLifecycle()
+    metrics_log = MetricsLog(args.metrics_file) if args.metrics_file else None
+    trend_index = None
+    forecast_cube = None
+    if args.trends or args.forecast:
+        # Trends and forecasts draw on the whole history, not just the filtered records
+        store = open_history_store(args.history_file)
+        try:
+            history = store.load()
+        finally:
+            if isinstance(store, SqliteHistoryStore):
+                store.close()
+        if args.trends:
+            trend_index = latest_by_sprint(history)
+        if args.forecast:
+            from metrics_cube import MetricsCube
+            forecast_cube = MetricsCube.from_records(history)
+
+    started = time.perf_counter()
+    entries = render_batch(records, args.output_dir, workers=max(1, args.workers),
+                           make_png=not args.no_png, latest=args.latest, cache=cache,
+                           ready_timeout=args.ready_timeout, font=font, exports=args.formats,
+                           render_timeout=args.render_timeout, lifecycle=lifecycle,
+                           metrics_log=metrics_log, trend_index=trend_index,
+                           forecast_cube=forecast_cube)
+    total_seconds = time.perf_counter() - started
+
+    manifest_path = args.manifest or os.path.join(args.output_dir, 'manifest.json')
+    write_manifest(manifest_path, args.history_file, filters, entries, total_seconds,
+                   browsers=lifecycle.stats())
+
+    failed = [e for e in entries if e['status'] != 'ok']
+    print(f"Rendered {len(entries) - len(failed)}/{len(entries)} dashboards "
+          f"in {total_seconds:.2f}s. Manifest: {manifest_path}")
+    for entry in failed:
+        print(f"  FAILED {entry['current_sprint']} ({entry['timestamp']}): {entry['error']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--test':
+        import unittest
+        unittest.main(module='test_batch_render', argv=[sys.argv[0]])
+    sys.exit(main())
@@ -0,0 +1,302 @@
+"""
+Render Benchmark - Baselines and Regression Report
+==================================================
+
+Times the rendering paths on synthetic sprint histories of 10 to 10,000
+records, saves the timings as a baseline and compares later runs against
+it, flagging every case that got slower than the threshold.
+
+Cases (N = history records):
+    generate_html/N     render_dashboard() for every record
+    load_history/N      load_records() on a JSONL history, latest per sprint
+    screenshot/N        render_batch() writing HTML, PNG and PDF per record
+                        through a fake driver, so no Chrome is needed; this
+                        times everything around the browser (pool, process
+                        tracking, export writing), not Chrome itself
+
+Usage:
+    python bench_render.py                                   # print timings
+    python bench_render.py --save-baseline bench_baseline.json
+    python bench_render.py --baseline bench_baseline.json    # compare
+    python bench_render.py --records 10 1000 --repeat 5 --threshold 0.25 --report report.json
+
+Exit code 1 means at least one case regressed against the baseline.
+"""
+
+import argparse
+import base64
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from batch_render import load_records, render_batch
+from browser_lifecycle import BrowserLifecycle
+from dashboard_export import parse_exports
+from dashboard_template import CATEGORIES, render_dashboard
+from history_store import open_history_store
+
+
+DEFAULT_RECORDS = [10, 100, 1000, 10000]
+
+# The screenshot case writes two files per record, so it stops at this size
+# unless --max-screenshot says otherwise
+MAX_SCREENSHOT_RECORDS = 1000
+
+# A case regresses when it is this fraction slower than its baseline...
+DEFAULT_THRESHOLD = 0.20
+
+# ...and also at least this many milliseconds slower, so timer noise on
+# fast cases is not reported
+MIN_REGRESSION_MS = 1.0
+
+# Smallest valid PNG (1x1 transparent pixel), returned by the fake driver
+_PIXEL_PNG = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=='
+)
+
+
+# === SYNTHETIC INPUTS ===
+
+class FakeDriver:
+    """WebDriver stand-in whose page settles at once and whose captures are one pixel."""
+
+    def get(self, url):
+        pass
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, script, *args):
+        return 800
+
+    def execute_script(self, script, *args):
+        return [20, 20, 1360, 800]
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {'data': base64.b64encode(_PIXEL_PNG).decode('ascii')}
+
+    def set_window_size(self, width, height):
+        pass
+
+    def quit(self):
+        pass
+
+
+def make_history(count, seed=17):
+    """
+    Build a synthetic sprint history.
+
+    Records walk forward through increments of six sprints, with several
+    snapshots per sprint and random but plausible metric values.
+
+    Args:
+        count (int): Number of records
+        seed (int): Random seed, so every run renders the same data
+
+    Returns:
+        list: History records, oldest first
+    """
+    rng = random.Random(seed)
+    started = datetime(2025, 1, 6, 9, 0)
+    records = []
+    for n in range(count):
+        sprint_index = n // 3
+        increment, sprint = 1 + sprint_index // 6, 1 + sprint_index % 6
+        records.append({
+            'increment': increment,
+            'current_sprint': f"{increment}.{sprint}",
+            'sprint_range': f"{increment}.1 - {increment}.{sprint}",
+            'metrics': {
+                key: {'delivered': rng.randint(0, 20), 'total': rng.randint(20, 160),
+                      'health': round(rng.uniform(2.5, 4.5), 2)}
+                for key, _, _ in CATEGORIES
+            },
+            'timestamp': (started + timedelta(hours=n)).isoformat(),
+        })
+    return records
+
+
+# === CASES ===
+
+def _generate_all(records):
+    """Render the HTML of every record, as a full regeneration would."""
+    for record in records:
+        inc = record['increment']
+        sprints = [f"{inc}.{i}" for i in range(1, 7)]
+        render_dashboard(inc, record['current_sprint'], sprints, record['metrics'],
+                         record['sprint_range'])
+
+
+def measure(func, repeat):
+    """
+    Run a case several times.
+
+    Returns:
+        dict: Fastest and median run in milliseconds
+    """
+    timings = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {'best_ms': round(min(timings), 4), 'median_ms': round(statistics.median(timings), 4)}
+
+
+def run_cases(sizes, repeat, max_screenshot=MAX_SCREENSHOT_RECORDS):
+    """
+    Time every case at every history size.
+
+    Args:
+        sizes (list): History record counts
+        repeat (int): Runs per measurement
+        max_screenshot (int): Largest size the screenshot case runs at
+
+    Returns:
+        dict: {"case/N": {'best_ms': ..., 'median_ms': ...}} in run order
+    """
+    exports = parse_exports('png,pdf')
+    results = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        scratch = Path(scratch)
+        for size in sizes:
+            records = make_history(size)
+            history_file = scratch / f"history-{size}.jsonl"
+            open_history_store(history_file).rewrite([dict(record) for record in records])
+
+            cases = {
+                'generate_html': lambda: _generate_all(records),
+                'load_history': lambda: load_records(history_file, latest=True),
+            }
+            if size <= max_screenshot:
+                cases['screenshot'] = lambda: render_batch(
+                    records, scratch / f"out-{size}", workers=2, driver_factory=FakeDriver,
+                    exports=exports, lifecycle=BrowserLifecycle(registry_dir=None))
+
+            for name, func in cases.items():
+                func()  # warm up the compiled template and the file cache
+                results[f"{name}/{size}"] = measure(func, repeat)
+    return results
+
+
+# === BASELINES AND REPORT ===
+
+def environment():
+    """dict: Host description saved with baselines and reports."""
+    return {'python': platform.python_version(), 'machine': platform.machine(),
+            'platform': platform.platform()}
+
+
+def save_baseline(path, results, repeat):
+    """Write a run's results as the baseline for later comparisons."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'created': datetime.now().isoformat(timespec='seconds'),
+                   'environment': environment(), 'repeat': repeat, 'results': results}, f, indent=2)
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare a run against a baseline.
+
+    A case is a REGRESSION when its best time is more than ``threshold``
+    slower and at least MIN_REGRESSION_MS slower; it is "faster" when it
+    improved by more than ``threshold``.
+
+    Args:
+        results (dict): Output of run_cases()
+        baseline (dict): The 'results' of a saved baseline
+        threshold (float): Allowed slowdown as a fraction, e.g. 0.2
+
+    Returns:
+        list: One row per case with 'case', 'baseline_ms', 'current_ms',
+              'change' and 'status' (ok, faster, REGRESSION or new)
+    """
+    rows = []
+    for case, current in results.items():
+        row = {'case': case, 'baseline_ms': None, 'current_ms': current['best_ms'],
+               'change': None, 'status': 'new'}
+        previous = baseline.get(case)
+        if previous is not None:
+            before, after = previous['best_ms'], current['best_ms']
+            row['baseline_ms'] = before
+            row['change'] = round(after / before - 1, 4) if before else None
+            if after > before * (1 + threshold) and after - before >= MIN_REGRESSION_MS:
+                row['status'] = 'REGRESSION'
+            elif after < before * (1 - threshold):
+                row['status'] = 'faster'
+            else:
+                row['status'] = 'ok'
+        rows.append(row)
+    return rows
+
+
+def print_results(results):
+    """Print the timings of a run that has no baseline to compare with."""
+    print(f"{'case':<22} {'best (ms)':>10} {'median (ms)':>12}")
+    for case, result in results.items():
+        print(f"{case:<22} {result['best_ms']:>10.2f} {result['median_ms']:>12.2f}")
+
+
+def print_comparison(rows):
+    """Print the comparison report table."""
+    print(f"{'case':<22} {'baseline (ms)':>14} {'current (ms)':>13} {'change':>8}  status")
+    for row in rows:
+        baseline = f"{row['baseline_ms']:.2f}" if row['baseline_ms'] is not None else '-'
+        change = f"{row['change']:+.0%}" if row['change'] is not None else '-'
+        print(f"{row['case']:<22} {baseline:>14} {row['current_ms']:>13.2f} {change:>8}  {row['status']}")
+
+
+def main(argv=None):
+    """
+    Run the suite and print timings or a comparison report.
+
+    Returns:
+        int: 1 if any case regressed against the baseline, 0 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Benchmark dashboard rendering against a saved baseline.")
+    parser.add_argument('--records', type=int, nargs='+', default=DEFAULT_RECORDS,
+                        help="History sizes to benchmark")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per measurement")
+    parser.add_argument('--max-screenshot', type=int, default=MAX_SCREENSHOT_RECORDS,
+                        help="Largest history size the screenshot case runs at")
+    parser.add_argument('--baseline', metavar='FILE', help="Compare against a saved baseline")
+    parser.add_argument('--save-baseline', metavar='FILE', help="Save this run as the baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Fraction slower than the baseline that counts as a regression")
+    parser.add_argument('--report', metavar='FILE', help="Write the comparison report as JSON")
+    args = parser.parse_args(argv)
+
+    results = run_cases(args.records, args.repeat, args.max_screenshot)
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results, args.repeat)
+
+    if not args.baseline:
+        print_results(results)
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline['results'], args.threshold)
+    print(f"baseline {args.baseline} ({baseline.get('created', 'unknown date')}), "
+          f"threshold {args.threshold:.0%}")
+    print_comparison(rows)
+
+    regressions = [row['case'] for row in rows if row['status'] == 'REGRESSION']
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'baseline': args.baseline, 'threshold': args.threshold,
+                       'environment': environment(), 'rows': rows,
+                       'regressions': regressions}, f, indent=2)
+    if regressions:
+        print(f"FAIL: {len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
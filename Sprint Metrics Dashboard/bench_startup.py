@@ -0,0 +1,96 @@
+"""
+Start-up Benchmark - Import Time Budget
+=======================================
+
+Imports each entry-point module in a fresh interpreter, records the best
+of several import times and fails if any module is over its budget or
+pulls in a dependency that should only load on first use (Selenium,
+NumPy, the unit test framework).
+
+Usage:
+    python bench_startup.py                 # check against the budgets below
+    python bench_startup.py --repeat 10     # more runs per module
+    python bench_startup.py --scale 2       # double every budget (slow CI hosts)
+
+Exit code 1 means a budget was exceeded or a lazy dependency was imported.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+# Import budgets in milliseconds, measured inside the child interpreter so
+# Python's own start-up is not counted
+BUDGETS_MS = {
+    'sprint_metrics_app': 80,
+    'sprint_metrics_python': 80,
+    'batch_render': 100,
+}
+
+# Modules that must not be loaded just by importing an entry point
+LAZY_MODULES = ('selenium', 'unittest', 'numpy')
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {lazy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module, lazy_modules=LAZY_MODULES):
+    """
+    Import a module in a new interpreter.
+
+    Args:
+        module (str): Module name to import
+        lazy_modules (tuple): Modules to report if the import loaded them
+
+    Returns:
+        dict: 'seconds' spent importing and the 'loaded' lazy modules
+    """
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module, lazy=tuple(lazy_modules))],
+        cwd=Path(__file__).resolve().parent,
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main(argv=None):
+    """
+    Measure every entry point and print a budget table.
+
+    Returns:
+        int: 0 if every module is within budget, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Check import times against their budgets.")
+    parser.add_argument('--repeat', type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument('--scale', type=float, default=1.0, help="Multiply every budget by this factor")
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f"{'module':<24} {'best (ms)':>10} {'budget (ms)':>12}  status")
+    for module, budget in BUDGETS_MS.items():
+        runs = [measure_import(module) for _ in range(max(1, args.repeat))]
+        best_ms = min(run['seconds'] for run in runs) * 1000
+        limit_ms = budget * args.scale
+        loaded = sorted({name for run in runs for name in run['loaded']})
+
+        status = 'ok'
+        if best_ms > limit_ms:
+            status = 'OVER BUDGET'
+        if loaded:
+            status = f"loaded {', '.join(loaded)}"
+        failed = failed or status != 'ok'
+        print(f"{module:<24} {best_ms:>10.1f} {limit_ms:>12.0f}  {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
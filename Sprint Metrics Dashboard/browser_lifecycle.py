@@ -0,0 +1,423 @@
+"""
+Browser Lifecycle - Tracking and Reaping Chrome Processes
+=========================================================
+
+Every headless Chrome render starts a chromedriver process, which starts
+Chrome and its helper processes. If a render hangs, or the application
+dies before quitting its sessions, those processes are left behind and
+keep their memory. On a shared render host they accumulate.
+
+BrowserLifecycle tracks the process tree behind every driver it is told
+about and guarantees that it goes away:
+
+    - ``terminate()`` quits a driver, and kills whatever is left of its
+      process tree if quit fails or takes longer than ``quit_timeout``
+    - ``deadline()`` kills a driver's processes if a render runs past its
+      time limit, which makes the blocked Selenium call fail instead of
+      hanging forever
+    - The PIDs are recorded in a per-user registry directory (one file per
+      tracker, named after the owning process), so a later start can reap
+      browsers left behind by a run that crashed; ``reap_orphans()`` does
+      this, and ``shutdown()`` kills anything still tracked when the
+      application exits
+    - ``stats()`` reports live and reaped counts
+
+Process trees are read with psutil when it is installed, otherwise from
+/proc on Linux. Elsewhere only the chromedriver process itself is tracked.
+
+Usage:
+    lifecycle = BrowserLifecycle()
+    lifecycle.reap_orphans()
+    driver = lifecycle.register(create_chrome_driver())
+    with lifecycle.deadline(driver, 60):
+        driver.get(...)
+    lifecycle.terminate(driver)
+"""
+
+import atexit
+import getpass
+import json
+import os
+import signal
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# Shared by every process of the current user, so orphans of any earlier run
+# are found; other users' runs keep their own (created with REGISTRY_MODE)
+REGISTRY_DIR = Path(tempfile.gettempdir()) / (
+    f"sprint-dashboard-browsers-{os.getuid() if hasattr(os, 'getuid') else getpass.getuser()}"
+)
+REGISTRY_MODE = 0o700
+
+# Seconds driver.quit() may take before the processes are killed instead
+QUIT_TIMEOUT = 10.0
+
+KILL_SIGNAL = getattr(signal, 'SIGKILL', signal.SIGTERM)
+
+
+# === PROCESS HELPERS ===
+
+def _psutil():
+    """Return the psutil module, or None if it is not installed."""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil
+
+
+def process_start_time(pid):
+    """
+    Identify a process instance, so a recycled PID is never mistaken for it.
+
+    Returns:
+        float or None: Start time in platform units, or None if the process
+                       does not exist or the platform cannot tell
+    """
+    psutil = _psutil()
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).create_time()
+        except psutil.Error:
+            return None
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            # Field 22 (starttime); the command name in field 2 may contain spaces
+            return float(f.read().rsplit(')', 1)[1].split()[19])
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def child_pids(pid):
+    """
+    List every descendant of a process.
+
+    Returns:
+        list: PIDs of children, grandchildren and so on
+    """
+    psutil = _psutil()
+    if psutil is not None:
+        try:
+            return [child.pid for child in psutil.Process(pid).children(recursive=True)]
+        except psutil.Error:
+            return []
+
+    parents = {}
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                parents[int(entry)] = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+
+    found = []
+    frontier = [pid]
+    while frontier:
+        parent = frontier.pop()
+        children = [p for p, pp in parents.items() if pp == parent]
+        found.extend(children)
+        frontier.extend(children)
+    return found
+
+
+def kill_process(pid, start_time=None):
+    """
+    Kill a process if it is still the one that was recorded.
+
+    Args:
+        pid (int): Process id
+        start_time (float): Start time recorded with the PID, if known
+
+    Returns:
+        bool: True if a signal was delivered
+    """
+    if start_time is not None and process_start_time(pid) != start_time:
+        # Already gone, or the PID now belongs to another process
+        return False
+    try:
+        os.kill(pid, KILL_SIGNAL)
+    except OSError:
+        return False
+    return True
+
+
+def driver_pid(driver):
+    """int or None: PID of the chromedriver process behind a Selenium driver."""
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    return getattr(process, 'pid', None)
+
+
+def _owned_by_current_user(path):
+    """bool: True if a registry file belongs to this user (always, without POSIX owners)."""
+    if not hasattr(os, 'getuid'):
+        return True
+    try:
+        return path.stat().st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def _owner_alive(pid):
+    """bool: True if the process that wrote a registry file still runs."""
+    if pid == os.getpid():
+        return True
+    psutil = _psutil()
+    if psutil is not None:
+        return psutil.pid_exists(pid)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists but belongs to another user
+        return True
+    return True
+
+
+# === LIFECYCLE MANAGER ===
+
+class BrowserLifecycle:
+    """
+    Tracks the processes behind browser sessions and reaps leftovers.
+
+    Attributes:
+        registry_dir: Directory holding one PID file per tracker
+        quit_timeout: Seconds to wait for driver.quit() before killing
+    """
+
+    def __init__(self, registry_dir=REGISTRY_DIR, quit_timeout=QUIT_TIMEOUT):
+        """
+        Initialize an empty tracker.
+
+        Args:
+            registry_dir (str or Path): Where PID files are kept, or None to
+                                        track in memory only (no orphan reaping)
+            quit_timeout (float): Seconds driver.quit() may take
+        """
+        self.registry_dir = Path(registry_dir) if registry_dir is not None else None
+        self.quit_timeout = quit_timeout
+
+        self._lock = threading.Lock()
+        self._drivers = {}       # id(driver) -> {pid: start_time}
+        self._reaped = 0         # Processes killed by this tracker
+        self._orphans = 0        # ... of which were left by earlier runs
+        self._timed_out = 0      # Renders stopped by a deadline
+
+        atexit.register(self.shutdown)
+
+    @property
+    def live_count(self):
+        """int: Browser sessions currently tracked."""
+        with self._lock:
+            return len(self._drivers)
+
+    @property
+    def reaped_count(self):
+        """int: Processes killed, including orphans of earlier runs."""
+        with self._lock:
+            return self._reaped
+
+    def stats(self):
+        """
+        Summarize what the tracker has seen.
+
+        Returns:
+            dict: 'live' sessions, 'processes' tracked, 'reaped' processes,
+                  'orphans_reaped' from earlier runs, renders 'timed_out'
+        """
+        with self._lock:
+            return {
+                'live': len(self._drivers),
+                'processes': sum(len(pids) for pids in self._drivers.values()),
+                'reaped': self._reaped,
+                'orphans_reaped': self._orphans,
+                'timed_out': self._timed_out,
+            }
+
+    def register(self, driver):
+        """
+        Start tracking the process tree of a freshly started driver.
+
+        Args:
+            driver: Selenium driver (or stand-in without a service process)
+
+        Returns:
+            The same driver, for chaining with the factory call
+        """
+        pids = self._snapshot(driver_pid(driver))
+        with self._lock:
+            self._drivers[id(driver)] = pids
+            self._save_registry()
+        return driver
+
+    def terminate(self, driver):
+        """
+        Quit a driver and make sure none of its processes survive.
+
+        driver.quit() runs on a helper thread; if it raises or is still
+        running after ``quit_timeout``, the tracked processes are killed.
+
+        Args:
+            driver: Driver previously passed to register()
+        """
+        quitter = threading.Thread(target=self._quit_quietly, args=(driver,), daemon=True)
+        quitter.start()
+        quitter.join(self.quit_timeout)
+        self.kill(driver)
+        with self._lock:
+            self._drivers.pop(id(driver), None)
+            self._save_registry()
+
+    def kill(self, driver):
+        """
+        Kill every process still alive in a driver's tree.
+
+        The driver stays tracked until terminate() is called for it.
+
+        Returns:
+            int: Number of processes killed
+        """
+        with self._lock:
+            pids = dict(self._drivers.get(id(driver), {}))
+        # Chrome may have started more helpers since the driver was registered
+        root = driver_pid(driver)
+        if root is not None:
+            for pid, start in self._snapshot(root).items():
+                pids.setdefault(pid, start)
+        killed = sum(1 for pid, start in pids.items() if kill_process(pid, start))
+        with self._lock:
+            self._reaped += killed
+        return killed
+
+    @contextmanager
+    def deadline(self, driver, seconds):
+        """
+        Kill a driver's processes if the enclosed render runs too long.
+
+        Killing the browser makes the blocked Selenium call raise, so the
+        render fails instead of hanging. The caller should then discard
+        the driver.
+
+        Args:
+            driver: Driver used inside the block
+            seconds (float): Time limit, or None for no limit
+
+        Raises:
+            TimeoutError: If the block failed after its time limit expired
+        """
+        if not seconds:
+            yield
+            return
+
+        expired = threading.Event()
+
+        def expire():
+            expired.set()
+            with self._lock:
+                self._timed_out += 1
+            self.kill(driver)
+
+        timer = threading.Timer(seconds, expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            yield
+        except Exception as e:
+            if expired.is_set():
+                raise TimeoutError(f"Render exceeded {seconds}s; browser was killed") from e
+            raise
+        finally:
+            timer.cancel()
+
+    def reap_orphans(self):
+        """
+        Kill browsers recorded by processes that are no longer running.
+
+        Registry files owned by another user are ignored, so nobody can
+        have this process kill PIDs by planting a file.
+
+        Returns:
+            int: Number of orphaned processes killed
+        """
+        if self.registry_dir is None or not self.registry_dir.is_dir():
+            return 0
+        killed = 0
+        for path in self.registry_dir.glob('*.json'):
+            try:
+                owner = int(path.stem.split('-')[0])
+            except ValueError:
+                continue
+            if not _owned_by_current_user(path) or _owner_alive(owner):
+                continue
+            try:
+                recorded = json.loads(path.read_text())
+            except (OSError, ValueError):
+                recorded = {}
+            # Without a recorded start time a recycled PID cannot be told apart
+            killed += sum(1 for pid, start in recorded.items()
+                          if start is not None and kill_process(int(pid), start))
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        with self._lock:
+            self._reaped += killed
+            self._orphans += killed
+        return killed
+
+    def shutdown(self):
+        """Kill every process still tracked and remove this process's registry file."""
+        atexit.unregister(self.shutdown)
+        with self._lock:
+            pids = {}
+            for tracked in self._drivers.values():
+                pids.update(tracked)
+            self._drivers.clear()
+        killed = sum(1 for pid, start in pids.items() if kill_process(pid, start))
+        with self._lock:
+            self._reaped += killed
+            self._save_registry()
+
+    def _snapshot(self, root):
+        """Map a process and its descendants to their start times."""
+        if root is None:
+            return {}
+        pids = {}
+        for pid in [root] + child_pids(root):
+            pids[pid] = process_start_time(pid)
+        return pids
+
+    def _quit_quietly(self, driver):
+        """Ask the driver to quit; failures are handled by killing its processes."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _save_registry(self):
+        """Write this process's tracked PIDs. Caller must hold the lock."""
+        if self.registry_dir is None:
+            return
+        path = self.registry_dir / f"{os.getpid()}-{id(self)}.json"
+        pids = {str(pid): start for tracked in self._drivers.values() for pid, start in tracked.items()}
+        try:
+            if not pids:
+                if path.exists():
+                    path.unlink()
+                return
+            self.registry_dir.mkdir(mode=REGISTRY_MODE, parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(pids))
+            os.replace(tmp_path, path)
+        except OSError:
+            # The registry only helps later runs; never fail a render over it
+            pass
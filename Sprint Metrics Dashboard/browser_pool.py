@@ -0,0 +1,223 @@
+"""
+Browser Pool - Warm Headless Chrome Sessions
+============================================
+
+Keeps a small number of headless Chrome sessions alive between renders so
+that PNG generation only pays the Chrome cold-start cost once per session
+instead of once per click.
+
+Features:
+    - Lazily starts up to ``size`` concurrent Chrome sessions
+    - Health-checks a session before handing it out and replaces dead ones
+    - Recycles a session after ``max_renders`` renders to cap memory growth
+    - Kills a session's browser if a render exceeds ``render_timeout``
+    - Tracks every browser process it starts and reaps browsers left behind
+      by crashed runs (see browser_lifecycle)
+    - Shuts every session down cleanly on interpreter exit
+
+Usage:
+    pool = BrowserPool(size=2)
+    with pool.session() as driver:
+        driver.get("file:///path/to/dashboard.html")
+        ...
+    pool.shutdown()
+"""
+
+import atexit
+import threading
+from contextlib import contextmanager
+
+from browser_lifecycle import BrowserLifecycle
+
+
+def create_chrome_driver():
+    """
+    Start a new headless Chrome session.
+
+    Selenium is imported here rather than at module level so that importing
+    the pool (and the app that uses it) does not pay for loading it.
+
+    Returns:
+        webdriver.Chrome: A ready-to-use headless Chrome driver
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--disable-gpu')
+    return webdriver.Chrome(options=options)
+
+
+class BrowserPool:
+    """
+    Thread-safe pool of reusable headless Chrome sessions.
+
+    Attributes:
+        size: Maximum number of sessions alive at the same time
+        max_renders: Number of renders after which a session is recycled
+        acquire_timeout: Seconds to wait for a free session before giving up
+        render_timeout: Seconds a session() block may run before its
+                        browser is killed, or None for no limit
+        lifecycle: BrowserLifecycle tracking the pool's browser processes
+    """
+
+    def __init__(self, size=2, max_renders=50, acquire_timeout=60, driver_factory=None,
+                 render_timeout=None, lifecycle=None):
+        """
+        Initialize an empty pool. No browser is started until first use,
+        but browsers left behind by crashed runs are reaped straight away.
+
+        Args:
+            size (int): Maximum number of concurrent sessions
+            max_renders (int): Renders served by a session before it is replaced
+            acquire_timeout (float): Seconds to wait for a free session
+            driver_factory (callable): Returns a new driver; defaults to headless Chrome
+            render_timeout (float): Per-render time limit in seconds, or None
+            lifecycle (BrowserLifecycle): Process tracker; a new one by default
+        """
+        self.size = size
+        self.max_renders = max_renders
+        self.acquire_timeout = acquire_timeout
+        self.render_timeout = render_timeout
+        self.lifecycle = lifecycle or BrowserLifecycle()
+        self.lifecycle.reap_orphans()
+        self._driver_factory = driver_factory or create_chrome_driver
+
+        self._lock = threading.Condition()
+        self._idle = []           # Warm sessions waiting to be handed out
+        self._render_counts = {}  # id(driver) -> renders served so far
+        self._live = 0            # Sessions started and not yet quit
+        self._closed = False
+
+        atexit.register(self.shutdown)
+
+    @property
+    def live_sessions(self):
+        """int: Number of browser sessions currently running."""
+        with self._lock:
+            return self._live
+
+    def acquire(self):
+        """
+        Take a healthy session from the pool, starting one if allowed.
+
+        Returns:
+            The driver, which must be handed back with release()
+
+        Raises:
+            RuntimeError: If the pool is shut down
+            TimeoutError: If no session became free within acquire_timeout
+        """
+        dead = []
+        try:
+            with self._lock:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Browser pool has been shut down")
+
+                    if self._idle:
+                        driver = self._idle.pop()
+                        if self._is_healthy(driver):
+                            return driver
+                        # Dead session - forget it and loop to get another
+                        self._forget(driver)
+                        dead.append(driver)
+                        continue
+
+                    if self._live < self.size:
+                        self._live += 1
+                        break
+
+                    if not self._lock.wait(timeout=self.acquire_timeout):
+                        raise TimeoutError("Timed out waiting for a free browser session")
+        finally:
+            # Quitting can take up to the quit timeout; never hold the lock for it
+            for driver in dead:
+                self.lifecycle.terminate(driver)
+
+        # Start the browser outside the lock so other renders are not blocked
+        try:
+            driver = self.lifecycle.register(self._driver_factory())
+        except Exception:
+            with self._lock:
+                self._live -= 1
+                self._lock.notify()
+            raise
+
+        with self._lock:
+            self._render_counts[id(driver)] = 0
+        return driver
+
+    def release(self, driver, broken=False):
+        """
+        Return a session to the pool after a render.
+
+        Args:
+            driver: Driver previously obtained from acquire()
+            broken (bool): True if the render failed and the session
+                           should not be reused
+        """
+        with self._lock:
+            self._render_counts[id(driver)] = self._render_counts.get(id(driver), 0) + 1
+            recycle = (
+                broken
+                or self._closed
+                or self._render_counts[id(driver)] >= self.max_renders
+            )
+            if recycle:
+                self._forget(driver)
+            else:
+                self._idle.append(driver)
+            self._lock.notify()
+        if recycle:
+            self.lifecycle.terminate(driver)
+
+    @contextmanager
+    def session(self):
+        """
+        Context manager that acquires a session and always releases it.
+
+        A session that raised during the render is recycled rather than
+        returned to the pool, since its page state is unknown. A render
+        running past ``render_timeout`` has its browser killed and raises
+        TimeoutError.
+        """
+        driver = self.acquire()
+        try:
+            with self.lifecycle.deadline(driver, self.render_timeout):
+                yield driver
+        except BaseException:
+            self.release(driver, broken=True)
+            raise
+        self.release(driver)
+
+    def shutdown(self):
+        """Quit every idle session and refuse further acquisitions."""
+        atexit.unregister(self.shutdown)
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for driver in idle:
+                self._forget(driver)
+            self._lock.notify_all()
+        for driver in idle:
+            self.lifecycle.terminate(driver)
+
+    def _is_healthy(self, driver):
+        """Check that a pooled session still responds to commands."""
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _forget(self, driver):
+        """
+        Drop a session from the pool's bookkeeping. Caller must hold the lock.
+
+        The caller then passes the driver to lifecycle.terminate() after
+        releasing the lock, so a hung quit never blocks other renders.
+        """
+        self._render_counts.pop(id(driver), None)
+        self._live -= 1
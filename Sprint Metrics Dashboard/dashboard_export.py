@@ -0,0 +1,286 @@
+"""
+Dashboard Export - Every Format From One Page Load
+==================================================
+
+Loads a generated dashboard into a browser session once, waits for it to
+settle, and then writes every requested output from that same page:
+PNG, JPEG and WebP images at any scale factor, a small thumbnail and a
+print-to-PDF copy. Images and the PDF are produced with the Chrome
+DevTools commands Page.captureScreenshot and Page.printToPDF, so adding
+a format costs one capture rather than another Chrome launch and page
+load.
+
+Export specs:
+    png             full-size PNG                       <stem>.png
+    png@2x          PNG at twice the pixel density      <stem>@2x.png
+    jpeg, webp      compressed images (also @Nx)        <stem>.jpg, <stem>.webp
+    thumbnail       THUMBNAIL_WIDTH pixels wide JPEG    <stem>-thumb.jpg
+    pdf             single-page PDF of the dashboard    <stem>.pdf
+
+Usage:
+    targets = parse_exports("png,png@2x,thumbnail,pdf")
+    with pool.session() as driver:
+        outputs, waited = export_dashboard(driver, "dashboard.html", targets)
+"""
+
+import base64
+import os
+import time
+
+from render_trace import stage
+
+
+# Seconds a render may take to load its fonts and settle its layout before
+# the screenshot is abandoned
+RENDER_READY_TIMEOUT = 10.0
+
+# Resolves once web fonts have loaded and the dashboard container has kept
+# the same height for a number of consecutive animation frames. Called
+# through execute_async_script, so the last argument is the completion
+# callback; it receives the settled container height.
+RENDER_READY_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const stableFrames = arguments[0];
+const fontsReady = document.fonts ? document.fonts.ready : Promise.resolve();
+fontsReady.then(() => {
+    let lastHeight = -1;
+    let stable = 0;
+    const check = () => {
+        const container = document.querySelector('.container');
+        const height = container ? container.scrollHeight : 0;
+        const settled = document.readyState === 'complete' && height > 0 && height === lastHeight;
+        stable = settled ? stable + 1 : 0;
+        lastHeight = height;
+        if (stable >= stableFrames) {
+            done(height);
+        } else {
+            requestAnimationFrame(check);
+        }
+    };
+    requestAnimationFrame(check);
+});
+"""
+
+# Page coordinates of the dashboard container: [x, y, width, height]
+CONTAINER_RECT_SCRIPT = """
+const rect = document.querySelector('.container').getBoundingClientRect();
+return [rect.left + window.scrollX, rect.top + window.scrollY, rect.width, rect.height];
+"""
+
+# Browser window width the dashboard is laid out at
+WINDOW_WIDTH = 1400
+
+# Width in pixels of the thumbnail export
+THUMBNAIL_WIDTH = 320
+
+# Compression quality (0-100) for lossy image formats
+IMAGE_QUALITY = {'jpeg': 85, 'webp': 80}
+
+# Export kind -> (screenshot format, file suffix); pdf is printed instead
+EXPORT_KINDS = {
+    'png': ('png', '.png'),
+    'jpeg': ('jpeg', '.jpg'),
+    'webp': ('webp', '.webp'),
+    'thumbnail': ('jpeg', '-thumb.jpg'),
+    'pdf': (None, '.pdf'),
+}
+
+# CSS pixels per inch, used to size the PDF page to the dashboard
+CSS_DPI = 96
+
+
+class ExportTarget:
+    """
+    One output file to produce from a loaded dashboard.
+
+    Attributes:
+        kind: One of EXPORT_KINDS
+        scale: Pixel density multiplier for png, jpeg and webp
+    """
+
+    def __init__(self, kind, scale=1.0):
+        """
+        Initialize an export target.
+
+        Args:
+            kind (str): Output kind, see EXPORT_KINDS
+            scale (float): Pixel density multiplier (ignored for pdf and thumbnail)
+
+        Raises:
+            ValueError: If the kind is unknown or the scale is not positive
+        """
+        if kind not in EXPORT_KINDS:
+            raise ValueError(f"Unknown export format '{kind}' (choose from {', '.join(EXPORT_KINDS)})")
+        if scale <= 0:
+            raise ValueError(f"Export scale must be positive, got {scale}")
+        self.kind = kind
+        self.scale = 1.0 if kind in ('pdf', 'thumbnail') else float(scale)
+
+    @classmethod
+    def parse(cls, spec):
+        """
+        Build a target from a spec such as "png", "jpeg@2x" or "webp@0.5x".
+
+        Args:
+            spec (str): Export kind, optionally followed by @<scale>x
+
+        Returns:
+            ExportTarget: The parsed target
+
+        Raises:
+            ValueError: If the spec is not understood
+        """
+        kind, _, scale = spec.strip().lower().partition('@')
+        if kind == 'jpg':
+            kind = 'jpeg'
+        if not scale:
+            return cls(kind)
+        try:
+            return cls(kind, float(scale.rstrip('x')))
+        except ValueError as e:
+            raise ValueError(f"Invalid export spec '{spec}': {e}") from e
+
+    @property
+    def spec(self):
+        """str: Canonical spec, e.g. "png@2x"; used as the key for its output path."""
+        return self.kind if self.scale == 1 else f"{self.kind}@{self.scale:g}x"
+
+    @property
+    def suffix(self):
+        """str: File name suffix appended to the output stem."""
+        suffix = EXPORT_KINDS[self.kind][1]
+        return suffix if self.scale == 1 else f"@{self.scale:g}x{suffix}"
+
+    def __eq__(self, other):
+        return isinstance(other, ExportTarget) and self.spec == other.spec
+
+    def __hash__(self):
+        return hash(self.spec)
+
+    def __repr__(self):
+        return f"ExportTarget({self.spec!r})"
+
+
+# The plain full-size PNG, which is what the render cache stores
+PNG = ExportTarget('png')
+
+
+def parse_exports(specs):
+    """
+    Parse a comma-separated list (or iterable) of export specs.
+
+    Args:
+        specs (str or iterable): e.g. "png,png@2x,pdf" or ["png", "thumbnail"]
+
+    Returns:
+        list: ExportTarget objects in the given order, without duplicates
+
+    Raises:
+        ValueError: If a spec is not understood
+    """
+    if isinstance(specs, str):
+        specs = specs.split(',')
+    targets = []
+    for spec in specs:
+        if spec.strip():
+            target = ExportTarget.parse(spec)
+            if target not in targets:
+                targets.append(target)
+    return targets
+
+
+def wait_for_render_ready(driver, timeout=RENDER_READY_TIMEOUT, stable_frames=2):
+    """
+    Wait until the loaded dashboard is ready to be captured.
+
+    Ready means every web font has loaded (document.fonts.ready) and the
+    container height has stayed the same for ``stable_frames`` consecutive
+    animation frames, so a fast page is captured as soon as it settles
+    instead of after a fixed delay.
+
+    Args:
+        driver: Selenium WebDriver session with the dashboard loaded
+        timeout (float): Maximum seconds to wait
+        stable_frames (int): Frames the layout must stay unchanged
+
+    Returns:
+        tuple: (container height in pixels, seconds spent waiting)
+
+    Raises:
+        TimeoutError: If the page did not settle within the timeout
+    """
+    driver.set_script_timeout(timeout)
+    started = time.perf_counter()
+    try:
+        height = driver.execute_async_script(RENDER_READY_SCRIPT, stable_frames)
+    except Exception as e:
+        # Only a real browser raises here, so Selenium is available
+        from selenium.common.exceptions import TimeoutException
+        if isinstance(e, TimeoutException):
+            raise TimeoutError(f"Dashboard did not finish rendering within {timeout}s") from e
+        raise
+    return height, time.perf_counter() - started
+
+
+def export_dashboard(driver, html_path, targets, stem=None, ready_timeout=RENDER_READY_TIMEOUT,
+                     trace=None):
+    """
+    Load a dashboard once and write every requested export from it.
+
+    Args:
+        driver: Selenium Chrome session (needs execute_cdp_cmd)
+        html_path (str): Path to the input HTML file
+        targets (list): ExportTarget objects, see parse_exports()
+        stem (str): Output path without suffix; defaults to html_path
+                    without its extension
+        ready_timeout (float): Maximum seconds to wait for fonts and layout
+        trace (RenderTrace): Records the page_load and capture stages, if given
+
+    Returns:
+        tuple: ({spec: output path}, seconds spent waiting for the page)
+    """
+    if stem is None:
+        stem = os.path.splitext(html_path)[0]
+
+    with stage(trace, 'page_load'):
+        driver.get(f"file://{os.path.abspath(html_path)}")
+        total_height, waited = wait_for_render_ready(driver, ready_timeout)
+        driver.set_window_size(WINDOW_WIDTH, total_height)
+        x, y, width, height = driver.execute_script(CONTAINER_RECT_SCRIPT)
+
+    with stage(trace, 'capture'):
+        outputs = _capture_targets(driver, targets, stem, (x, y, width, height))
+    return outputs, waited
+
+
+def _capture_targets(driver, targets, stem, rect):
+    """Write every export target of the loaded page; returns {spec: path}."""
+    x, y, width, height = rect
+    outputs = {}
+    for target in targets:
+        if target.kind == 'pdf':
+            # One page exactly the size of the laid-out document
+            result = driver.execute_cdp_cmd('Page.printToPDF', {
+                'printBackground': True,
+                'paperWidth': (2 * x + width) / CSS_DPI,
+                'paperHeight': (2 * y + height) / CSS_DPI,
+                'marginTop': 0, 'marginBottom': 0, 'marginLeft': 0, 'marginRight': 0,
+                'pageRanges': '1',
+            })
+        else:
+            image_format = EXPORT_KINDS[target.kind][0]
+            scale = THUMBNAIL_WIDTH / width if target.kind == 'thumbnail' else target.scale
+            params = {
+                'format': image_format,
+                'clip': {'x': x, 'y': y, 'width': width, 'height': height, 'scale': scale},
+                'captureBeyondViewport': True,
+            }
+            if image_format in IMAGE_QUALITY:
+                params['quality'] = IMAGE_QUALITY[image_format]
+            result = driver.execute_cdp_cmd('Page.captureScreenshot', params)
+
+        path = f"{stem}{target.suffix}"
+        with open(path, 'wb') as f:
+            f.write(base64.b64decode(result['data']))
+        outputs[target.spec] = path
+    return outputs
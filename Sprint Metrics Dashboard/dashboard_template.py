@@ -0,0 +1,516 @@
+"""
+Dashboard Template - Precompiled HTML Layout
+============================================
+
+Almost all of a dashboard page is constant: the stylesheet, the header and
+the markup of the four category cards never change between renders. This
+module assembles that text once per process and splits it around a few
+named slots (increment, sprint range, progress bar, the twelve metric
+values, each card's optional trend sparklines and delivery forecast), so
+rendering a dashboard only formats the values and joins a list of
+precomputed strings.
+
+Usage:
+    html = render_dashboard(17, "17.2", sprints, metrics, "17.1 - 17.2")
+    html = render_dashboard(..., font=EmbeddedFont.from_directory())  # offline font
+    html = render_dashboard(..., trends=trend_series(index, "17.2", metrics))  # sparklines
+    html = render_dashboard(..., forecast=forecast_completion(cube, "17.2", sprints, metrics))
+"""
+
+from functools import lru_cache
+
+from font_embed import page_characters
+from sparklines import render_sparkline
+
+
+# Bump whenever the generated HTML changes so cached renders are not reused
+TEMPLATE_VERSION = "3"
+
+# Category cards in display order: (metrics key, heading, team items).
+# The first card uses the primary (white body) style.
+CATEGORIES = (
+    ('digitalTechnology', 'DIGITAL TECHNOLOGY',
+     ('DIGITAL', 'ENTERPRISE APPLICATIONS', 'TECHNOLOGY OPERATIONS')),
+    ('digital', 'DIGITAL',
+     ('AVATARS', 'DESTINO', 'SDI WEBSITE', 'XENO')),
+    ('enterpriseApplications', 'ENTERPRISE APPLICATIONS',
+     ('AX GUARDIANS', 'DELTA 365', 'ENTERPRISE AUTOMATION', 'WARETEC')),
+    ('technologyOperations', 'TECHNOLOGY OPERATIONS',
+     ('CSI', 'CYBER DEFENCE', 'CYBER OPERATIONS', 'ENTERPRISE ARCHITECTURE', 'GRC', 'JSOC', 'MATRIX')),
+)
+
+DASHBOARD_CSS = """        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        
+        body {
+            font-family: Arial, sans-serif;
+            background-color: #e8e8e8;
+            padding: 20px;
+        }
+        
+        .container {
+            max-width: 1400px;
+            margin: 0 auto;
+            background: rgb(224, 224, 224);
+            padding: 30px;
+            border-radius: 10px;
+        }
+        
+        .header {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 20px;
+        }
+        
+        .title {
+            font-size: 55px;
+            font-weight: 700;
+            color: #003d5c;
+        }
+        
+        .title .increment {
+            font-weight: 700;
+            color: #ff6633;
+        }
+        
+        .subtitle {
+            font-size: 30px;
+            font-weight: 700;
+            color: #ff6633;
+            margin-bottom: 5px;
+        }
+        
+        .subtitle .sprintrange {
+            font-weight: 700;
+            color: #003d5c;
+        }
+        
+        .logo {
+            font-size: 32px;
+            font-weight: 700;
+            color: #003d5c;
+        }
+        
+        .logo .industrial {
+            font-size: 14px;
+            display: block;
+            text-align: right;
+            margin-top: -5px;
+        }
+        
+        .progress-container {
+            display: flex;
+            background: #ffffff;
+            border-radius: 25px;
+            padding: 8px;
+            margin-bottom: 10px;
+            position: relative;
+        }
+        
+        .progress-item {
+            flex: 1;
+            font-size: 20px;
+            text-align: center;
+            padding: 8px;
+            color: #999;
+            font-weight: 700;
+            position: relative;
+            z-index: 1;
+        }
+        
+        .progress-item.active {
+            background: #ff6633;
+            color: white;
+            font-size: 20px;
+            border-radius: 20px;
+            position: relative;
+        }
+        
+        .progress-item.active::after {
+            content: '';
+            position: absolute;
+            right: -15px;
+            top: 50%;
+            transform: translateY(-50%);
+            width: 18px;
+            height: 18px;
+            background: #003d5c;
+            border-radius: 50%;
+            border: 3px solid white;
+        }
+        
+        .cards-container {
+            display: grid;
+            grid-template-columns: repeat(4, 1fr);
+            gap: 20px;
+        }
+        
+        .card {
+            border: 3px solid #003d5c;
+            border-radius: 15px;
+            overflow: hidden;
+            background: white;
+        }
+        
+        .card-header {
+            font-size: 40px;
+            padding: 20px;
+            color: white;
+            min-height: 320px;
+        }
+        
+        .card-header-primary {
+            background: #003d5c;
+            min-height: 320px;
+            padding: 20px;
+        }
+        
+        .card-header-secondary {
+            padding: 20px;
+            background: linear-gradient(135deg, #4a6c7d 0%, #003d5c 100%);
+        }
+        
+        .card-header h2 {
+            font-size: 36px;
+            font-weight: 700;
+            text-align: center;
+            margin-bottom: 15px;
+            line-height: 1.2;
+        }
+        
+        .item {
+            font-size: 14px;
+            margin-bottom: 5px;
+        }
+        
+        .maincard-body {
+            padding: 30px 20px;
+            text-align: center;
+            background: white;
+        }
+        .card-body {
+            padding: 30px 20px;
+            text-align: center;
+            background: linear-gradient(135deg, #4a6c7d 0%, #003d5c 100%);
+        }
+        
+        .metric-large {
+            font-size: 120px;
+            font-weight: 700;
+            color: #003d5c;
+            line-height: 1;
+            display: inline;
+        }
+        .metric-largewhite {
+            font-size: 120px;
+            font-weight: 700;
+            color: white;
+            line-height: 1;
+            display: inline;
+        }
+        
+        .metric-divider {
+            height: 10px;
+            background: #ff6633;
+            margin: 10px 40px;
+        }
+        
+        .metric-label {
+            font-size: 20px;
+            font-weight: 700;
+            color: #003d5c;
+            margin-top: 15px;
+        }
+        
+        .metric-labelwhite {
+            font-size: 20px;
+            font-weight: 700;
+            color: white;
+            margin-top: 15px;
+        }
+        .card-footer {
+            background: #ff6633;
+            padding: 20px;
+            text-align: center;
+            color: white;
+        }
+        
+        .health-score {
+            font-size: 100px;
+            font-weight: 700;
+            display: inline;
+        }
+        
+        .health-divider {
+            height: 8px;
+            background: #003d5c;
+            margin: 8px 20px;
+        }
+        
+        .health-max {
+            font-size: 60px;
+            font-weight: 700;
+        }
+        
+        .health-label {
+            font-size: 20px;
+            font-weight: 700;
+            margin-top: 8px;
+            letter-spacing: 1px;
+        }
+        
+        .sparkline {
+            display: block;
+            width: 100%;
+            height: 48px;
+            margin-top: 15px;
+            color: #ff6633;
+        }
+        .card-footer .sparkline {
+            color: white;
+        }
+        
+        .forecast {
+            font-size: 18px;
+            font-weight: 700;
+            color: #003d5c;
+            margin-top: 15px;
+        }
+        .card-body .forecast {
+            color: white;
+        }
+"""
+
+
+class CompiledTemplate:
+    """
+    Template text split once into static chunks and slots.
+
+    Slots are written into the source with slot(). Compiling keeps the
+    source as a list of strings in which every slot occurrence owns one
+    position, so render() only copies the list, drops the values into
+    those positions and joins it. The static text is never rebuilt.
+    """
+
+    MARK = '\x00'
+
+    @classmethod
+    def slot(cls, name):
+        """str: Placeholder for the named value in template source."""
+        return f"{cls.MARK}{name}{cls.MARK}"
+
+    def __init__(self, source):
+        """
+        Compile template source.
+
+        Args:
+            source (str): Template text containing slot() placeholders
+        """
+        # Even positions are static text, odd positions are slot names
+        self._parts = source.split(self.MARK)
+        self.slots = tuple(self._parts[1::2])
+
+    def render(self, values):
+        """
+        Fill every slot and return the finished text.
+
+        Args:
+            values (list): Formatted strings, one per entry of ``slots``
+                           in the same order
+
+        Returns:
+            str: Rendered text
+        """
+        out = self._parts.copy()
+        out[1::2] = values
+        return ''.join(out)
+
+
+def _card_source(key, heading, items, primary):
+    """Build the template source for one category card."""
+    slot = CompiledTemplate.slot
+    header = 'card-header-primary' if primary else 'card-header-secondary'
+    body = 'maincard-body' if primary else 'card-body'
+    metric = 'metric-large' if primary else 'metric-largewhite'
+    label = 'metric-label' if primary else 'metric-labelwhite'
+    items_html = ''.join(f'<div class="item">✓ {item}</div>' for item in items)
+    return f'''
+        <div class="card">
+            <div class="card-header {header}">
+                <h2>{heading}</h2>
+                {items_html}
+            </div>
+            <div class="{body}">
+                <div class="{metric}">{slot(key + '.delivered')}</div>
+                <div class="metric-divider"></div>
+                <div class="{metric}">{slot(key + '.total')}</div>
+                <div class="{label}">FEATURES DELIVERED</div>
+                {slot(key + '.delivered_trend')}
+                {slot(key + '.forecast')}
+            </div>
+            <div class="card-footer">
+                <div class="health-score">{slot(key + '.health')}</div>
+                <div class="health-divider"></div>
+                <div class="health-max">4.00</div>
+                <div class="health-label">HEALTH METRICS</div>
+                {slot(key + '.health_trend')}
+            </div>
+        </div>
+        '''
+
+
+def _page_source():
+    """Build the template source for the whole dashboard page."""
+    slot = CompiledTemplate.slot
+    cards = ''.join(
+        _card_source(key, heading, items, primary=index == 0)
+        for index, (key, heading, items) in enumerate(CATEGORIES)
+    )
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Digital Technology - Increment {slot('increment')}</title>
+    <style>
+{DASHBOARD_CSS}{slot('font_css')}    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <div>
+                <div class="title">DIGITAL TECHNOLOGY – <span class="increment">INCREMENT {slot('increment')}</span></div>
+                <div class="subtitle">Delivery metrics for <span class="sprintrange">Sprint {slot('sprint_range')}</span></div>
+            </div>
+            <div class="logo">
+                SIME
+                <span class="industrial">INDUSTRIAL</span>
+            </div>
+        </div>
+        
+        <div class="progress-container">{slot('progress')}</div>
+        
+        <div class="cards-container">
+            {cards}
+        </div>
+    </div>
+</body>
+</html>'''
+
+
+# Compiled once at import; every render reuses the same static chunks
+PAGE = CompiledTemplate(_page_source())
+
+# Metric keys in the order their slots appear in PAGE
+_CARD_KEYS = tuple(key for key, _, _ in CATEGORIES)
+
+
+def render_progress_bar(sprints, current_sprint):
+    """
+    Render the sprint progress bar segments.
+
+    Args:
+        sprints (list): Sprint identifiers in display order
+        current_sprint (str): Sprint to highlight
+
+    Returns:
+        str: One progress-item div per sprint
+    """
+    return _progress_bar(tuple(sprints), current_sprint)
+
+
+@lru_cache(maxsize=256)
+def _progress_bar(sprints, current_sprint):
+    """Cached body of render_progress_bar(); an increment only has a few distinct bars."""
+    return ''.join([
+        f'<div class="progress-item {"active" if s == current_sprint else ""}">{s}</div>'
+        for s in sprints
+    ])
+
+
+def render_forecast(forecast):
+    """
+    Render one card's delivery forecast line.
+
+    Args:
+        forecast (dict): One category of forecast.forecast_completion(),
+                         or None
+
+    Returns:
+        str: Forecast div, or an empty string without a forecast
+    """
+    if not forecast:
+        return ''
+    if not forecast['remaining']:
+        return '<div class="forecast">ALL FEATURES DELIVERED</div>'
+    p50 = forecast['p50'] or '-'
+    p85 = forecast['p85'] or '-'
+    return (f'<div class="forecast">FINISH P50 {p50} · P85 {p85}<br>'
+            f'{forecast["on_time"]:.0%} BY {forecast["due"]}</div>')
+
+
+def template_version(font=None):
+    """
+    Identify the template variant for render cache keys.
+
+    Args:
+        font (EmbeddedFont): Font embedded into the page, if any
+
+    Returns:
+        str: TEMPLATE_VERSION, extended with the font fingerprint when embedding
+    """
+    if font is None:
+        return TEMPLATE_VERSION
+    return f"{TEMPLATE_VERSION}+font-{font.fingerprint}"
+
+
+def render_dashboard(increment, current_sprint, sprints, metrics, sprint_range, font=None, trends=None,
+                     forecast=None):
+    """
+    Render the complete dashboard HTML document.
+
+    Args:
+        increment (int): Current increment number
+        current_sprint (str): Active sprint identifier
+        sprints (list): List of all sprint identifiers for progress bar
+        metrics (dict): Dictionary containing all metric values
+        sprint_range (str): Display text for the sprint range subtitle
+        font (EmbeddedFont): Font to inline as a subset of the page's
+                             characters, so rendering needs no system or
+                             network fonts; None keeps the default fonts
+        trends (dict): {category: {'delivered': [...], 'health': [...]}} from
+                       sparklines.trend_series(), drawn as a sparkline under
+                       each card's values; None leaves the cards without
+        forecast (dict): {category: {...}} from forecast.forecast_completion(),
+                         shown as P50/P85 completion sprints in each card;
+                         None for no forecast
+
+    Returns:
+        str: Complete HTML document as string
+    """
+    increment = f"{increment}"
+    trends = trends or {}
+    forecast = forecast or {}
+    # Same order as PAGE.slots: the header slots, then six per card
+    values = [increment, '', increment, f"{sprint_range}", render_progress_bar(sprints, current_sprint)]
+    for key in _CARD_KEYS:
+        category = metrics[key]
+        trend = trends.get(key, {})
+        values += (
+            f"{category['delivered']}",
+            f"{category['total']}",
+            render_sparkline(trend.get('delivered', ()), "Features delivered per sprint"),
+            render_forecast(forecast.get(key)),
+            f"{category['health']:.2f}",
+            render_sparkline(trend.get('health', ()), "Health per sprint"),
+        )
+    html = PAGE.render(values)
+    if font is None:
+        return html
+
+    values[1] = font.css(page_characters(html))
+    return PAGE.render(values)
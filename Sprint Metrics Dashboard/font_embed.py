@@ -0,0 +1,191 @@
+"""
+Font Embedding - Offline, Subset Web Fonts
+==========================================
+
+Inlines a locally bundled font into generated dashboards so headless Chrome
+never needs the network to draw text, and every render host produces the
+same pixels regardless of which system fonts it has installed.
+
+Only the glyphs that appear in the page are kept. The subset is encoded as
+WOFF inside a ``data:`` URI in an @font-face rule. Subsets are cached per
+process by character set, and dashboards of the same increment share
+almost all of their characters, so a batch subsets the font a handful of
+times rather than once per render.
+
+Requirements:
+    pip install fonttools
+
+Usage:
+    font = EmbeddedFont.from_directory()          # fonts/*-Regular.ttf, *-Bold.ttf
+    html = render_dashboard(..., font=font)
+"""
+
+import base64
+import hashlib
+import io
+import re
+import string
+from functools import lru_cache
+from pathlib import Path
+
+
+# Where the bundled font files live
+FONT_DIR = Path(__file__).resolve().parent / 'fonts'
+
+# Family name the embedded faces are registered under in the page
+FONT_FAMILY = 'DashboardSans'
+
+FONT_SUFFIXES = ('.ttf', '.otf')
+
+# Characters kept in every subset so that differing metric values rarely
+# produce a new subset
+BASE_CHARACTERS = string.digits + ' .-'
+
+_STYLE_RE = re.compile(r'<style\b.*?</style>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]*>')
+
+
+def page_characters(html):
+    """
+    Collect the characters a page displays.
+
+    Args:
+        html (str): Complete HTML document
+
+    Returns:
+        str: Sorted, de-duplicated visible characters plus BASE_CHARACTERS
+    """
+    text = _TAG_RE.sub('', _STYLE_RE.sub('', html))
+    return ''.join(sorted(set(text + BASE_CHARACTERS) - set('\r\n\t')))
+
+
+@lru_cache(maxsize=64)
+def _subset_woff(path, mtime_ns, characters):
+    """Subset one font file to the given characters and return base64 WOFF data."""
+    try:
+        from fontTools.subset import Options, Subsetter
+        from fontTools.ttLib import TTFont
+    except ImportError as e:
+        raise ImportError("Font embedding requires fontTools: pip install fonttools") from e
+
+    options = Options()
+    options.flavor = 'woff'
+    # FontForge's FFTM table only holds build timestamps
+    options.drop_tables += ['FFTM']
+    # Keep the embedded file byte-for-byte stable between runs
+    font = TTFont(path, recalcTimestamp=False)
+    subsetter = Subsetter(options=options)
+    subsetter.populate(text=characters)
+    subsetter.subset(font)
+
+    buffer = io.BytesIO()
+    font.flavor = 'woff'
+    font.save(buffer)
+    return base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+class EmbeddedFont:
+    """
+    A regular and optional bold face to inline into dashboards.
+
+    Attributes:
+        regular: Path of the regular (400) face
+        bold: Path of the bold (700) face, or None to let Chrome embolden
+        family: CSS font-family name used inside the page
+    """
+
+    def __init__(self, regular, bold=None, family=FONT_FAMILY):
+        """
+        Initialize from font file paths.
+
+        Args:
+            regular (str or Path): TrueType/OpenType file for normal weight
+            bold (str or Path): TrueType/OpenType file for bold weight
+            family (str): CSS font-family name for the embedded faces
+
+        Raises:
+            FileNotFoundError: If a font file does not exist
+        """
+        self.regular = Path(regular)
+        self.bold = Path(bold) if bold is not None else None
+        self.family = family
+        for path in self._faces().values():
+            if not path.is_file():
+                raise FileNotFoundError(f"Font file not found: {path}")
+        self._fingerprint = None
+
+    @classmethod
+    def from_directory(cls, directory=FONT_DIR, family=FONT_FAMILY):
+        """
+        Find the bundled faces in a directory.
+
+        The regular face is the file whose name contains "Regular" (or the
+        only font file present); the bold face is the one containing "Bold".
+
+        Args:
+            directory (str or Path): Directory holding .ttf/.otf files
+            family (str): CSS font-family name for the embedded faces
+
+        Returns:
+            EmbeddedFont: Font built from the files found
+
+        Raises:
+            FileNotFoundError: If no usable regular face is found
+        """
+        fonts = sorted(p for p in Path(directory).glob('*') if p.suffix.lower() in FONT_SUFFIXES)
+        bold = next((p for p in fonts if 'bold' in p.stem.lower()), None)
+        regular = next((p for p in fonts if 'regular' in p.stem.lower()), None)
+        if regular is None:
+            others = [p for p in fonts if p != bold]
+            regular = others[0] if len(others) == 1 else None
+        if regular is None:
+            raise FileNotFoundError(
+                f"No regular font face (*-Regular.ttf) found in {directory}"
+            )
+        return cls(regular, bold, family)
+
+    @property
+    def fingerprint(self):
+        """str: Short hash of the font files and family, for render cache keys."""
+        if self._fingerprint is None:
+            sha = hashlib.sha256(self.family.encode('utf-8'))
+            for weight, path in sorted(self._faces().items()):
+                sha.update(str(weight).encode('ascii'))
+                sha.update(path.read_bytes())
+            self._fingerprint = sha.hexdigest()[:16]
+        return self._fingerprint
+
+    def css(self, characters):
+        """
+        Build the stylesheet that embeds the font and applies it to the page.
+
+        Args:
+            characters (str): Characters the page displays, see page_characters()
+
+        Returns:
+            str: @font-face rules with inline WOFF subsets and a body rule
+        """
+        rules = []
+        for weight, path in sorted(self._faces().items()):
+            encoded = _subset_woff(str(path), path.stat().st_mtime_ns, characters)
+            rules.append(f'''
+        @font-face {{
+            font-family: '{self.family}';
+            src: url(data:font/woff;base64,{encoded}) format('woff');
+            font-weight: {weight};
+            font-style: normal;
+        }}
+''')
+        rules.append(f'''
+        body {{
+            font-family: '{self.family}', Arial, sans-serif;
+        }}
+''')
+        return ''.join(rules)
+
+    def _faces(self):
+        """Map CSS font-weight to font file for every face provided."""
+        faces = {400: self.regular}
+        if self.bold is not None:
+            faces[700] = self.bold
+        return faces
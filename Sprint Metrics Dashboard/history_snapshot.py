@@ -0,0 +1,206 @@
+"""
+History Snapshot - Compact In-Memory History Records
+====================================================
+
+A history record is a dict holding a dict of four category dicts, with
+the same string keys repeated in every snapshot. Snapshot keeps the same
+information in a slotted object: the metric values live in one typed
+array of doubles (4 categories x delivered/total/health), and the sprint
+strings, which repeat across snapshots, are interned. Holding a long
+history for trend analysis then takes a fraction of the memory.
+
+Grid layout (row-major, rows follow dashboard_template.CATEGORIES):
+    index = category * 3 + metric, metric 0 = delivered, 1 = total, 2 = health
+    A category missing from the record is stored as NaN.
+
+Snapshots round-trip with the history JSON schema:
+    Snapshot.from_record(record).to_record() == record
+
+Usage:
+    snapshots = pack_history(store.load())
+    delivered = snapshots[-1].metric('digital', 'delivered')
+    records = unpack_history(snapshots)
+"""
+
+import math
+import sys
+from array import array
+
+from dashboard_template import CATEGORIES
+from history_store import sprint_key
+
+
+# Category keys in grid row order
+CATEGORY_KEYS = tuple(key for key, _, _ in CATEGORIES)
+
+# Metric names in grid column order
+METRIC_NAMES = ('delivered', 'total', 'health')
+
+# Metrics stored as whole numbers in the JSON schema
+INTEGER_METRICS = ('delivered', 'total')
+
+_CATEGORY_INDEX = {key: i for i, key in enumerate(CATEGORY_KEYS)}
+_METRIC_INDEX = {name: i for i, name in enumerate(METRIC_NAMES)}
+_GRID_SIZE = len(CATEGORY_KEYS) * len(METRIC_NAMES)
+_EMPTY_GRID = array('d', [math.nan]) * _GRID_SIZE
+
+
+class Snapshot:
+    """
+    One history record in compact form.
+
+    Attributes:
+        increment: Increment number
+        current_sprint: Active sprint, e.g. "17.3"
+        sprint_range: Sprint range subtitle, e.g. "17.1 - 17.3"
+        timestamp: ISO timestamp of when the snapshot was saved
+        id: History store id, or None for a record not yet stored
+        grid: array('d') of the metric values, see the module docstring
+    """
+
+    __slots__ = ('increment', 'current_sprint', 'sprint_range', 'timestamp', 'id', 'grid')
+
+    def __init__(self, increment, current_sprint, sprint_range, timestamp, metrics=None, id=None):
+        """
+        Initialize a snapshot.
+
+        Args:
+            increment (int): Increment number
+            current_sprint (str): Active sprint identifier
+            sprint_range (str): Sprint range subtitle
+            timestamp (str): ISO timestamp
+            metrics (dict): {category: {'delivered', 'total', 'health'}} as in
+                            a history record; missing categories become NaN
+            id (str): History store id
+
+        Raises:
+            ValueError: If metrics names an unknown category or metric
+        """
+        self.increment = increment
+        self.current_sprint = sys.intern(current_sprint)
+        self.sprint_range = sys.intern(sprint_range)
+        self.timestamp = timestamp
+        self.id = id
+        self.grid = array('d', _EMPTY_GRID)
+        for key, values in (metrics or {}).items():
+            for name, value in values.items():
+                self.set_metric(key, name, value)
+
+    @classmethod
+    def from_record(cls, record):
+        """
+        Build a snapshot from a history record.
+
+        Args:
+            record (dict): Record in the history JSON schema
+
+        Returns:
+            Snapshot: The compact snapshot
+        """
+        return cls(record['increment'], record['current_sprint'], record['sprint_range'],
+                   record['timestamp'], record['metrics'], record.get('id'))
+
+    def to_record(self):
+        """
+        Convert back to the history JSON schema.
+
+        Returns:
+            dict: Record equal to the one the snapshot was built from
+        """
+        metrics = {}
+        grid = self.grid
+        for row, key in enumerate(CATEGORY_KEYS):
+            base = row * len(METRIC_NAMES)
+            if math.isnan(grid[base]):
+                continue
+            metrics[key] = {
+                'delivered': int(grid[base]),
+                'total': int(grid[base + 1]),
+                'health': grid[base + 2],
+            }
+        record = {
+            'increment': self.increment,
+            'current_sprint': self.current_sprint,
+            'sprint_range': self.sprint_range,
+            'metrics': metrics,
+            'timestamp': self.timestamp,
+        }
+        if self.id is not None:
+            record['id'] = self.id
+        return record
+
+    def metric(self, category, name):
+        """
+        Read one metric value.
+
+        Args:
+            category (str): Category key, e.g. 'digital'
+            name (str): 'delivered', 'total' or 'health'
+
+        Returns:
+            int, float or None: The value, or None if the category is missing
+        """
+        value = self.grid[self._index(category, name)]
+        if math.isnan(value):
+            return None
+        return int(value) if name in INTEGER_METRICS else value
+
+    def set_metric(self, category, name, value):
+        """
+        Write one metric value.
+
+        Args:
+            category (str): Category key
+            name (str): 'delivered', 'total' or 'health'
+            value (int or float): New value
+        """
+        self.grid[self._index(category, name)] = value
+
+    @property
+    def sprint_key(self):
+        """tuple: Sortable (major, minor) key of the current sprint."""
+        return sprint_key(self.current_sprint)
+
+    @staticmethod
+    def _index(category, name):
+        """Grid position of a category's metric."""
+        try:
+            return _CATEGORY_INDEX[category] * len(METRIC_NAMES) + _METRIC_INDEX[name]
+        except KeyError:
+            raise ValueError(f"Unknown metric '{category}.{name}'") from None
+
+    def __eq__(self, other):
+        if not isinstance(other, Snapshot):
+            return NotImplemented
+        return self.to_record() == other.to_record()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Snapshot({self.increment}, {self.current_sprint!r}, {self.timestamp!r})"
+
+
+def pack_history(records):
+    """
+    Convert history records to snapshots.
+
+    Args:
+        records (iterable): Records in the history JSON schema
+
+    Returns:
+        list: Snapshots in the same order
+    """
+    return [Snapshot.from_record(record) for record in records]
+
+
+def unpack_history(snapshots):
+    """
+    Convert snapshots back to history records.
+
+    Args:
+        snapshots (iterable): Snapshot objects
+
+    Returns:
+        list: Records in the history JSON schema, in the same order
+    """
+    return [snapshot.to_record() for snapshot in snapshots]
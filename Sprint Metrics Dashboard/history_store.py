@@ -0,0 +1,539 @@
+"""
+History Store - Append-Only Sprint History Log
+==============================================
+
+Persists sprint history snapshots as a line-delimited JSON log so that
+saving a snapshot appends one line instead of rewriting the whole file.
+
+Log format (one JSON object per line, oldest first):
+    {"id": "3f2a...", "increment": 17, "current_sprint": "17.2", ...}
+    {"id": "3f2a...", "deleted": true}
+
+A record line is the history record itself plus a unique ``id``. Deleting
+a record appends a tombstone line carrying the same ``id``. Once dead lines
+outnumber live records the log is compacted on a background thread, which
+rewrites only the live records and then swaps the new file into place.
+
+Migration:
+    An existing ``sprint_history.json`` (a JSON list, most recent first) is
+    converted to ``sprint_history.jsonl`` by the application's start-up
+    load (``load(migrate=True)``) and the original is kept alongside as
+    ``sprint_history.json.bak``. Records appended before the migration ran
+    are kept after the legacy ones. Every other reader, such as the batch
+    renderer or a new SQLite database importing the history, reads the
+    legacy file as it stands and leaves the files untouched.
+
+SQLite backend:
+    Passing a ``.db`` or ``.sqlite`` path to open_history_store() selects
+    SqliteHistoryStore instead. It keeps each snapshot in an indexed table
+    and answers filtered queries (by increment, sprint range, date range or
+    latest snapshot per sprint) without loading the whole history.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from atomic_file import replacement_mode
+
+
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+
+def sprint_key(sprint):
+    """
+    Convert a sprint identifier into a sortable tuple.
+
+    Args:
+        sprint (str): Sprint identifier such as "17.2"
+
+    Returns:
+        tuple: (increment, sprint number), e.g. (17, 2)
+    """
+    increment, _, number = str(sprint).partition('.')
+    return int(increment), int(number or 0)
+
+
+def open_history_store(path):
+    """
+    Open the history store matching a file path.
+
+    Args:
+        path (str or Path): ``.db``/``.sqlite`` for the SQLite backend, any
+                            other path for the append-only JSONL log
+
+    Returns:
+        HistoryLog or SqliteHistoryStore: Store for the path
+    """
+    path = Path(path)
+    if path.suffix in SQLITE_SUFFIXES:
+        return SqliteHistoryStore(path)
+    return HistoryLog(path)
+
+
+class HistoryLog:
+    """
+    Append-only JSONL store for sprint history records.
+
+    Attributes:
+        path: Path the store was opened with
+        log_path: Path of the JSONL log file
+        legacy_path: Path of the legacy JSON list file
+        compact_min_garbage: Dead lines tolerated before compaction is considered
+    """
+
+    def __init__(self, path, compact_min_garbage=100):
+        """
+        Initialize the store. Nothing is read until load() is called.
+
+        Args:
+            path (str or Path): Either the JSONL log or the legacy JSON file;
+                                the other path is derived from it
+            compact_min_garbage (int): Minimum dead lines before compacting
+        """
+        path = Path(path)
+        self.path = path
+        if path.suffix == '.jsonl':
+            self.log_path = path
+            self.legacy_path = path.with_suffix('.json')
+        else:
+            self.log_path = path.with_suffix('.jsonl')
+            self.legacy_path = path
+        self.compact_min_garbage = compact_min_garbage
+
+        self._lock = threading.Lock()          # Guards appends and the file swap
+        self._compact_lock = threading.Lock()  # Only one compaction at a time
+        self._compactor = None
+        self._live = 0
+        self._garbage = 0
+
+    def load(self, migrate=False):
+        """
+        Read every live record, including those of a legacy JSON file.
+
+        Args:
+            migrate (bool): Also convert a legacy JSON file into the log and
+                            rename it to ``.json.bak``; without it the files
+                            are only read
+
+        Returns:
+            list: Live records in chronological order (oldest first). Lines
+                  that cannot be parsed, such as a line cut short by a crash,
+                  are skipped.
+        """
+        if self.legacy_path.exists():
+            return self._load_legacy(migrate)
+
+        with self._lock:
+            if not self.log_path.exists():
+                return []
+            records, garbage = self._read_live(self.log_path)
+            self._live = len(records)
+            self._garbage = garbage
+        return list(records.values())
+
+    def append(self, record):
+        """
+        Append a record to the log in constant time.
+
+        Args:
+            record (dict): History record; an ``id`` is added if missing
+
+        Returns:
+            dict: The same record, now carrying its ``id``
+        """
+        record.setdefault('id', uuid.uuid4().hex)
+        self._append_line(record)
+        with self._lock:
+            self._live += 1
+        return record
+
+    def delete(self, record_id):
+        """
+        Mark a record as deleted by appending a tombstone.
+
+        Args:
+            record_id (str): ``id`` of the record to delete
+        """
+        self._append_line({'id': record_id, 'deleted': True})
+        with self._lock:
+            self._live = max(0, self._live - 1)
+            # Both the original record line and the tombstone are now dead
+            self._garbage += 2
+        self._maybe_compact()
+
+    def rewrite(self, records):
+        """
+        Replace the log with exactly the given records.
+
+        Args:
+            records (list): Records in chronological order; missing ``id``
+                            values are assigned
+        """
+        for record in records:
+            record.setdefault('id', uuid.uuid4().hex)
+        with self._lock:
+            self._write_atomic(records)
+            self._live = len(records)
+            self._garbage = 0
+
+    def compact(self):
+        """
+        Rewrite the log with only its live records.
+
+        Appends made while the compacted copy is being written are carried
+        over before the swap, so compaction never loses a save.
+        """
+        with self._compact_lock:
+            with self._lock:
+                if not self.log_path.exists():
+                    return
+                offset = self.log_path.stat().st_size
+
+            records, _ = self._read_live(self.log_path, limit=offset)
+            fd, tmp_path = tempfile.mkstemp(dir=self.log_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    for record in records.values():
+                        f.write(json.dumps(record) + '\n')
+
+                with self._lock:
+                    # Carry over lines appended since the snapshot was taken
+                    with open(self.log_path, 'rb') as src:
+                        src.seek(offset)
+                        tail = src.read()
+                    with open(tmp_path, 'ab') as f:
+                        f.write(tail)
+                    os.chmod(tmp_path, replacement_mode(self.log_path))
+                    os.replace(tmp_path, self.log_path)
+
+                    tail_tombstones = tail.count(b'"deleted": true')
+                    self._garbage = tail_tombstones * 2
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+    def wait_for_compaction(self, timeout=None):
+        """Block until a running background compaction finishes."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join(timeout)
+
+    def _maybe_compact(self):
+        """Start a background compaction once dead lines outnumber live ones."""
+        with self._lock:
+            needed = self._garbage >= max(self.compact_min_garbage, self._live)
+            running = self._compactor is not None and self._compactor.is_alive()
+            if not needed or running:
+                return
+            self._compactor = threading.Thread(target=self.compact, daemon=True)
+            self._compactor.start()
+
+    def _append_line(self, obj):
+        """Append one JSON line to the log."""
+        line = (json.dumps(obj) + '\n').encode('utf-8')
+        with self._lock:
+            # Opened per call so appends follow the file across compaction swaps
+            with open(self.log_path, 'a+b') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell():
+                    # Start on a fresh line if a crash left the last one unfinished
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        line = b'\n' + line
+                f.write(line)
+
+    def _read_live(self, path, limit=None):
+        """
+        Replay the log into the set of live records.
+
+        Args:
+            path (Path): Log file to read
+            limit (int): Only read this many bytes from the start of the file
+
+        Returns:
+            tuple: (dict of id -> record in log order, number of dead lines)
+        """
+        records = {}
+        garbage = 0
+        with open(path, 'rb') as f:
+            data = f.read() if limit is None else f.read(limit)
+        for raw in data.splitlines():
+            try:
+                obj = json.loads(raw)
+            except ValueError:
+                continue
+            record_id = obj.get('id')
+            if obj.get('deleted'):
+                if records.pop(record_id, None) is not None:
+                    garbage += 1
+                garbage += 1
+            else:
+                records[record_id] = obj
+        return records, garbage
+
+    def _load_legacy(self, migrate):
+        """
+        Read the legacy JSON list file ahead of the log, optionally migrating it.
+
+        Runs entirely under the lock: a record saved while the legacy file
+        is read (the first append creates the log) is carried into the
+        migrated log instead of being replaced by it.
+        """
+        with self._lock:
+            appended, garbage = {}, 0
+            if self.log_path.exists():
+                appended, garbage = self._read_live(self.log_path)
+            try:
+                with open(self.legacy_path, 'r') as f:
+                    legacy = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                # Leave an unreadable (or already migrated) legacy file
+                # untouched for manual recovery and serve the log as it is
+                self._live, self._garbage = len(appended), garbage
+                return list(appended.values())
+
+            # Legacy files are most recent first; the log is oldest first
+            records = list(reversed(legacy))
+            if not migrate:
+                self._live, self._garbage = len(appended), garbage
+                return records + list(appended.values())
+
+            for record in records:
+                record.setdefault('id', uuid.uuid4().hex)
+            records += appended.values()
+            self._write_atomic(records)
+            self._live, self._garbage = len(records), 0
+            os.replace(self.legacy_path, self.legacy_path.with_name(self.legacy_path.name + '.bak'))
+        return records
+
+    def _write_atomic(self, records):
+        """Write records to a temp file and swap it in. Caller holds the lock."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.log_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record) + '\n')
+            os.chmod(tmp_path, replacement_mode(self.log_path))
+            os.replace(tmp_path, self.log_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+class SqliteHistoryStore:
+    """
+    Indexed SQLite store for sprint history records.
+
+    Offers the same load/append/delete/rewrite interface as HistoryLog plus
+    query() and latest_per_sprint(), which filter inside the database so
+    callers only receive the records they asked for.
+
+    Attributes:
+        path: Path of the SQLite database file
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS snapshots (
+            id TEXT PRIMARY KEY,
+            increment INTEGER NOT NULL,
+            sprint_major INTEGER NOT NULL,
+            sprint_minor INTEGER NOT NULL,
+            current_sprint TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            record TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_snapshots_increment
+            ON snapshots (increment, timestamp);
+        CREATE INDEX IF NOT EXISTS idx_snapshots_sprint
+            ON snapshots (sprint_major, sprint_minor, timestamp);
+        CREATE INDEX IF NOT EXISTS idx_snapshots_timestamp
+            ON snapshots (timestamp);
+    """
+
+    def __init__(self, path, import_from=None):
+        """
+        Open (and if needed create) the database.
+
+        Existing history is imported the first time the database is
+        created: from ``import_from`` if given, otherwise from the JSON
+        history file with the same name (see HistoryLog for the formats).
+
+        Args:
+            path (str or Path): Database file
+            import_from (str or Path): History file to seed a new database from
+        """
+        self.path = Path(path)
+        is_new = not self.path.exists()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(self.SCHEMA)
+
+        if is_new:
+            source = HistoryLog(import_from or self.path.with_suffix('.json'))
+            records = source.load()
+            if records:
+                self.rewrite(records)
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def load(self):
+        """
+        Read every record.
+
+        Returns:
+            list: All records in chronological order (oldest first)
+        """
+        return self.query()
+
+    def count(self):
+        """int: Number of stored records."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    def append(self, record):
+        """
+        Insert a record.
+
+        Args:
+            record (dict): History record; an ``id`` is added if missing
+
+        Returns:
+            dict: The same record, now carrying its ``id``
+        """
+        record.setdefault('id', uuid.uuid4().hex)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._row(record)
+            )
+        return record
+
+    def delete(self, record_id):
+        """
+        Delete a record.
+
+        Args:
+            record_id (str): ``id`` of the record to delete
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM snapshots WHERE id = ?", (record_id,))
+
+    def rewrite(self, records):
+        """
+        Replace the stored history with exactly the given records.
+
+        Args:
+            records (list): Records in chronological order; missing ``id``
+                            values are assigned
+        """
+        for record in records:
+            record.setdefault('id', uuid.uuid4().hex)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM snapshots")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [self._row(record) for record in records]
+            )
+
+    def query(self, increment=None, from_sprint=None, to_sprint=None, since=None,
+              until=None, latest=False, newest_first=False, limit=None, offset=None):
+        """
+        Fetch the records matching every given filter.
+
+        Args:
+            increment (int): Only records for this increment
+            from_sprint (str): Only sprints at or after this one, e.g. "17.2"
+            to_sprint (str): Only sprints at or before this one
+            since (str or datetime): Only snapshots taken at or after this time
+            until (str or datetime): Only snapshots taken at or before this time
+            latest (bool): Keep only the most recent snapshot of each sprint
+            newest_first (bool): Order by newest first instead of oldest first
+            limit (int): Return at most this many records
+            offset (int): Skip this many matching records first, for paging
+
+        Returns:
+            list: Matching records
+
+        Example:
+            # All snapshots for increment 17 taken during November 2025
+            store.query(increment=17, since="2025-11-01", until="2025-11-30T23:59:59")
+        """
+        where, params = [], []
+        if increment is not None:
+            where.append("increment = ?")
+            params.append(increment)
+        if from_sprint is not None:
+            major, minor = sprint_key(from_sprint)
+            where.append("(sprint_major > ? OR (sprint_major = ? AND sprint_minor >= ?))")
+            params.extend([major, major, minor])
+        if to_sprint is not None:
+            major, minor = sprint_key(to_sprint)
+            where.append("(sprint_major < ? OR (sprint_major = ? AND sprint_minor <= ?))")
+            params.extend([major, major, minor])
+        if since is not None:
+            where.append("timestamp >= ?")
+            params.append(self._timestamp(since))
+        if until is not None:
+            where.append("timestamp <= ?")
+            params.append(self._timestamp(until))
+
+        sql = "SELECT record, timestamp, seq FROM ({inner})".format(inner=(
+            "SELECT record, timestamp, rowid AS seq, ROW_NUMBER() OVER ("
+            "PARTITION BY sprint_major, sprint_minor ORDER BY timestamp DESC, rowid DESC"
+            ") AS rank FROM snapshots"
+            + (" WHERE " + " AND ".join(where) if where else "")
+        ))
+        if latest:
+            sql += " WHERE rank = 1"
+        sql += " ORDER BY timestamp DESC, seq DESC" if newest_first else " ORDER BY timestamp, seq"
+        if limit is not None or offset is not None:
+            # SQLite only accepts OFFSET after a LIMIT; -1 means no limit
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, offset or 0])
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def latest_per_sprint(self, increment=None):
+        """
+        Fetch the most recent snapshot of every sprint.
+
+        Args:
+            increment (int): Only sprints of this increment
+
+        Returns:
+            list: One record per sprint, oldest sprint snapshot first
+        """
+        return self.query(increment=increment, latest=True)
+
+    def _row(self, record):
+        """Build the table row for a record."""
+        major, minor = sprint_key(record['current_sprint'])
+        return (
+            record['id'],
+            record['increment'],
+            major,
+            minor,
+            record['current_sprint'],
+            record['timestamp'],
+            json.dumps(record),
+        )
+
+    @staticmethod
+    def _timestamp(value):
+        """Normalise a datetime or ISO string for comparison with stored timestamps."""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return str(value)
@@ -0,0 +1,398 @@
+"""
+Metrics Cube - Columnar History for Trend Queries
+=================================================
+
+Holds the sprint history in NumPy arrays so trend questions are answered
+with array operations instead of loops over record dicts.
+
+Two views are kept:
+
+    snapshots   every saved snapshot as columns: increment, sprint number
+                within the increment, save time, and the 4 x 3 metric grid
+                (see history_snapshot for the grid layout)
+    cube        the latest snapshot of each sprint as a dense array of
+                shape (increments, sprints, categories, metrics); sprints
+                that have no snapshot are NaN
+
+append() updates both in constant time (amortized), so the application
+can keep the cube current as snapshots are saved. Rebuild it with
+from_records() after records are deleted. Snapshots whose sprint has no
+number within the increment (e.g. "17") have no sprint cell and are left
+out of both views; ``skipped`` counts them.
+
+Usage:
+    cube = MetricsCube.from_store(open_history_store("sprint_history.json"))
+    delivered = cube.select(increments=(12, 17), categories='enterpriseApplications',
+                            metrics='delivered')            # increments x sprints
+    per_increment = cube.rollup('delivered', over='sprint', how='last')
+    cube.append(new_record)
+
+Requires NumPy (pip install numpy).
+"""
+
+import warnings
+from datetime import datetime
+
+import numpy as np
+
+from history_snapshot import CATEGORY_KEYS, METRIC_NAMES, Snapshot
+
+
+# Reductions accepted by rollup()
+ROLLUPS = ('sum', 'mean', 'min', 'max', 'last')
+
+_AXES = {'increment': 0, 'sprint': 1, 'category': 2}
+_GRID_SHAPE = (len(CATEGORY_KEYS), len(METRIC_NAMES))
+
+
+def _snapshot(item):
+    """Return a Snapshot for a history record or an existing Snapshot."""
+    return item if isinstance(item, Snapshot) else Snapshot.from_record(item)
+
+
+def _saved_at(timestamp):
+    """float: Save time of a snapshot as POSIX seconds, for ordering."""
+    return datetime.fromisoformat(timestamp).timestamp()
+
+
+class MetricsCube:
+    """
+    NumPy-backed history of sprint metrics.
+
+    Attributes:
+        categories: Category keys along the category axis
+        metrics: Metric names along the metric axis
+        skipped: Snapshots left out because their sprint number is below 1
+    """
+
+    categories = CATEGORY_KEYS
+    metrics = METRIC_NAMES
+
+    def __init__(self, capacity=64):
+        """
+        Initialize an empty cube.
+
+        Args:
+            capacity (int): Snapshots to allocate room for up front
+        """
+        self._count = 0
+        self.skipped = 0
+        self._increment = np.empty(capacity, dtype=np.int32)
+        self._sprint = np.empty(capacity, dtype=np.int16)
+        self._saved = np.empty(capacity, dtype=np.float64)
+        self._values = np.empty((capacity,) + _GRID_SHAPE, dtype=np.float64)
+
+        # Dense latest-per-sprint cube and the save time of each cell
+        self._first_increment = 0
+        self._cube = np.full((0, 0) + _GRID_SHAPE, np.nan)
+        self._cube_saved = np.full((0, 0), -np.inf)
+
+    # === BUILDING ===
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build a cube from history records or Snapshot objects.
+
+        Args:
+            records (iterable): Records in any order
+
+        Returns:
+            MetricsCube: The populated cube
+        """
+        snapshots = [_snapshot(record) for record in records]
+        cube = cls(capacity=max(64, len(snapshots)))
+        # Sprint 0 (no minor number) would index the last sprint column
+        kept = [s for s in snapshots if s.sprint_key[1] >= 1]
+        cube.skipped = len(snapshots) - len(kept)
+        snapshots = kept
+        count = len(snapshots)
+        if not count:
+            return cube
+
+        cube._increment[:count] = [s.increment for s in snapshots]
+        cube._sprint[:count] = [s.sprint_key[1] for s in snapshots]
+        cube._saved[:count] = [_saved_at(s.timestamp) for s in snapshots]
+        grids = np.frombuffer(b''.join(s.grid.tobytes() for s in snapshots), dtype=np.float64)
+        cube._values[:count] = grids.reshape((count,) + _GRID_SHAPE)
+        cube._count = count
+        cube._rebuild_cube()
+        return cube
+
+    @classmethod
+    def from_store(cls, store):
+        """
+        Build a cube from every record in a history store.
+
+        Args:
+            store (HistoryLog or SqliteHistoryStore): Store to read
+
+        Returns:
+            MetricsCube: The populated cube
+        """
+        return cls.from_records(store.load())
+
+    def append(self, record):
+        """
+        Add one snapshot, updating the latest-per-sprint cube in place.
+
+        A snapshot whose sprint has no number within the increment is only
+        counted in ``skipped``.
+
+        Args:
+            record (dict or Snapshot): The saved history record
+        """
+        snapshot = _snapshot(record)
+        if snapshot.sprint_key[1] < 1:
+            self.skipped += 1
+            return
+        if self._count == len(self._saved):
+            self._grow(2 * len(self._saved))
+
+        i = self._count
+        increment, sprint = snapshot.increment, snapshot.sprint_key[1]
+        saved = _saved_at(snapshot.timestamp)
+        self._increment[i] = increment
+        self._sprint[i] = sprint
+        self._saved[i] = saved
+        self._values[i] = np.frombuffer(snapshot.grid, dtype=np.float64).reshape(_GRID_SHAPE)
+        self._count += 1
+
+        self._fit_cube(increment, sprint)
+        cell = (increment - self._first_increment, sprint - 1)
+        if saved >= self._cube_saved[cell]:
+            self._cube[cell] = self._values[i]
+            self._cube_saved[cell] = saved
+
+    def __len__(self):
+        """int: Number of snapshots held."""
+        return self._count
+
+    # === QUERIES ===
+
+    @property
+    def increments(self):
+        """numpy.ndarray: Increment numbers along the increment axis."""
+        return np.arange(self._first_increment, self._first_increment + self._cube.shape[0])
+
+    @property
+    def sprints(self):
+        """numpy.ndarray: Sprint numbers within an increment along the sprint axis (1-based)."""
+        return np.arange(1, self._cube.shape[1] + 1)
+
+    @property
+    def values(self):
+        """numpy.ndarray: Latest-per-sprint cube (increment x sprint x category x metric), read-only."""
+        view = self._cube.view()
+        view.flags.writeable = False
+        return view
+
+    def latest_per_sprint(self, as_of=None):
+        """
+        Select the most recent snapshot of every sprint.
+
+        Args:
+            as_of (str or datetime): Only consider snapshots saved at or
+                                     before this time; None for all
+
+        Returns:
+            numpy.ndarray: Cube shaped like ``values``; NaN where a sprint
+                           had no snapshot by then
+        """
+        if as_of is None:
+            return self._cube.copy()
+        if isinstance(as_of, str):
+            as_of = datetime.fromisoformat(as_of)
+        mask = self._saved[:self._count] <= as_of.timestamp()
+        return self._latest(np.flatnonzero(mask))
+
+    def select(self, increments=None, sprints=None, categories=None, metrics=None):
+        """
+        Slice the latest-per-sprint cube.
+
+        Each argument may be None for the whole axis. Increments and sprints
+        also take a single number, which drops that axis, or an inclusive
+        (first, last) pair. Categories and metrics take one key, which drops
+        the axis, or a sequence of keys.
+
+        Returns:
+            numpy.ndarray: The selected values, e.g. increments x sprints for
+                           one category and one metric
+
+        Raises:
+            KeyError: If a single increment or sprint is not in the cube
+            ValueError: If a category or metric key is unknown
+        """
+        index = (
+            self._position(increments, self._first_increment, self._cube.shape[0], 'increment'),
+            self._position(sprints, 1, self._cube.shape[1], 'sprint'),
+            self._label_index(categories, CATEGORY_KEYS),
+            self._label_index(metrics, METRIC_NAMES),
+        )
+        # Apply from the last axis back, so dropping an axis never shifts
+        # the ones still to be indexed, and two key lists never broadcast
+        selected = self._cube
+        for axis in reversed(range(4)):
+            position = index[axis]
+            if isinstance(position, list):
+                selected = np.take(selected, position, axis=axis)
+            else:
+                selected = selected[(slice(None),) * axis + (position,)]
+        return selected
+
+    def rollup(self, metric, over='sprint', how='sum'):
+        """
+        Reduce one metric of the latest-per-sprint cube along an axis.
+
+        Missing sprints are ignored. 'last' takes the value of the latest
+        sprint (or increment, or category) that has one, e.g. the final
+        delivered count of each increment.
+
+        Args:
+            metric (str): 'delivered', 'total' or 'health'
+            over (str): Axis to reduce: 'sprint', 'increment' or 'category'
+            how (str): One of ROLLUPS
+
+        Returns:
+            numpy.ndarray: The remaining two axes in cube order, e.g.
+                           increments x categories for over='sprint'
+
+        Raises:
+            ValueError: If the metric, axis or reduction is unknown
+        """
+        if over not in _AXES:
+            raise ValueError(f"Unknown axis '{over}' (choose from {', '.join(_AXES)})")
+        if how not in ROLLUPS:
+            raise ValueError(f"Unknown rollup '{how}' (choose from {', '.join(ROLLUPS)})")
+        values = self._cube[..., self._label_index(metric, METRIC_NAMES)]
+        axis = _AXES[over]
+
+        if how == 'last':
+            present = ~np.isnan(values)
+            # Position of the last present value along the axis (0 if none)
+            last = values.shape[axis] - 1 - np.argmax(np.flip(present, axis=axis), axis=axis)
+            result = np.take_along_axis(values, np.expand_dims(last, axis), axis=axis).squeeze(axis)
+            return np.where(present.any(axis=axis), result, np.nan)
+
+        reduce = {'sum': np.nansum, 'mean': np.nanmean, 'min': np.nanmin, 'max': np.nanmax}[how]
+        empty = np.isnan(values).all(axis=axis)
+        with warnings.catch_warnings():
+            # All-NaN slices warn for mean/min/max; they are reported as NaN
+            warnings.simplefilter('ignore', RuntimeWarning)
+            result = reduce(values, axis=axis)
+        return np.where(empty, np.nan, result)
+
+    def snapshots(self, increment=None, category=None, metric=None):
+        """
+        Every stored snapshot (not just the latest per sprint) as columns.
+
+        Args:
+            increment (int): Only snapshots of this increment
+            category (str): Reduce the values to one category
+            metric (str): Reduce the values to one metric
+
+        Returns:
+            dict: 'increment', 'sprint', 'saved' (POSIX seconds) and 'values'
+                  arrays, in the order the snapshots were added
+        """
+        rows = slice(0, self._count)
+        if increment is not None:
+            rows = np.flatnonzero(self._increment[:self._count] == increment)
+        values = self._values[rows]
+        if metric is not None:
+            values = values[..., self._label_index(metric, METRIC_NAMES)]
+        if category is not None:
+            values = values[:, self._label_index(category, CATEGORY_KEYS)]
+        return {
+            'increment': self._increment[rows].copy(),
+            'sprint': self._sprint[rows].copy(),
+            'saved': self._saved[rows].copy(),
+            'values': values.copy(),
+        }
+
+    # === INTERNALS ===
+
+    def _grow(self, capacity):
+        """Reallocate the snapshot columns with room for ``capacity`` rows."""
+        count = self._count
+        for name in ('_increment', '_sprint', '_saved', '_values'):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:count] = old[:count]
+            setattr(self, name, new)
+
+    def _fit_cube(self, increment, sprint):
+        """Enlarge the dense cube so it has a cell for (increment, sprint)."""
+        n_increments, n_sprints = self._cube_saved.shape
+        if n_increments == 0:
+            first, last = increment, increment
+        else:
+            first = min(self._first_increment, increment)
+            last = max(self._first_increment + n_increments - 1, increment)
+        width = max(n_sprints, sprint)
+        if (first, last - first + 1, width) == (self._first_increment, n_increments, n_sprints):
+            return
+
+        cube = np.full((last - first + 1, width) + _GRID_SHAPE, np.nan)
+        saved = np.full((last - first + 1, width), -np.inf)
+        offset = self._first_increment - first
+        cube[offset:offset + n_increments, :n_sprints] = self._cube
+        saved[offset:offset + n_increments, :n_sprints] = self._cube_saved
+        self._first_increment, self._cube, self._cube_saved = first, cube, saved
+
+    def _rebuild_cube(self):
+        """Recompute the dense cube from every snapshot."""
+        count = self._count
+        increments, sprints = self._increment[:count], self._sprint[:count]
+        self._first_increment = int(increments.min())
+        shape = (int(increments.max()) - self._first_increment + 1, int(sprints.max()))
+        rows = self._latest_rows(np.arange(count))
+        cells = (increments[rows] - self._first_increment, sprints[rows] - 1)
+        self._cube = np.full(shape + _GRID_SHAPE, np.nan)
+        self._cube[cells] = self._values[rows]
+        self._cube_saved = np.full(shape, -np.inf)
+        self._cube_saved[cells] = self._saved[rows]
+
+    def _latest_rows(self, rows):
+        """Of the given snapshot rows, the newest one for each (increment, sprint)."""
+        if len(rows) == 0:
+            return rows
+        increments, sprints, saved = self._increment[rows], self._sprint[rows], self._saved[rows]
+        # Sort by increment, then sprint, then save time (stable, so the
+        # later-added of two equal times wins), and keep each group's last row
+        order = np.lexsort((saved, sprints, increments))
+        ordered = rows[order]
+        key = self._increment[ordered].astype(np.int64) * 65536 + self._sprint[ordered]
+        is_last = np.append(key[1:] != key[:-1], True)
+        return ordered[is_last]
+
+    def _latest(self, rows):
+        """Dense cube of the newest snapshot per sprint among ``rows``."""
+        cube = np.full(self._cube.shape, np.nan)
+        rows = self._latest_rows(rows)
+        cube[self._increment[rows] - self._first_increment, self._sprint[rows] - 1] = self._values[rows]
+        return cube
+
+    @staticmethod
+    def _position(value, first, size, name):
+        """Index along the increment or sprint axis for select()."""
+        if value is None:
+            return slice(None)
+        if isinstance(value, tuple):
+            start, stop = value
+            return slice(max(0, start - first), max(0, stop - first + 1))
+        if not first <= value < first + size:
+            raise KeyError(f"No history for {name} {value}")
+        return value - first
+
+    @staticmethod
+    def _label_index(value, labels):
+        """Index along the category or metric axis for select()."""
+        if value is None:
+            return slice(None)
+        try:
+            if isinstance(value, str):
+                return labels.index(value)
+            return [labels.index(label) for label in value]
+        except ValueError:
+            raise ValueError(f"Unknown key {value!r} (choose from {', '.join(labels)})") from None
@@ -0,0 +1,209 @@
+"""
+Render Cache - Content-Addressed Dashboard Storage
+==================================================
+
+Stores generated dashboard HTML and PNG files on disk keyed by a stable
+hash of everything that affects the output: increment, sprints, sprint
+range, the four metric blocks and the template version. Re-publishing an
+unchanged dashboard is then a file copy instead of a template render and
+a Chrome screenshot.
+
+Layout:
+    <cache_dir>/<key>/dashboard.html
+    <cache_dir>/<key>/dashboard.png
+
+Entries are evicted least-recently-used first once the cache grows past
+``max_bytes``. A hit refreshes the entry's modification time, which is
+what the LRU order is based on.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+from atomic_file import replacement_mode
+
+
+HTML_NAME = 'dashboard.html'
+PNG_NAME = 'dashboard.png'
+
+
+def render_key(increment, current_sprint, sprints, metrics, sprint_range, template_version, trends=None,
+               forecast=None):
+    """
+    Compute the cache key for a dashboard render.
+
+    Args:
+        increment (int): Increment number
+        current_sprint (str): Active sprint identifier
+        sprints (list): Sprint identifiers shown in the progress bar
+        metrics (dict): Metric values for each category
+        sprint_range (str): Sprint range subtitle text
+        template_version (str): Version of the HTML template
+        trends (dict): Sparkline values drawn into the cards, if any
+        forecast (dict): Delivery forecast shown in the cards, if any
+
+    Returns:
+        str: Hex SHA-256 digest identifying the render
+    """
+    payload = {
+        'increment': increment,
+        'current_sprint': current_sprint,
+        'sprints': list(sprints),
+        'metrics': metrics,
+        'sprint_range': sprint_range,
+        'template_version': template_version,
+    }
+    if trends:
+        payload['trends'] = trends
+    if forecast:
+        payload['forecast'] = forecast
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class RenderCache:
+    """
+    Size-bounded, content-addressed cache of rendered dashboards.
+
+    Attributes:
+        cache_dir: Directory holding one sub-directory per cached render
+        max_bytes: Total size the cache is trimmed back to after each store
+    """
+
+    def __init__(self, cache_dir='.render_cache', max_bytes=200 * 1024 * 1024):
+        """
+        Initialize the cache, creating its directory if needed.
+
+        Args:
+            cache_dir (str or Path): Directory for cached renders
+            max_bytes (int): Maximum total size of cached files in bytes
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def html_path(self, key):
+        """Path: Location of the cached HTML for a key."""
+        return self.cache_dir / key / HTML_NAME
+
+    def png_path(self, key):
+        """Path: Location of the cached PNG for a key."""
+        return self.cache_dir / key / PNG_NAME
+
+    def get_html(self, key):
+        """
+        Look up cached HTML.
+
+        Args:
+            key (str): Render key from render_key()
+
+        Returns:
+            str or None: Cached HTML, or None on a miss
+        """
+        path = self.html_path(key)
+        try:
+            html = path.read_text(encoding='utf-8')
+        except OSError:
+            return None
+        self._touch(key)
+        return html
+
+    def has_png(self, key):
+        """bool: True if a PNG is cached for the key."""
+        return self.png_path(key).exists()
+
+    def put_html(self, key, html):
+        """
+        Store HTML for a key.
+
+        Args:
+            key (str): Render key from render_key()
+            html (str): Generated HTML document
+        """
+        self._write_atomic(self.html_path(key), html.encode('utf-8'))
+        self.evict()
+
+    def put_png(self, key, source_path):
+        """
+        Store a PNG for a key by copying an already-rendered image.
+
+        Args:
+            key (str): Render key from render_key()
+            source_path (str or Path): PNG file produced by the renderer
+        """
+        self._write_atomic(self.png_path(key), Path(source_path).read_bytes())
+        self.evict()
+
+    def copy_png(self, key, destination):
+        """
+        Copy the cached PNG for a key to a destination path.
+
+        Args:
+            key (str): Render key from render_key()
+            destination (str or Path): Where to write the PNG
+
+        Returns:
+            bool: True if the PNG was cached and copied
+        """
+        try:
+            shutil.copyfile(self.png_path(key), destination)
+        except OSError:
+            return False
+        self._touch(key)
+        return True
+
+    def size_bytes(self):
+        """int: Total size of all cached files."""
+        return sum(size for _, _, size in self._entries())
+
+    def evict(self):
+        """Delete least-recently-used entries until the cache fits max_bytes."""
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda entry: entry[1])
+            total = sum(size for _, _, size in entries)
+            for entry_dir, _, size in entries:
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                total -= size
+
+    def _entries(self):
+        """Yield (directory, last_used, size) for every cached render."""
+        for entry_dir in self.cache_dir.iterdir():
+            if not entry_dir.is_dir():
+                continue
+            try:
+                files = [p.stat() for p in entry_dir.iterdir()]
+                last_used = entry_dir.stat().st_mtime
+            except OSError:
+                # Removed concurrently by another eviction
+                continue
+            yield entry_dir, last_used, sum(st.st_size for st in files)
+
+    def _touch(self, key):
+        """Mark an entry as recently used."""
+        try:
+            os.utime(self.cache_dir / key)
+        except OSError:
+            pass
+
+    def _write_atomic(self, path, data):
+        """Write bytes via a temporary file so readers never see partial files."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp_path, replacement_mode(path))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._touch(path.parent.name)
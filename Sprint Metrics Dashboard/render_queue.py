@@ -0,0 +1,302 @@
+"""
+Render Queue - Bounded Background Rendering
+===========================================
+
+Runs dashboard renders on a fixed number of worker threads instead of a
+new thread per click, so repeated clicks never start more browser work
+than the workers can handle.
+
+Features:
+    - A fixed number of worker threads, started on first use
+    - Coalescing: submitting a job whose key is already waiting replaces
+      the waiting job, so only the newest request for an output is rendered
+    - Cancellation of waiting jobs, and a cancel flag running jobs can check
+    - A thread-safe event queue reporting every status change and progress
+      message; a GUI drains it on its own thread (e.g. from Tk's after())
+
+Usage:
+    queue = RenderQueue(workers=2)
+    job = queue.submit("dashboard.html", render, "dashboard.html")
+    ...
+    for job, kind, message in queue.drain_events():   # on the GUI thread
+        status.set(message)
+    queue.shutdown()
+
+The job function is called as ``func(job, *args)``; it may call
+``job.report(message)`` to publish progress and should return early when
+``job.cancelled`` becomes true.
+"""
+
+import atexit
+import itertools
+import queue
+import threading
+from collections import OrderedDict
+
+
+# Job states
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+
+class RenderJob:
+    """
+    One unit of background work submitted to a RenderQueue.
+
+    Attributes:
+        job_id: Sequential id, unique within the queue
+        key: Coalescing key; a newer job with the same key replaces this
+             one while it is still waiting
+        status: One of PENDING, RUNNING, DONE, FAILED or CANCELLED
+        result: Return value of the job function once DONE
+        error: Exception raised by the job function once FAILED
+    """
+
+    def __init__(self, render_queue, job_id, key, func, args):
+        """
+        Initialize a pending job. Created by RenderQueue.submit().
+
+        Args:
+            render_queue (RenderQueue): Queue the job belongs to
+            job_id (int): Sequential id
+            key (str): Coalescing key
+            func (callable): Called as func(job, *args) on a worker thread
+            args (tuple): Extra arguments for func
+        """
+        self.job_id = job_id
+        self.key = key
+        self.status = PENDING
+        self.result = None
+        self.error = None
+        self._queue = render_queue
+        self._func = func
+        self._args = args
+        self._cancel = threading.Event()
+        self._finished = threading.Event()
+
+    @property
+    def cancelled(self):
+        """bool: True once cancellation was requested."""
+        return self._cancel.is_set()
+
+    @property
+    def finished(self):
+        """bool: True once the job is DONE, FAILED or CANCELLED."""
+        return self._finished.is_set()
+
+    def report(self, message):
+        """
+        Publish a progress message for this job.
+
+        Args:
+            message (str): Human-readable progress text
+        """
+        self._queue._emit(self, 'progress', message)
+
+    def cancel(self):
+        """Cancel this job; see RenderQueue.cancel()."""
+        return self._queue.cancel(self)
+
+    def wait(self, timeout=None):
+        """
+        Block until the job has finished.
+
+        Args:
+            timeout (float): Maximum seconds to wait, or None to wait forever
+
+        Returns:
+            bool: True if the job finished within the timeout
+        """
+        return self._finished.wait(timeout)
+
+    def __repr__(self):
+        return f"RenderJob({self.job_id}, {self.key!r}, {self.status})"
+
+
+class RenderQueue:
+    """
+    Thread-safe job queue served by a fixed pool of worker threads.
+
+    Attributes:
+        workers: Number of worker threads
+        events: queue.Queue of (job, kind, message) tuples, where kind is a
+                job state or 'progress'
+    """
+
+    def __init__(self, workers=2):
+        """
+        Initialize an empty queue. No thread is started until first use.
+
+        Args:
+            workers (int): Number of jobs that may run at the same time
+        """
+        self.workers = max(1, workers)
+        self.events = queue.Queue()
+
+        self._lock = threading.Condition()
+        self._pending = OrderedDict()  # key -> waiting job, oldest first
+        self._running = set()
+        self._threads = []
+        self._ids = itertools.count(1)
+        self._closed = False
+
+        atexit.register(self.shutdown)
+
+    @property
+    def pending_count(self):
+        """int: Number of jobs waiting for a worker."""
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def active_count(self):
+        """int: Number of jobs waiting or running."""
+        with self._lock:
+            return len(self._pending) + len(self._running)
+
+    def submit(self, key, func, *args):
+        """
+        Queue a job, replacing any waiting job with the same key.
+
+        Args:
+            key (str): Coalescing key, e.g. the output file path
+            func (callable): Called as func(job, *args) on a worker thread
+            *args: Extra arguments for func
+
+        Returns:
+            RenderJob: The queued job
+
+        Raises:
+            RuntimeError: If the queue is shut down
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Render queue has been shut down")
+
+            replaced = self._pending.pop(key, None)
+            job = RenderJob(self, next(self._ids), key, func, args)
+            self._pending[key] = job
+            # Published before any worker can pick the job up
+            self._emit(job, PENDING, "Queued")
+            if len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, name=f"render-worker-{len(self._threads) + 1}",
+                                          daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._lock.notify()
+
+        if replaced is not None:
+            self._finish(replaced, CANCELLED, "Replaced by a newer request")
+        return job
+
+    def cancel(self, job):
+        """
+        Cancel a job.
+
+        A waiting job is removed at once. A running job is flagged and
+        finishes as CANCELLED when its function returns; the function can
+        check ``job.cancelled`` to stop early.
+
+        Args:
+            job (RenderJob): Job returned by submit()
+
+        Returns:
+            bool: False if the job had already finished
+        """
+        with self._lock:
+            if job.finished:
+                return False
+            job._cancel.set()
+            waiting = self._pending.get(job.key) is job
+            if waiting:
+                del self._pending[job.key]
+
+        if waiting:
+            self._finish(job, CANCELLED, "Cancelled")
+        else:
+            self._emit(job, 'progress', "Cancelling")
+        return True
+
+    def cancel_all(self):
+        """
+        Cancel every waiting and running job.
+
+        Returns:
+            int: Number of jobs cancelled
+        """
+        with self._lock:
+            jobs = list(self._pending.values()) + list(self._running)
+        return sum(1 for job in jobs if self.cancel(job))
+
+    def drain_events(self):
+        """
+        Take every event published since the last call without blocking.
+
+        Returns:
+            list: (job, kind, message) tuples in the order they happened
+        """
+        drained = []
+        while True:
+            try:
+                drained.append(self.events.get_nowait())
+            except queue.Empty:
+                return drained
+
+    def wait_idle(self, timeout=None):
+        """
+        Block until no job is waiting or running.
+
+        Args:
+            timeout (float): Maximum seconds to wait, or None to wait forever
+
+        Returns:
+            bool: True if the queue became idle within the timeout
+        """
+        with self._lock:
+            return self._lock.wait_for(lambda: not self._pending and not self._running, timeout)
+
+    def shutdown(self):
+        """Cancel every job and stop the workers once their current job ends."""
+        atexit.unregister(self.shutdown)
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+        self.cancel_all()
+
+    def _work(self):
+        """Worker thread body: run waiting jobs until the queue shuts down."""
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._lock.wait()
+                if self._closed:
+                    return
+                _, job = self._pending.popitem(last=False)
+                job.status = RUNNING
+                self._running.add(job)
+
+            self._emit(job, RUNNING, "Rendering")
+            try:
+                job.result = job._func(job, *job._args)
+            except Exception as e:
+                job.error = e
+                status, message = FAILED, f"{type(e).__name__}: {e}"
+            else:
+                status, message = (CANCELLED, "Cancelled") if job.cancelled else (DONE, "Done")
+            self._finish(job, status, message)
+
+    def _finish(self, job, status, message):
+        """Record a job's final state, publish it and wake anyone waiting."""
+        job.status = status
+        job._finished.set()
+        self._emit(job, status, message)
+        with self._lock:
+            self._running.discard(job)
+            self._lock.notify_all()
+
+    def _emit(self, job, kind, message):
+        """Publish an event for the GUI thread."""
+        self.events.put((job, kind, message))
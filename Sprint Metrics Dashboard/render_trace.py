@@ -0,0 +1,230 @@
+"""
+Render Trace - Per-Stage Timing and Memory
+==========================================
+
+Records how long each stage of a dashboard render takes and how much
+memory the process holds afterwards, and writes one JSON record per
+render to a metrics file so slow renders can be explained and
+regressions alerted on.
+
+Stages recorded by the app and batch renderer:
+    read_form       reading the Tk variables (app only)
+    generate_html   render cache lookup and template rendering
+    write_html      writing the HTML file
+    chrome_launch   getting a browser session (a cold start or a warm one)
+    page_load       loading the page and waiting for fonts and layout
+    capture         writing every export (screenshots, PDF)
+
+Record format (one JSON object per line):
+    {"render": "dashboard", "started_at": "...", "status": "ok",
+     "total_seconds": 1.23, "context": {...},
+     "stages": [{"name": "page_load", "seconds": 0.41,
+                 "rss_bytes": 81234944, "rss_delta_bytes": 1052672}, ...]}
+
+When tracemalloc is tracing, each stage also records ``py_peak_bytes``,
+the peak Python allocation during the stage; the peak is process-wide,
+so it is only exact when renders do not overlap.
+
+Usage:
+    trace = RenderTrace('dashboard', increment=17)
+    with trace.stage('generate_html'):
+        html = render_dashboard(...)
+    MetricsLog('render_metrics.jsonl').write(trace.finish())
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+
+def current_rss_bytes():
+    """
+    Resident memory of this process.
+
+    Returns:
+        int or None: Bytes currently resident (peak resident size where only
+                     that is available), or None if it cannot be read
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        import resource
+        import sys
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        return None
+
+
+class RenderTrace:
+    """
+    Timing and memory record for one render.
+
+    Attributes:
+        render: Name of what is being rendered, e.g. "dashboard"
+        context: Extra fields saved with the record (increment, sprint, ...)
+        stages: Stage entries in the order they finished
+        status: "ok", or "error" once finish() was given an error
+    """
+
+    def __init__(self, render, **context):
+        """
+        Start a trace.
+
+        Args:
+            render (str): Name of the render
+            **context: JSON-serialisable fields to store with the record
+        """
+        self.render = render
+        self.context = context
+        self.stages = []
+        self.status = 'ok'
+        self.error = None
+        self._started_at = datetime.now().isoformat()
+        self._started = time.perf_counter()
+        self._finished = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time the enclosed block as one stage.
+
+        The stage is recorded even if the block raises, so a failed render
+        still shows where it spent its time.
+
+        Args:
+            name (str): Stage name
+        """
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        rss_before = current_rss_bytes()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            py_peak = tracemalloc.get_traced_memory()[1] if tracing else None
+            self.add(name, time.perf_counter() - started, rss_before, py_peak)
+
+    def add(self, name, seconds, rss_before=None, py_peak=None):
+        """
+        Record a stage that was timed by the caller.
+
+        Args:
+            name (str): Stage name
+            seconds (float): Wall time of the stage
+            rss_before (int): Resident bytes when the stage began, if known
+            py_peak (int): Peak traced Python allocation, if known
+        """
+        rss = current_rss_bytes()
+        entry = {'name': name, 'seconds': round(seconds, 6), 'rss_bytes': rss}
+        if rss is not None and rss_before is not None:
+            entry['rss_delta_bytes'] = rss - rss_before
+        if py_peak is not None:
+            entry['py_peak_bytes'] = py_peak
+        with self._lock:
+            self.stages.append(entry)
+
+    def seconds(self, name):
+        """float: Total seconds recorded for a stage name (0 if never recorded)."""
+        with self._lock:
+            return sum(entry['seconds'] for entry in self.stages if entry['name'] == name)
+
+    def finish(self, error=None):
+        """
+        Close the trace and build its record.
+
+        Args:
+            error (Exception): Error that ended the render, if any
+
+        Returns:
+            dict: The JSON-serialisable record
+        """
+        if self._finished is None:
+            self._finished = time.perf_counter()
+        if error is not None:
+            self.status = 'error'
+            self.error = f"{type(error).__name__}: {error}"
+        return self.record()
+
+    def record(self):
+        """dict: The trace as a JSON-serialisable record."""
+        end = self._finished if self._finished is not None else time.perf_counter()
+        with self._lock:
+            stages = [dict(entry) for entry in self.stages]
+        return {
+            'render': self.render,
+            'started_at': self._started_at,
+            'status': self.status,
+            'error': self.error,
+            'total_seconds': round(end - self._started, 6),
+            'context': self.context,
+            'stages': stages,
+        }
+
+
+def stage(trace, name):
+    """
+    Time a block as a stage of ``trace``, or do nothing when trace is None.
+
+    Lets rendering functions take an optional trace without branching.
+    """
+    return trace.stage(name) if trace is not None else nullcontext()
+
+
+class MetricsLog:
+    """
+    Append-only JSON-lines file of render records, safe to share between threads.
+
+    Attributes:
+        path: File the records are appended to
+    """
+
+    def __init__(self, path):
+        """
+        Initialize the log. The file is created on the first write.
+
+        Args:
+            path (str or Path): Metrics file, e.g. render_metrics.jsonl
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def write(self, record):
+        """
+        Append one record as a single line.
+
+        Args:
+            record (dict): Record from RenderTrace.finish()
+        """
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+    def read(self):
+        """
+        Load every record written so far.
+
+        Returns:
+            list: Records, oldest first; an empty list if the file does not exist
+        """
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
@@ -0,0 +1,119 @@
+"""
+Sparklines - Inline SVG Trends From History
+===========================================
+
+Draws each card's delivered and health values across the sprints before
+the current one as small inline SVG polylines. The charts are plain SVG
+inside the page, so there is no JavaScript, nothing to fetch, and the
+screenshot does not wait for a charting library.
+
+The history is read in a single pass: latest_by_sprint() keeps the most
+recent snapshot of every sprint, and trend_series() takes the sprints
+before the current one from that index. Building the index once lets a
+batch of renders share it.
+
+Usage:
+    index = latest_by_sprint(history)
+    trends = trend_series(index, "17.3", current_metrics)
+    html = render_dashboard(..., trends=trends)
+"""
+
+from bisect import bisect_left
+
+from history_store import sprint_key
+
+
+# Most sprints drawn in one sparkline, including the current sprint
+SPARKLINE_POINTS = 8
+
+# Drawing area in viewBox units; the SVG is stretched to the card width
+VIEW_WIDTH = 100
+VIEW_HEIGHT = 30
+PADDING = 3
+
+# Metrics drawn per card
+TREND_METRICS = ('delivered', 'health')
+
+
+def latest_by_sprint(history):
+    """
+    Index the most recent snapshot of every sprint, in one pass.
+
+    Args:
+        history (iterable): History records in any order
+
+    Returns:
+        list: (sprint key, record) pairs sorted by sprint
+    """
+    latest = {}
+    for record in history:
+        key = sprint_key(record['current_sprint'])
+        seen = latest.get(key)
+        if seen is None or record['timestamp'] >= seen['timestamp']:
+            latest[key] = record
+    return sorted(latest.items(), key=lambda pair: pair[0])
+
+
+def trend_series(index, current_sprint, current_metrics=None, points=SPARKLINE_POINTS):
+    """
+    Collect each category's delivered and health values up to a sprint.
+
+    Args:
+        index (list): Output of latest_by_sprint()
+        current_sprint (str): Sprint being rendered; only earlier sprints
+                              are taken from the history
+        current_metrics (dict): Metric values shown for the current sprint,
+                                appended as the last point; None to end
+                                at the previous sprint
+        points (int): Most values per series
+
+    Returns:
+        dict: {category: {'delivered': [...], 'health': [...]}}, oldest first
+    """
+    # A one-element probe sorts before the (key, record) pair of its own sprint
+    stop = bisect_left(index, (sprint_key(current_sprint),))
+    earlier = points - 1 if current_metrics is not None else points
+    metrics_seen = [record['metrics'] for _, record in index[max(0, stop - earlier):stop]]
+    if current_metrics is not None:
+        metrics_seen.append(current_metrics)
+
+    trends = {}
+    for metrics in metrics_seen:
+        for category, values in metrics.items():
+            series = trends.setdefault(category, {name: [] for name in TREND_METRICS})
+            for name in TREND_METRICS:
+                series[name].append(values[name])
+    return trends
+
+
+def render_sparkline(values, label):
+    """
+    Draw one series as an inline SVG polyline.
+
+    The line spans the series' own minimum to maximum; a flat series is
+    drawn through the middle.
+
+    Args:
+        values (list): Numbers, oldest first
+        label (str): Accessible description of the chart
+
+    Returns:
+        str: <svg> element, or an empty string for fewer than two values
+    """
+    if len(values) < 2:
+        return ''
+    low, high = min(values), max(values)
+    span = high - low
+    step = (VIEW_WIDTH - 2 * PADDING) / (len(values) - 1)
+    usable = VIEW_HEIGHT - 2 * PADDING
+    coordinates = ' '.join(
+        f"{PADDING + i * step:.1f},"
+        f"{PADDING + (usable * (1 - (value - low) / span) if span else usable / 2):.1f}"
+        for i, value in enumerate(values)
+    )
+    return (
+        f'<svg class="sparkline" viewBox="0 0 {VIEW_WIDTH} {VIEW_HEIGHT}" preserveAspectRatio="none" '
+        f'role="img" aria-label="{label}" xmlns="http://www.w3.org/2000/svg">'
+        f'<polyline points="{coordinates}" fill="none" stroke="currentColor" stroke-width="3" '
+        f'stroke-linejoin="round" stroke-linecap="round" vector-effect="non-scaling-stroke"/></svg>'
+    )
@@ -25,21 +25,53 @@ Features:
     - Enter metrics for 4 categories
     - Save and load historical data
     - Generate professional HTML dashboards
-    - Generate PNG images from HTML
+    - Generate PNG, JPEG, WebP, thumbnail and PDF exports from one page load
     - Persistent storage using JSON
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import json
-import os
 from datetime import datetime
 from pathlib import Path
-import unittest
-from unittest.mock import Mock, patch, MagicMock
 import threading
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+import time
+
+from browser_pool import BrowserPool
+from dashboard_export import PNG, RENDER_READY_TIMEOUT, export_dashboard, parse_exports
+from dashboard_template import render_dashboard, template_version
+from font_embed import FONT_DIR, EmbeddedFont
+from history_store import SqliteHistoryStore, open_history_store
+from render_cache import RenderCache, render_key
+from render_queue import CANCELLED, DONE, FAILED, RenderQueue
+from render_trace import MetricsLog, RenderTrace
+from sparklines import latest_by_sprint, trend_series
+
+
+# Number of history rows added to the history list per scroll page
+HISTORY_PAGE_SIZE = 200
+
+# Milliseconds between checks for the background history load to finish
+HISTORY_POLL_MS = 50
+
+# History button labels while the history is loading and once it is ready
+HISTORY_LOADING_TEXT = "⏳ Loading History..."
+HISTORY_READY_TEXT = "📜 View History"
+
+# Seconds a whole render may take before its browser is killed
+RENDER_TIMEOUT = 60.0
+
+# Milliseconds between checks of the render queue for progress and results
+RENDER_POLL_MS = 100
+
+# Export formats offered as check boxes: (spec, label); see dashboard_export
+EXPORT_CHOICES = (
+    ('png', 'PNG'),
+    ('png@2x', 'PNG 2x'),
+    ('jpeg', 'JPEG'),
+    ('webp', 'WebP'),
+    ('thumbnail', 'Thumbnail'),
+    ('pdf', 'PDF'),
+)
 
 
 class SprintMetricsApp:
@@ -51,20 +83,30 @@ class SprintMetricsApp:
     
     Attributes:
         root: The main tkinter window
-        history_file: Path to JSON file storing historical data
-        history: List of previous metric records
+        history_file: Path to the history file; records are kept in an
+                      append-only log next to it, or in SQLite for .db paths
+                      (see history_store)
+        history: List of previous metric records, oldest first; filled in
+                 by a background load shortly after start-up. With a SQLite
+                 history it only holds the latest snapshot of each sprint
+                 (all that trends and forecasts read), and the history
+                 window pages the rest from the database
+        history_loaded: True once the background history load has finished
         increment: Current increment number (e.g., 17)
         current_sprint: Current sprint identifier (e.g., "17.1")
         sprint_range: Display range for sprints (e.g., "17.1 - 17.1")
         metrics: Dictionary storing all metric values for four categories
     """
     
-    def __init__(self, root):
+    def __init__(self, root, history_file="sprint_history.json", render_cache_dir=".render_cache"):
         """
         Initialize the Sprint Metrics Application.
         
         Args:
             root: tkinter.Tk() root window instance
+            history_file (str): History file; a .db/.sqlite path selects the
+                                SQLite history backend
+            render_cache_dir (str): Directory of the render cache
         """
         self.root = root
         self.root.title("Sprint Metrics Dashboard Generator")
@@ -72,8 +114,57 @@ class SprintMetricsApp:
         self.root.configure(bg="#f8f9fa")
         
         # Initialize data storage path - stores history in same directory as script
-        self.history_file = Path("sprint_history.json")
-        self.history = self.load_history()
+        self.history_file = Path(history_file)
+        self._history_store = None
+        
+        # History is read on a background thread once the window is built
+        # (see start_history_load), so start-up does not depend on its size
+        self.history = []
+        self.history_loaded = False
+        self._history_thread = None
+        self._history_result = None
+        
+        # NumPy cube over the history for forecasts, built on a background
+        # thread (see start_cube_build) and kept current as snapshots are saved
+        self._metrics_cube = None
+        self._cube_thread = None
+        
+        # Warm pool of headless Chrome sessions reused across PNG renders;
+        # hung browsers and those left by crashed runs are reaped
+        self.browser_pool = BrowserPool(size=2, max_renders=50, render_timeout=RENDER_TIMEOUT)
+        self.render_ready_timeout = RENDER_READY_TIMEOUT
+        self.last_ready_seconds = None
+        
+        # Renders run on a fixed set of workers, one per browser session.
+        # Workers never touch Tk; their events are handled on the Tk thread
+        # by _poll_render_queue().
+        self.render_queue = RenderQueue(workers=self.browser_pool.size)
+        self._render_poll_id = None
+        self.render_status = tk.StringVar(value="")  # Latest render progress message
+        
+        # Export formats written next to the HTML, all from one page load
+        self.export_formats = {
+            spec: tk.BooleanVar(value=spec == 'png') for spec, _ in EXPORT_CHOICES
+        }
+        
+        # Draw delivered/health sparklines from the history into each card
+        self.show_trends = tk.BooleanVar(value=False)
+        
+        # Show Monte Carlo P50/P85 completion sprints in each card; ticking
+        # it starts building the metrics cube the forecast reads
+        self.show_forecast = tk.BooleanVar(value=False)
+        self.show_forecast.trace_add("write", lambda *args: self._on_forecast_toggled())
+        
+        # Per-stage timings of the last render, and where to append them
+        # (one JSON line per render); None keeps them in memory only
+        self.last_trace = None
+        self.metrics_log = None
+        
+        # Font inlined into generated HTML (see font_embed); None uses system fonts
+        self.embedded_font = None
+        
+        # Content-addressed cache of previously rendered dashboards
+        self.render_cache = RenderCache(Path(render_cache_dir))
         
         # Initialize default configuration values
         self.increment = tk.IntVar(value=17)  # Current increment number
@@ -110,6 +201,9 @@ class SprintMetricsApp:
         
         # Populate sprint dropdown with current increment values
         self.update_sprint_dropdown()
+        
+        # Read the history in the background; the form is usable meanwhile
+        self.start_history_load()
     
     def setup_ui(self):
         """
@@ -314,10 +408,10 @@ class SprintMetricsApp:
         button_frame = tk.Frame(main_container, bg="#f8f9fa")
         button_frame.pack(fill=tk.X)
         
-        # View History Button
-        tk.Button(
+        # View History Button - disabled while the history is loading
+        self.history_button = tk.Button(
             button_frame,
-            text="📜 View History",
+            text=HISTORY_READY_TEXT,
             font=("Inter", 11, "bold"),
             bg="#6c757d",
             fg="white",
@@ -325,7 +419,8 @@ class SprintMetricsApp:
             pady=10,
             command=self.show_history,
             cursor="hand2"
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.history_button.pack(side=tk.LEFT, padx=5)
         
         # Save to History Button
         tk.Button(
@@ -352,6 +447,49 @@ class SprintMetricsApp:
             command=self.generate_files,
             cursor="hand2"
         ).pack(side=tk.LEFT, padx=5)
+        
+        # Export format check boxes, next to the generate button
+        export_frame = tk.Frame(button_frame, bg="#f8f9fa")
+        export_frame.pack(side=tk.LEFT, padx=10)
+        for spec, label in EXPORT_CHOICES:
+            tk.Checkbutton(
+                export_frame,
+                text=label,
+                variable=self.export_formats[spec],
+                font=("Inter", 9),
+                bg="#f8f9fa"
+            ).pack(side=tk.LEFT)
+        tk.Checkbutton(
+            export_frame,
+            text="Trends",
+            variable=self.show_trends,
+            font=("Inter", 9),
+            bg="#f8f9fa"
+        ).pack(side=tk.LEFT, padx=(10, 0))
+        tk.Checkbutton(
+            export_frame,
+            text="Forecast",
+            variable=self.show_forecast,
+            font=("Inter", 9),
+            bg="#f8f9fa"
+        ).pack(side=tk.LEFT)
+        
+        # Render progress and a button to cancel queued/running renders
+        tk.Button(
+            button_frame,
+            text="✖ Cancel",
+            font=("Inter", 9),
+            command=self.cancel_renders,
+            cursor="hand2"
+        ).pack(side=tk.RIGHT, padx=5)
+        
+        tk.Label(
+            button_frame,
+            textvariable=self.render_status,
+            font=("Inter", 9),
+            bg="#f8f9fa",
+            fg="#6c757d"
+        ).pack(side=tk.RIGHT, padx=5)
     
     def update_sprint_dropdown(self):
         """
@@ -368,32 +506,183 @@ class SprintMetricsApp:
         if self.current_sprint.get() not in sprints:
             self.current_sprint.set(sprints[0])
     
+    def history_store(self):
+        """
+        Get the store backing the current history file.
+        
+        Returns:
+            HistoryLog or SqliteHistoryStore: Store for self.history_file,
+            reopened if the path changed
+        """
+        if self._history_store is None or self._history_store.path != self.history_file:
+            self._history_store = open_history_store(self.history_file)
+        return self._history_store
+    
     def load_history(self):
         """
-        Load historical data from JSON file.
+        Load historical data from the history store.
+        
+        Only reads the files; a legacy JSON history file is migrated to the
+        log by the start-up load (see start_history_load).
         
         Returns:
-            list: List of historical records, or empty list if file doesn't exist
-                  or contains invalid data
+            list: List of historical records (oldest first), or empty list if
+                  no history exists or it cannot be read
         """
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                # Return empty list if file is corrupted or unreadable
-                return []
-        return []
+        try:
+            return self.history_store().load()
+        except IOError:
+            # Return empty list if the log is unreadable
+            return []
+    
+    def start_history_load(self):
+        """
+        Load the history on a background thread.
+        
+        The History button shows a loading state until the records are
+        ready. The worker never touches Tk; _poll_history_load() applies
+        its result on the Tk thread.
+        """
+        store = self.history_store()
+        self.history_loaded = False
+        self._history_result = None
+        self.history_button.config(text=HISTORY_LOADING_TEXT, state=tk.DISABLED, cursor="watch")
+        
+        self._history_thread = threading.Thread(
+            target=self._load_history_worker, args=(store,), name="history-load", daemon=True
+        )
+        self._history_thread.start()
+        self.root.after(HISTORY_POLL_MS, self._poll_history_load)
+    
+    def _load_history_worker(self, store):
+        """Read the history from the store (runs on the history-load thread)."""
+        try:
+            if isinstance(store, SqliteHistoryStore):
+                records = store.latest_per_sprint()
+            else:
+                # The one place a legacy JSON history becomes the log
+                records = store.load(migrate=True)
+            self._history_result = (store, records, None)
+        except Exception as e:
+            self._history_result = (store, [], e)
+    
+    def _poll_history_load(self):
+        """Apply the background history load on the Tk thread once it has finished."""
+        thread = self._history_thread
+        if thread is None:
+            return
+        if thread.is_alive():
+            self.root.after(HISTORY_POLL_MS, self._poll_history_load)
+            return
+        
+        self._history_thread = None
+        store, records, error = self._history_result
+        self._history_result = None
+        if store.path == self.history_file:
+            # Keep snapshots saved while the load was running; the load may
+            # or may not have read them already
+            loaded_ids = {record.get('id') for record in records}
+            saved_meanwhile = [record for record in self.history if record.get('id') not in loaded_ids]
+            self.history = records + saved_meanwhile
+        
+        self.history_loaded = True
+        self.history_button.config(text=HISTORY_READY_TEXT, state=tk.NORMAL, cursor="hand2")
+        if error is not None:
+            self.render_status.set(f"Could not load history: {error}")
+        self._invalidate_metrics_cube()
+    
+    def metrics_cube(self):
+        """
+        Get the columnar metrics cube over the history.
+        
+        Built from self.history right here if no background build has
+        handed one over yet (NumPy is only imported then), and updated in
+        place by save_to_history(). The UI only asks for it once
+        _poll_cube_build() has delivered it.
+        
+        Returns:
+            MetricsCube: Latest-per-sprint cube and snapshot columns
+        """
+        if self._metrics_cube is None:
+            from metrics_cube import MetricsCube
+            self._metrics_cube = MetricsCube.from_records(self.history)
+            self._cube_thread = None
+        return self._metrics_cube
+    
+    def start_cube_build(self):
+        """
+        Build the metrics cube on a background thread.
+        
+        Building takes over a second for a hundred thousand snapshots, so
+        it is kept off the Tk thread; _poll_cube_build() hands the cube
+        over. A build that is still running is superseded.
+        """
+        records = list(self.history)
+        result = []
+        self._metrics_cube = None
+        self._cube_thread = threading.Thread(
+            target=self._build_cube_worker, args=(records, result), name="metrics-cube", daemon=True
+        )
+        self._cube_thread.start()
+        self.root.after(HISTORY_POLL_MS, self._poll_cube_build, self._cube_thread, len(records), result)
+    
+    def _build_cube_worker(self, records, result):
+        """Build a cube over the records (runs on the metrics-cube thread)."""
+        try:
+            from metrics_cube import MetricsCube
+            result.append((MetricsCube.from_records(records), None))
+        except Exception as e:
+            result.append((None, e))
+    
+    def _poll_cube_build(self, thread, count, result):
+        """
+        Hand a finished background cube build over on the Tk thread.
+        
+        Args:
+            thread (threading.Thread): The build being waited for
+            count (int): Records of self.history the build started from
+            result (list): Filled with (cube, error) by the worker
+        """
+        if thread is not self._cube_thread:
+            return  # Superseded by a newer build or by metrics_cube()
+        if thread.is_alive():
+            self.root.after(HISTORY_POLL_MS, self._poll_cube_build, thread, count, result)
+            return
+        
+        self._cube_thread = None
+        cube, error = result[0]
+        if error is not None:
+            self.render_status.set(f"Could not prepare the forecast: {error}")
+            return
+        # Snapshots saved during the build were only appended to the list
+        for record in self.history[count:]:
+            cube.append(record)
+        self._metrics_cube = cube
+    
+    def _invalidate_metrics_cube(self):
+        """Drop the cube after the history changed; rebuild it if the forecast is on."""
+        self._metrics_cube = None
+        self._cube_thread = None
+        if self.show_forecast.get() and self.history_loaded:
+            self.start_cube_build()
+    
+    def _on_forecast_toggled(self):
+        """Start building the cube as soon as the forecast is ticked."""
+        if (self.show_forecast.get() and self.history_loaded
+                and self._metrics_cube is None and self._cube_thread is None):
+            self.start_cube_build()
     
     def save_history(self):
         """
-        Save current history list to JSON file.
+        Rewrite the history log from the current history list.
         
-        Persists all historical records to disk for future sessions.
-        Uses pretty-printing (indent=2) for human readability.
+        Everyday saves and deletes append to the log instead; this full
+        rewrite is only needed after the list has been replaced wholesale.
+        Not for a SQLite history, where the list is only the latest
+        snapshot of each sprint.
         """
-        with open(self.history_file, 'w') as f:
-            json.dump(self.history, f, indent=2)
+        self.history_store().rewrite(self.history)
+        self._invalidate_metrics_cube()
     
     def save_to_history(self):
         """
@@ -422,9 +711,11 @@ class SprintMetricsApp:
             'timestamp': datetime.now().isoformat()
         }
         
-        # Add to beginning of history list (most recent first)
-        self.history.insert(0, record)
-        self.save_history()
+        # Append to the log and the end of the history list (oldest first)
+        self.history_store().append(record)
+        self.history.append(record)
+        if self._metrics_cube is not None:
+            self._metrics_cube.append(record)
         
         messagebox.showinfo("Success", "Metrics saved to history!")
     
@@ -432,13 +723,23 @@ class SprintMetricsApp:
         """
         Display history records in a new window.
         
-        Creates a scrollable list of all saved records with options to:
+        Shows the records in a virtualized list (most recent first) with
+        options to:
         - Load a previous configuration
         - Delete a record
         
+        Rows are added a page at a time as the user scrolls towards the end
+        of the list, so the window opens instantly even for very large
+        histories. A SQLite history is paged straight from the database.
+        
         Shows informative message if no history exists.
         """
-        if not self.history:
+        if not self.history_loaded:
+            messagebox.showinfo("History", "History is still loading.")
+            return
+        store = self.history_store()
+        paged = isinstance(store, SqliteHistoryStore)
+        if not (store.count() if paged else self.history):
             messagebox.showinfo("History", "No history records found.")
             return
         
@@ -453,65 +754,126 @@ class SprintMetricsApp:
             font=("Inter", 14, "bold")
         ).pack(pady=10)
         
-        # Create scrollable frame for history list
-        canvas = tk.Canvas(history_window)
-        scrollbar = ttk.Scrollbar(history_window, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas)
+        # Load and Delete act on the selected row
+        button_frame = tk.Frame(history_window)
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
         
-        # Configure scrolling behavior
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        # Treeview only draws the rows that are visible in the window
+        list_frame = tk.Frame(history_window)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=10)
+        
+        tree = ttk.Treeview(
+            list_frame,
+            columns=("increment", "sprint", "saved"),
+            show="headings",
+            selectmode="browse"
         )
+        tree.heading("increment", text="Increment")
+        tree.heading("sprint", text="Sprint")
+        tree.heading("saved", text="Saved")
+        tree.column("increment", width=100, anchor="center")
+        tree.column("sprint", width=100, anchor="center")
+        tree.column("saved", width=300)
+        
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=tree.yview)
+        
+        # Row id -> record for the rows paged in so far
+        rows = {}
+        # Index in self.history of the next (older) record to page in, or
+        # for SQLite the number of database records paged in; -1 once
+        # every record is shown
+        next_index = [0 if paged else len(self.history) - 1]
+        
+        def older_records():
+            if paged:
+                records = store.query(newest_first=True, limit=HISTORY_PAGE_SIZE, offset=next_index[0])
+                next_index[0] = next_index[0] + len(records) if len(records) == HISTORY_PAGE_SIZE else -1
+                # A snapshot saved since the window opened shifts the
+                # pages by one; skip the record that repeats
+                shown = {record['id'] for record in rows.values()}
+                return [record for record in records if record['id'] not in shown]
+            stop = max(-1, next_index[0] - HISTORY_PAGE_SIZE)
+            records = [self.history[idx] for idx in range(next_index[0], stop, -1)]
+            next_index[0] = stop
+            return records
+        
+        def page_in():
+            for record in older_records():
+                row_id = tree.insert("", tk.END, values=self._history_row_values(record))
+                rows[row_id] = record
+        
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            # Page in older records once the user nears the end of the list
+            if float(last) > 0.9 and next_index[0] >= 0:
+                page_in()
+        
+        def selected():
+            selection = tree.selection()
+            return (selection[0], rows[selection[0]]) if selection else (None, None)
+        
+        def load_selected(event=None):
+            row_id, record = selected()
+            if record is not None:
+                self.load_from_history(record, history_window)
+        
+        def delete_selected():
+            row_id, record = selected()
+            if record is None:
+                return
+            if paged:
+                if self.delete_stored_record(record, tree, row_id):
+                    del rows[row_id]
+                    # Later pages move up by the deleted record
+                    if next_index[0] > 0:
+                        next_index[0] -= 1
+                return
+            # Identity search: equal-looking snapshots may exist more than once
+            index = next(i for i in range(len(self.history)) if self.history[i] is record)
+            if self.delete_history_item(index, tree, row_id):
+                del rows[row_id]
+        
+        tree.configure(yscrollcommand=on_scroll)
+        tree.bind("<Double-1>", load_selected)
+        page_in()
+        
+        # Load button - restores the selected configuration
+        tk.Button(
+            button_frame,
+            text="Load",
+            command=load_selected,
+            bg="#007bff",
+            fg="white",
+            cursor="hand2"
+        ).pack(side=tk.RIGHT, padx=5)
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Create record entry for each history item
-        for idx, record in enumerate(self.history):
-            record_frame = tk.Frame(
-                scrollable_frame,
-                relief=tk.RAISED,
-                bd=2,
-                padx=10,
-                pady=10
-            )
-            record_frame.pack(fill=tk.X, padx=10, pady=5)
-            
-            # Format display text with increment, sprint, and timestamp
-            info_text = f"Increment {record['increment']} - Sprint {record['current_sprint']}\n"
-            info_text += f"{datetime.fromisoformat(record['timestamp']).strftime('%Y-%m-%d %H:%M:%S')}"
-            
-            tk.Label(
-                record_frame,
-                text=info_text,
-                font=("Inter", 10)
-            ).pack(side=tk.LEFT)
-            
-            # Load button - restores this configuration
-            tk.Button(
-                record_frame,
-                text="Load",
-                command=lambda r=record: self.load_from_history(r, history_window),
-                bg="#007bff",
-                fg="white",
-                cursor="hand2"
-            ).pack(side=tk.RIGHT, padx=5)
-            
-            # Delete button - removes this record
-            tk.Button(
-                record_frame,
-                text="Delete",
-                command=lambda i=idx: self.delete_history_item(i, history_window),
-                bg="#dc3545",
-                fg="white",
-                cursor="hand2"
-            ).pack(side=tk.RIGHT)
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
+        # Delete button - removes the selected record
+        tk.Button(
+            button_frame,
+            text="Delete",
+            command=delete_selected,
+            bg="#dc3545",
+            fg="white",
+            cursor="hand2"
+        ).pack(side=tk.RIGHT)
+        
+        # Pack list and scrollbar
+        tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
     
+    def _history_row_values(self, record):
+        """
+        Format a history record for one row of the history list.
+        
+        Args:
+            record (dict): Historical record
+        
+        Returns:
+            tuple: (increment, sprint, saved timestamp) display values
+        """
+        saved = datetime.fromisoformat(record['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
+        return record['increment'], record['current_sprint'], saved
+    
     def load_from_history(self, record, window):
         """
         Load a historical configuration into the current form.
@@ -541,55 +903,126 @@ class SprintMetricsApp:
         window.destroy()
         messagebox.showinfo("Success", "Configuration loaded from history!")
     
-    def delete_history_item(self, index, window):
+    def delete_history_item(self, index, tree=None, row_id=None):
         """
         Delete a history record after user confirmation.
         
         Args:
             index (int): Index of record to delete in history list
-            window (tk.Toplevel): History window to refresh after deletion
+            tree (ttk.Treeview): History list to remove the row from, if open
+            row_id (str): Row of the record in the history list
+        
+        Returns:
+            bool: True if the record was deleted
         """
-        if messagebox.askyesno("Confirm", "Delete this history record?"):
-            self.history.pop(index)
+        if not messagebox.askyesno("Confirm", "Delete this history record?"):
+            return False
+        
+        record = self.history.pop(index)
+        # The cube cannot drop a snapshot in place; rebuild it
+        self._invalidate_metrics_cube()
+        if 'id' in record:
+            self.history_store().delete(record['id'])
+        else:
             self.save_history()
-            window.destroy()
-            # Reopen history window to show updated list
-            self.show_history()
+        
+        # Remove just this row instead of rebuilding the whole window
+        if tree is not None and row_id is not None:
+            tree.delete(row_id)
+        return True
+    
+    def delete_stored_record(self, record, tree=None, row_id=None):
+        """
+        Delete a record of a SQLite history after user confirmation.
+        
+        self.history only holds the latest snapshot of each sprint here, so
+        the sprint's latest snapshot is read back from the database.
+        
+        Args:
+            record (dict): Record to delete, as paged in from the database
+            tree (ttk.Treeview): History list to remove the row from, if open
+            row_id (str): Row of the record in the history list
+        
+        Returns:
+            bool: True if the record was deleted
+        """
+        if not messagebox.askyesno("Confirm", "Delete this history record?"):
+            return False
+        
+        store = self.history_store()
+        store.delete(record['id'])
+        sprint = record['current_sprint']
+        self.history = [r for r in self.history if r['current_sprint'] != sprint]
+        self.history.extend(store.query(from_sprint=sprint, to_sprint=sprint, latest=True))
+        self._invalidate_metrics_cube()
+        
+        if tree is not None and row_id is not None:
+            tree.delete(row_id)
+        return True
     
     def generate_files(self):
         """
-        Generate HTML dashboard and a PNG image, and prompt user to save them.
+        Generate HTML dashboard and the selected image/PDF exports, and
+        prompt user to save them.
         
-        Creates a complete HTML file and a PNG image with:
+        Creates a complete HTML file and, next to it, one file per checked
+        export format (PNG by default) with:
         - Current increment and sprint information
         - All metrics from the four categories
         - Professional styling matching the original design
         
         Opens a file save dialog for the user to choose location and filename.
-        """
-        inc = self.increment.get()
-        sprints = [f"{inc}.{i}" for i in range(1, 7)]
-        current = self.current_sprint.get()
-        
-        # Extract current metrics into plain dictionary
-        metrics_data = {
-            key: {
-                'delivered': var['delivered'].get(),
-                'total': var['total'].get(),
-                'health': var['health'].get()
-            }
-            for key, var in self.metrics.items()
-        }
+        Each stage is timed into a RenderTrace (see render_trace), which is
+        written to the metrics file once the exports finish.
         
-        # Generate HTML content
-        html = self._generate_html_content(inc, current, sprints, metrics_data)
+        With the forecast ticked, nothing is generated until the background
+        cube build (see start_cube_build) has finished.
+        """
+        if self.show_forecast.get() and self._metrics_cube is None:
+            if self.history_loaded and self._cube_thread is None:
+                self.start_cube_build()
+            messagebox.showinfo("Forecast", "The forecast is still being prepared. Try again in a moment.")
+            return
         
-        # Prompt user for save location
-        filename = filedialog.asksaveasfilename(
-            defaultextension=".html",
-            filetypes=[("HTML files", "*.html"), ("PNG files", "*.png")],
-            initialfile=f"sprint-dashboard-{inc}-{current}.html"
-        )
+        trace = RenderTrace('dashboard')
+        with trace.stage('read_form'):
+            inc = self.increment.get()
+            sprints = [f"{inc}.{i}" for i in range(1, 7)]
+            current = self.current_sprint.get()
+            
+            # Extract current metrics into plain dictionary
+            metrics_data = {
+                key: {
+                    'delivered': var['delivered'].get(),
+                    'total': var['total'].get(),
+                    'health': var['health'].get()
+                }
+                for key, var in self.metrics.items()
+            }
+            sprint_range = self.sprint_range.get()
+        trace.context.update(increment=inc, sprint=current)
+        
+        # Reuse the stored render when nothing that affects the output changed
+        with trace.stage('generate_html'):
+            trends = self.trend_data(current, metrics_data) if self.show_trends.get() else None
+            forecast = None
+            if self.show_forecast.get():
+                forecast = self.forecast_data(current, sprints, metrics_data)
+            cache_key = render_key(inc, current, sprints, metrics_data,
+                                   sprint_range, template_version(self.embedded_font), trends, forecast)
+            html = self.render_cache.get_html(cache_key)
+            trace.context['html_cached'] = html is not None
+            if html is None:
+                html = self._generate_html_content(inc, current, sprints, metrics_data, trends, forecast)
+                self.render_cache.put_html(cache_key, html)
+        
+        # Prompt user for save location (timed so the stages add up to the total)
+        with trace.stage('save_dialog'):
+            filename = filedialog.asksaveasfilename(
+                defaultextension=".html",
+                filetypes=[("HTML files", "*.html"), ("PNG files", "*.png")],
+                initialfile=f"sprint-dashboard-{inc}-{current}.html"
+            )
         
         if filename:
             # Ensure the filename has the correct extension
@@ -597,671 +1030,216 @@ class SprintMetricsApp:
                 filename += ".html"
 
             # Write HTML to selected file
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html)
+            with trace.stage('write_html'):
+                with open(filename, 'w', encoding='utf-8') as f:
+                    f.write(html)
             
-            # Generate image in a separate thread
-            image_filename = filename.replace(".html", ".png")
-            thread = threading.Thread(target=self._generate_image_in_thread, args=(filename, image_filename))
-            thread.start()
+            # Serve the PNG from cache, then queue the remaining exports for
+            # one page load. A click while the same file is still waiting
+            # replaces that job instead of queueing another render.
+            targets = self.selected_exports()
+            if PNG in targets and self.render_cache.copy_png(cache_key, filename[:-5] + PNG.suffix):
+                targets.remove(PNG)
+                trace.context['png_cached'] = True
+            if not targets:
+                self._record_trace(trace)
+                return
+            self.render_queue.submit(filename, self._render_exports, filename, targets, cache_key, trace)
+            self._watch_render_queue()
+
+    def selected_exports(self):
+        """
+        Get the export formats currently checked in the UI.
+        
+        Returns:
+            list: ExportTarget objects in EXPORT_CHOICES order
+        """
+        return parse_exports(spec for spec, _ in EXPORT_CHOICES if self.export_formats[spec].get())
 
-    def _generate_image_in_thread(self, html_path, image_path):
+    def cancel_renders(self):
+        """Cancel every queued render and ask running renders to stop."""
+        if self.render_queue.cancel_all():
+            self.render_status.set("Cancelling...")
+            self._watch_render_queue()
+
+    def _render_exports(self, job, html_path, targets, cache_key=None, trace=None):
         """
-        Generate a PNG image from an HTML file.
+        Render queue job: write every requested export from one page load.
+        
+        Runs on a render worker thread, so it must not touch Tk; errors are
+        raised and reported on the Tk thread by _poll_render_queue().
         
         Args:
+            job (RenderJob): The running job, for progress and cancellation
             html_path (str): Path to the input HTML file.
-            image_path (str): Path to save the output PNG image.
+            targets (list): ExportTarget objects; files are named after html_path
+            cache_key (str): Render cache key to store the PNG under, if any
+            trace (RenderTrace): Trace to add the browser stages to and record
+        
+        Returns:
+            dict: Export spec -> written path, or None if cancelled before starting
         """
+        job.report(f"Rendering {Path(html_path).name}...")
         try:
-            self._generate_image_from_html(html_path, image_path)
+            # Borrow a warm browser session; it is returned (or recycled) on exit
+            started = time.perf_counter()
+            with self.browser_pool.session() as driver:
+                if trace is not None:
+                    trace.add('chrome_launch', time.perf_counter() - started)
+                if job.cancelled:
+                    if trace is not None:
+                        trace.status = 'cancelled'
+                    self._record_trace(trace)
+                    return None
+                outputs, self.last_ready_seconds = export_dashboard(
+                    driver, html_path, targets, ready_timeout=self.render_ready_timeout, trace=trace
+                )
+            if cache_key and PNG.spec in outputs:
+                self.render_cache.put_png(cache_key, outputs[PNG.spec])
         except Exception as e:
-            print(f"Could not generate image: {e}")
-
+            self._record_trace(trace, e)
+            raise
+        if trace is not None:
+            # Browser process counts go to the metrics log with the timings
+            browsers = self.browser_pool.lifecycle.stats()
+            trace.context.update(browsers_live=browsers['live'], browsers_reaped=browsers['reaped'])
+        self._record_trace(trace)
+        return outputs
 
-    def _generate_image_from_html(self, html_path, image_path):
+    def _record_trace(self, trace, error=None):
         """
-        Generate a PNG image from an HTML file.
+        Finish a render trace and append it to the metrics file, if one is set.
         
         Args:
-            html_path (str): Path to the input HTML file.
-            image_path (str): Path to save the output PNG image.
+            trace (RenderTrace): Trace of the render, or None
+            error (Exception): Error that ended the render, if any
         """
-        try:
-            options = Options()
-            options.add_argument('--headless')
-            options.add_argument('--disable-gpu')
+        if trace is None:
+            return
+        self.last_trace = trace.finish(error)
+        if self.metrics_log is not None:
+            self.metrics_log.write(self.last_trace)
 
-            driver = webdriver.Chrome(options=options)
-            
-            # Get the absolute path to the HTML file
-            abs_html_path = os.path.abspath(html_path)
-            driver.get(f"file://{abs_html_path}")
-            
-            # Give the browser a moment to render
-            driver.implicitly_wait(2)
+    def _watch_render_queue(self):
+        """Start polling the render queue from the Tk main loop if not already."""
+        if self._render_poll_id is None:
+            self._render_poll_id = self.root.after(RENDER_POLL_MS, self._poll_render_queue)
 
-            # Get the height of the container element
-            total_height = driver.execute_script("return document.querySelector('.container').scrollHeight")
-            
-            # Set the window size to capture the full height
-            driver.set_window_size(1400, total_height)
-            
-            # Take a screenshot of the container element
-            driver.find_element("class name", "container").screenshot(image_path)
-            
-            driver.quit()
-        except Exception as e:
-            messagebox.showerror("Image Generation Error", f"Could not generate image: {e}")
+    def _poll_render_queue(self):
+        """
+        Apply render queue events on the Tk thread.
+        
+        Updates the status line, reports failures, and keeps polling
+        while jobs are waiting or running.
+        """
+        self._render_poll_id = None
+        # Read before draining: a job finishing in between has already
+        # published its final event, so nothing is left behind
+        active = self.render_queue.active_count
+        for job, kind, message in self.render_queue.drain_events():
+            name = Path(job.key).name
+            if kind == DONE:
+                self.render_status.set(f"Saved {len(job.result or ())} export(s) for {name}")
+            elif kind == FAILED:
+                self.render_status.set(f"Render failed: {name}")
+                messagebox.showerror("Image Generation Error", f"Could not generate image: {job.error}")
+            elif kind == CANCELLED:
+                self.render_status.set(f"{message}: {name}")
+            else:
+                self.render_status.set(message)
+        if active:
+            self._watch_render_queue()
 
+    def trend_data(self, current_sprint, metrics):
+        """
+        Collect the sparkline values for each card from the history.
+        
+        Reads the history once, taking the latest snapshot of every sprint
+        before the current one, and ends each series with the form's values.
+        
+        Args:
+            current_sprint (str): Sprint being rendered
+            metrics (dict): Current metric values
+        
+        Returns:
+            dict: {category: {'delivered': [...], 'health': [...]}}
+        """
+        return trend_series(latest_by_sprint(self.history), current_sprint, metrics)
     
-    def _generate_html_content(self, increment, current_sprint, sprints, metrics):
+    def forecast_data(self, current_sprint, sprints, metrics):
+        """
+        Forecast each card's completion sprint from the history.
+        
+        Runs the Monte Carlo simulation in forecast over the per-sprint
+        throughput in metrics_cube() (NumPy is only imported then).
+        generate_files() only calls it once the background build has
+        handed the cube over.
+        
+        Args:
+            current_sprint (str): Sprint being rendered
+            sprints (list): Sprint identifiers of the increment
+            metrics (dict): Current metric values
+        
+        Returns:
+            dict: {category: {'remaining', 'p50', 'p85', 'due', 'on_time'}}
+        """
+        from forecast import forecast_completion
+        return forecast_completion(self.metrics_cube(), current_sprint, sprints, metrics)
+    
+    def _generate_html_content(self, increment, current_sprint, sprints, metrics, trends=None,
+                               forecast=None):
         """
         Generate complete HTML content for the dashboard.
         
+        Uses the sprint range currently entered in the form; see
+        dashboard_template.render_dashboard() for the Tk-free renderer.
+        
         Args:
             increment (int): Current increment number
             current_sprint (str): Active sprint identifier
             sprints (list): List of all sprint identifiers for progress bar
             metrics (dict): Dictionary containing all metric values
+            trends (dict): Sparkline values from trend_data(), or None for
+                           cards without sparklines
+            forecast (dict): Completion forecast from forecast_data(), or
+                             None for cards without one
         
         Returns:
             str: Complete HTML document as string
-        
-        The generated HTML includes:
-        - Inter font from Google Fonts
-        - Exact color scheme matching original design
-        - Responsive grid layout for cards
-        - Progress bar with active sprint indicator
-        - All metric values properly formatted
         """
-        sprint_range = self.sprint_range.get()
-        
-        # Generate progress bar HTML segments
-        progress_html = ''.join([
-            f'<div class="progress-item {"active" if s == current_sprint else ""}">{s}</div>'
-            for s in sprints
-        ])
-        
-        # Return complete HTML document
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Digital Technology - Increment {increment}</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: Arial, sans-serif;
-            background-color: #e8e8e8;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: rgb(224, 224, 224);
-            padding: 30px;
-            border-radius: 10px;
-        }}
-        
-        .header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-        }}
-        
-        .title {{
-            font-size: 55px;
-            font-weight: 700;
-            color: #003d5c;
-        }}
-        
-        .title .increment {{
-            font-weight: 700;
-            color: #ff6633;
-        }}
-        
-        .subtitle {{
-            font-size: 30px;
-            font-weight: 700;
-            color: #ff6633;
-            margin-bottom: 5px;
-        }}
-        
-        .subtitle .sprintrange {{
-            font-weight: 700;
-            color: #003d5c;
-        }}
-        
-        .logo {{
-            font-size: 32px;
-            font-weight: 700;
-            color: #003d5c;
-        }}
-        
-        .logo .industrial {{
-            font-size: 14px;
-            display: block;
-            text-align: right;
-            margin-top: -5px;
-        }}
-        
-        .progress-container {{
-            display: flex;
-            background: #ffffff;
-            border-radius: 25px;
-            padding: 8px;
-            margin-bottom: 10px;
-            position: relative;
-        }}
-        
-        .progress-item {{
-            flex: 1;
-            font-size: 20px;
-            text-align: center;
-            padding: 8px;
-            color: #999;
-            font-weight: 700;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .progress-item.active {{
-            background: #ff6633;
-            color: white;
-            font-size: 20px;
-            border-radius: 20px;
-            position: relative;
-        }}
-        
-        .progress-item.active::after {{
-            content: '';
-            position: absolute;
-            right: -15px;
-            top: 50%;
-            transform: translateY(-50%);
-            width: 18px;
-            height: 18px;
-            background: #003d5c;
-            border-radius: 50%;
-            border: 3px solid white;
-        }}
-        
-        .cards-container {{
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 20px;
-        }}
-        
-        .card {{
-            border: 3px solid #003d5c;
-            border-radius: 15px;
-            overflow: hidden;
-            background: white;
-        }}
-        
-        .card-header {{
-            font-size: 40px;
-            padding: 20px;
-            color: white;
-            min-height: 320px;
-        }}
-        
-        .card-header-primary {{
-            background: #003d5c;
-            min-height: 320px;
-            padding: 20px;
-        }}
-        
-        .card-header-secondary {{
-            padding: 20px;
-            background: linear-gradient(135deg, #4a6c7d 0%, #003d5c 100%);
-        }}
-        
-        .card-header h2 {{
-            font-size: 36px;
-            font-weight: 700;
-            text-align: center;
-            margin-bottom: 15px;
-            line-height: 1.2;
-        }}
-        
-        .item {{
-            font-size: 14px;
-            margin-bottom: 5px;
-        }}
-        
-        .maincard-body {{
-            padding: 30px 20px;
-            text-align: center;
-            background: white;
-        }}
-        .card-body {{
-            padding: 30px 20px;
-            text-align: center;
-            background: linear-gradient(135deg, #4a6c7d 0%, #003d5c 100%);
-        }}
-        
-        .metric-large {{
-            font-size: 120px;
-            font-weight: 700;
-            color: #003d5c;
-            line-height: 1;
-            display: inline;
-        }}
-        .metric-largewhite {{
-            font-size: 120px;
-            font-weight: 700;
-            color: white;
-            line-height: 1;
-            display: inline;
-        }}
-        
-        .metric-divider {{
-            height: 10px;
-            background: #ff6633;
-            margin: 10px 40px;
-        }}
-        
-        .metric-label {{
-            font-size: 20px;
-            font-weight: 700;
-            color: #003d5c;
-            margin-top: 15px;
-        }}
-        
-        .metric-labelwhite {{
-            font-size: 20px;
-            font-weight: 700;
-            color: white;
-            margin-top: 15px;
-        }}
-        .card-footer {{
-            background: #ff6633;
-            padding: 20px;
-            text-align: center;
-            color: white;
-        }}
-        
-        .health-score {{
-            font-size: 100px;
-            font-weight: 700;
-            display: inline;
-        }}
-        
-        .health-divider {{
-            height: 8px;
-            background: #003d5c;
-            margin: 8px 20px;
-        }}
-        
-        .health-max {{
-            font-size: 60px;
-            font-weight: 700;
-        }}
-        
-        .health-label {{
-            font-size: 20px;
-            font-weight: 700;
-            margin-top: 8px;
-            letter-spacing: 1px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <div>
-                <div class="title">DIGITAL TECHNOLOGY – <span class="increment">INCREMENT {increment}</span></div>
-                <div class="subtitle">Delivery metrics for <span class="sprintrange">Sprint {sprint_range}</span></div>
-            </div>
-            <div class="logo">
-                SIME
-                <span class="industrial">INDUSTRIAL</span>
-            </div>
-        </div>
-        
-        <div class="progress-container">{progress_html}</div>
-        
-        <div class="cards-container">
-            
-        <div class="card">
-            <div class="card-header card-header-primary">
-                <h2>DIGITAL TECHNOLOGY</h2>
-                <div class="item">✓ DIGITAL</div><div class="item">✓ ENTERPRISE APPLICATIONS</div><div class="item">✓ TECHNOLOGY OPERATIONS</div>
-            </div>
-            <div class="maincard-body">
-                <div class="metric-large">{metrics['digitalTechnology']['delivered']}</div>
-                <div class="metric-divider"></div>
-                <div class="metric-large">{metrics['digitalTechnology']['total']}</div>
-                <div class="metric-label">FEATURES DELIVERED</div>
-            </div>
-            <div class="card-footer">
-                <div class="health-score">{metrics['digitalTechnology']['health']:.2f}</div>
-                <div class="health-divider"></div>
-                <div class="health-max">4.00</div>
-                <div class="health-label">HEALTH METRICS</div>
-            </div>
-        </div>
-        
-        <div class="card">
-            <div class="card-header card-header-secondary">
-                <h2>DIGITAL</h2>
-                <div class="item">✓ AVATARS</div><div class="item">✓ DESTINO</div><div class="item">✓ SDI WEBSITE</div><div class="item">✓ XENO</div>
-            </div>
-            <div class="card-body">
-                <div class="metric-largewhite">{metrics['digital']['delivered']}</div>
-                <div class="metric-divider"></div>
-                <div class="metric-largewhite">{metrics['digital']['total']}</div>
-                <div class="metric-labelwhite">FEATURES DELIVERED</div>
-            </div>
-            <div class="card-footer">
-                <div class="health-score">{metrics['digital']['health']:.2f}</div>
-                <div class="health-divider"></div>
-                <div class="health-max">4.00</div>
-                <div class="health-label">HEALTH METRICS</div>
-            </div>
-        </div>
-        
-        <div class="card">
-            <div class="card-header card-header-secondary">
-                <h2>ENTERPRISE APPLICATIONS</h2>
-                <div class="item">✓ AX GUARDIANS</div><div class="item">✓ DELTA 365</div><div class="item">✓ ENTERPRISE AUTOMATION</div><div class="item">✓ WARETEC</div>
-            </div>
-            <div class="card-body">
-                <div class="metric-largewhite">{metrics['enterpriseApplications']['delivered']}</div>
-                <div class="metric-divider"></div>
-                <div class="metric-largewhite">{metrics['enterpriseApplications']['total']}</div>
-                <div class="metric-labelwhite">FEATURES DELIVERED</div>
-            </div>
-            <div class="card-footer">
-                <div class="health-score">{metrics['enterpriseApplications']['health']:.2f}</div>
-                <div class="health-divider"></div>
-                <div class="health-max">4.00</div>
-                <div class="health-label">HEALTH METRICS</div>
-            </div>
-        </div>
-        
-        <div class="card">
-            <div class="card-header card-header-secondary">
-                <h2>TECHNOLOGY OPERATIONS</h2>
-                <div class="item">✓ CSI</div><div class="item">✓ CYBER DEFENCE</div><div class="item">✓ CYBER OPERATIONS</div><div class="item">✓ ENTERPRISE ARCHITECTURE</div><div class="item">✓ GRC</div><div class="item">✓ JSOC</div><div class="item">✓ MATRIX</div>
-            </div>
-            <div class="card-body">
-                <div class="metric-largewhite">{metrics['technologyOperations']['delivered']}</div>
-                <div class="metric-divider"></div>
-                <div class="metric-largewhite">{metrics['technologyOperations']['total']}</div>
-                <div class="metric-labelwhite">FEATURES DELIVERED</div>
-            </div>
-            <div class="card-footer">
-                <div class="health-score">{metrics['technologyOperations']['health']:.2f}</div>
-                <div class="health-divider"></div>
-                <div class="health-max">4.00</div>
-                <div class="health-label">HEALTH METRICS</div>
-            </div>
-        </div>
-        
-        </div>
-    </div>
-</body>
-</html>'''
+        return generate_html_content(increment, current_sprint, sprints, metrics,
+                                     self.sprint_range.get(), font=self.embedded_font, trends=trends,
+                                     forecast=forecast)
 
 
 # ============================================================================
-# UNIT TESTS
+# DASHBOARD RENDERING
 # ============================================================================
 
-class TestSprintMetricsApp(unittest.TestCase):
-    """
-    Comprehensive unit tests for Sprint Metrics Dashboard Generator.
-    
-    Tests cover:
-    - Sprint dropdown generation
-    - History management (load, save, delete)
-    - HTML generation
-    - Data validation
+def generate_html_content(increment, current_sprint, sprints, metrics, sprint_range, font=None,
+                          trends=None, forecast=None):
     """
+    Generate complete HTML content for the dashboard.
     
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        # Create mock root window for testing
-        self.root = tk.Tk()
-        self.root.withdraw()  # Hide window during tests
-        self.app = SprintMetricsApp(self.root)
-        
-        # Clean up any existing test history file
-        self.test_history_file = Path("test_sprint_history.json")
-        if self.test_history_file.exists():
-            self.test_history_file.unlink()
-        
-        # Override history file path for testing and ensure it's empty
-        self.app.history_file = self.test_history_file
-        self.app.history = []
-        self.app.save_history()
-    
-    def tearDown(self):
-        """Clean up after each test method."""
-        # Destroy tkinter window
-        self.root.destroy()
-        
-        # Clean up test files
-        if self.test_history_file.exists():
-            self.test_history_file.unlink()
-    
-    def test_initial_values(self):
-        """Test that application initializes with correct default values."""
-        self.assertEqual(self.app.increment.get(), 17)
-        self.assertEqual(self.app.current_sprint.get(), "17.1")
-        self.assertEqual(self.app.sprint_range.get(), "17.1 - 17.1")
-        
-        # Test default metrics
-        self.assertEqual(self.app.metrics['digitalTechnology']['delivered'].get(), 5)
-        self.assertEqual(self.app.metrics['digital']['total'].get(), 39)
-        self.assertAlmostEqual(self.app.metrics['enterpriseApplications']['health'].get(), 3.58)
-    
-    def test_sprint_dropdown_generation(self):
-        """Test that sprint dropdown generates correct values for different increments."""
-        # Test increment 17
-        self.app.increment.set(17)
-        self.app.update_sprint_dropdown()
-        expected_sprints = ["17.1", "17.2", "17.3", "17.4", "17.5", "17.6"]
-        self.assertEqual(list(self.app.sprint_dropdown['values']), expected_sprints)
-        
-        # Test increment 18
-        self.app.increment.set(18)
-        self.app.update_sprint_dropdown()
-        expected_sprints = ["18.1", "18.2", "18.3", "18.4", "18.5", "18.6"]
-        self.assertEqual(list(self.app.sprint_dropdown['values']), expected_sprints)
-        
-        # Test that current sprint resets if invalid
-        self.app.current_sprint.set("17.1")
-        self.app.increment.set(19)
-        self.app.update_sprint_dropdown()
-        self.assertEqual(self.app.current_sprint.get(), "19.1")
-    
-    def test_save_and_load_history(self):
-        """Test saving and loading history from JSON file."""
-        # Override history file path for testing
-        self.app.history_file = self.test_history_file
-        
-        # Save a record
-        self.app.increment.set(17)
-        self.app.current_sprint.set("17.3")
-        self.app.metrics['digital']['delivered'].set(10)
-        
-        self.app.save_to_history()
-        
-        # Verify history was saved
-        self.assertEqual(len(self.app.history), 1)
-        self.assertEqual(self.app.history[0]['increment'], 17)
-        self.assertEqual(self.app.history[0]['current_sprint'], "17.3")
-        
-        # Create new app instance and verify history loads
-        new_app = SprintMetricsApp(self.root)
-        new_app.history_file = self.test_history_file
-        new_app.history = new_app.load_history()
-        
-        self.assertEqual(len(new_app.history), 1)
-        self.assertEqual(new_app.history[0]['metrics']['digital']['delivered'], 10)
-    
-    def test_load_from_history(self):
-        """Test loading configuration from a historical record."""
-        # Create a test record
-        test_record = {
-            'increment': 18,
-            'current_sprint': '18.4',
-            'sprint_range': '18.1 - 18.4',
-            'metrics': {
-                'digitalTechnology': {'delivered': 8, 'total': 200, 'health': 3.5},
-                'digital': {'delivered': 5, 'total': 50, 'health': 3.7},
-                'enterpriseApplications': {'delivered': 2, 'total': 30, 'health': 3.2},
-                'technologyOperations': {'delivered': 4, 'total': 80, 'health': 3.9}
-            },
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        # Create mock window
-        mock_window = Mock()
-        mock_window.destroy = Mock()
-        
-        # Load the record
-        self.app.load_from_history(test_record, mock_window)
-        
-        # Verify all values were loaded correctly
-        self.assertEqual(self.app.increment.get(), 18)
-        self.assertEqual(self.app.current_sprint.get(), '18.4')
-        self.assertEqual(self.app.sprint_range.get(), '18.1 - 18.4')
-        self.assertEqual(self.app.metrics['digitalTechnology']['delivered'].get(), 8)
-        self.assertEqual(self.app.metrics['digital']['health'].get(), 3.7)
-        
-        # Verify window was closed
-        mock_window.destroy.assert_called_once()
-    
-    def test_html_generation_structure(self):
-        """Test that HTML generation creates valid structure."""
-        # Set test values
-        self.app.increment.set(17)
-        self.app.current_sprint.set("17.2")
-        self.app.metrics['digitalTechnology']['delivered'].set(7)
-        
-        def run_thread_synchronously(target, args):
-            target(*args)
-            # Return a mock object that has a start method
-            thread_mock = Mock()
-            thread_mock.start = lambda: None
-            return thread_mock
-
-        # Mock the file dialog and threading
-        with patch('tkinter.filedialog.asksaveasfilename', return_value="test.html"), \
-             patch('threading.Thread', side_effect=run_thread_synchronously):
-            # Generate files
-            self.app.generate_files()
-
-        # Verify HTML structure
-        with open("test.html", "r") as f:
-            html = f.read()
-
-        self.assertIn('<!DOCTYPE html>', html)
-        self.assertIn('INCREMENT 17', html)
-        self.assertIn('DIGITAL TECHNOLOGY', html)
-        self.assertIn('FEATURES DELIVERED', html)
-        self.assertIn('HEALTH METRICS', html)
-        
-        # Verify metrics are included
-        self.assertIn('7', html)  # delivered count
-        self.assertIn('153', html)  # total count
-        self.assertIn('3.38', html)  # health score
-        
-        # Verify active sprint is marked
-        self.assertIn('class="progress-item active">17.2', html)
-
-        # Verify that the image was created
-        self.assertTrue(Path("test.png").exists())
-
-        # Clean up the created files
-        Path("test.html").unlink()
-        Path("test.png").unlink()
+    Args:
+        increment (int): Current increment number
+        current_sprint (str): Active sprint identifier
+        sprints (list): List of all sprint identifiers for progress bar
+        metrics (dict): Dictionary containing all metric values
+        sprint_range (str): Display text for the sprint range subtitle
+        font (EmbeddedFont): Locally bundled font to inline, or None for system fonts
+        trends (dict): Per-category sparkline values (see sparklines), or None
+        forecast (dict): Per-category completion forecast (see forecast), or None
     
-    def test_html_formatting_precision(self):
-        """Test that health scores are formatted to 2 decimal places."""
-        metrics_data = {
-            'digitalTechnology': {'delivered': 5, 'total': 153, 'health': 3.3847},
-            'digital': {'delivered': 3, 'total': 39, 'health': 3.629},
-            'enterpriseApplications': {'delivered': 0, 'total': 43, 'health': 3.5},
-            'technologyOperations': {'delivered': 2, 'total': 71, 'health': 3.2145}
-        }
-        
-        html = self.app._generate_html_content(17, "17.1", ["17.1"], metrics_data)
-        
-        # Verify health scores are rounded to 2 decimals
-        self.assertIn('3.38', html)  # 3.3847 -> 3.38
-        self.assertIn('3.63', html)  # 3.629 -> 3.63
-        self.assertIn('3.50', html)  # 3.5 -> 3.50
-        self.assertIn('3.21', html)  # 3.2145 -> 3.21
-    
-    def test_delete_history_item(self):
-        """Test deleting a history record."""
-        # Override history file for testing
-        self.app.history_file = self.test_history_file
-        
-        # Add multiple records
-        for i in range(3):
-            self.app.increment.set(17)
-            self.app.current_sprint.set(f"17.{i+1}")
-            self.app.save_to_history()
-        
-        # Verify we have 3 records
-        self.assertEqual(len(self.app.history), 3)
-        
-        # Delete middle record (index 1)
-        self.app.history.pop(1)
-        self.app.save_history()
-        
-        # Reload and verify
-        self.app.history = self.app.load_history()
-        self.assertEqual(len(self.app.history), 2)
-    
-    def test_empty_history_handling(self):
-        """Test that application handles empty history gracefully."""
-        # Override history file to non-existent file
-        self.app.history_file = Path("non_existent_history.json")
-        
-        # Load history from non-existent file
-        history = self.app.load_history()
-        
-        self.assertEqual(history, [])
-        self.assertIsInstance(history, list)
-    
-    def test_corrupted_history_handling(self):
-        """Test that application handles corrupted history file gracefully."""
-        # Create corrupted JSON file
-        self.app.history_file = self.test_history_file
-        with open(self.test_history_file, 'w') as f:
-            f.write("This is not valid JSON{[]}")
-        
-        # Load history should return empty list
-        history = self.app.load_history()
-        self.assertEqual(history, [])
+    Returns:
+        str: Complete HTML document as string
     
-    def test_metrics_update(self):
-        """Test updating metric values through the application."""
-        # Update metrics
-        self.app.metrics['digital']['delivered'].set(15)
-        self.app.metrics['digital']['total'].set(100)
-        self.app.metrics['digital']['health'].set(3.95)
-        
-        # Verify updates
-        self.assertEqual(self.app.metrics['digital']['delivered'].get(), 15)
-        self.assertEqual(self.app.metrics['digital']['total'].get(), 100)
-        self.assertAlmostEqual(self.app.metrics['digital']['health'].get(), 3.95)
+    The page layout and stylesheet are compiled once per process in
+    dashboard_template; each call only fills in the increment, sprint
+    range, progress bar, metric values, sparklines and forecast.
+    """
+    return render_dashboard(increment, current_sprint, sprints, metrics, sprint_range, font=font,
+                            trends=trends, forecast=forecast)
 
 
 def run_tests():
@@ -1271,6 +1249,11 @@ def run_tests():
     Returns:
         bool: True if all tests passed, False otherwise
     """
+    # The tests live in their own module so that importing the app does not
+    # load unittest or the test fixtures
+    import unittest
+    from test_sprint_metrics_app import TestSprintMetricsApp
+
     # Create test suite
     loader = unittest.TestLoader()
     suite = loader.loadTestsFromTestCase(TestSprintMetricsApp)
@@ -1287,7 +1270,11 @@ def main():
     """
     Main entry point for the application.
     
-    Provides option to run tests before starting the GUI application.
+    Provides option to run tests before starting the GUI application,
+    ``--history PATH`` to choose the history file (e.g. sprint_history.db
+    for the SQLite backend), ``--embed-font`` to inline the bundled
+    font from fonts/ so PNG renders need no network or system fonts, and
+    ``--metrics-file PATH`` to append per-stage render timings as JSON lines.
     """
     import sys
     
@@ -1300,9 +1287,30 @@ def main():
         sys.exit(0 if success else 1)
     
     # Start GUI application
+    history_file = "sprint_history.json"
+    if '--history' in sys.argv[1:-1]:
+        history_file = sys.argv[sys.argv.index('--history') + 1]
+    
+    # Find the bundled font before any window exists, so a missing font
+    # is reported on the console instead of failing mid-start-up
+    embedded_font = None
+    if '--embed-font' in sys.argv[1:]:
+        try:
+            embedded_font = EmbeddedFont.from_directory(FONT_DIR)
+        except FileNotFoundError as e:
+            print(f"Cannot embed font: {e}. See fonts/README.md.", file=sys.stderr)
+            sys.exit(1)
+    
     root = tk.Tk()
-    app = SprintMetricsApp(root)
+    app = SprintMetricsApp(root, history_file=history_file)
+    app.embedded_font = embedded_font
+    if '--metrics-file' in sys.argv[1:-1]:
+        app.metrics_log = MetricsLog(sys.argv[sys.argv.index('--metrics-file') + 1])
     root.mainloop()
+    
+    # Stop the render workers, then close any warm browser sessions
+    app.render_queue.shutdown()
+    app.browser_pool.shutdown()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
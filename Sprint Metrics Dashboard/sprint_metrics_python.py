@@ -35,11 +35,7 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-import unittest
-from unittest.mock import Mock, patch, MagicMock
 import threading
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 
 
 class SprintMetricsApp:
@@ -628,6 +624,10 @@ class SprintMetricsApp:
             image_path (str): Path to save the output PNG image.
         """
         try:
+            # Imported on first use so the GUI starts without loading Selenium
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+
             options = Options()
             options.add_argument('--headless')
             options.add_argument('--disable-gpu')
@@ -1041,260 +1041,6 @@ class SprintMetricsApp:
 </html>'''
 
 
-# ============================================================================ 
-# UNIT TESTS
-# ============================================================================ 
-
-class TestSprintMetricsApp(unittest.TestCase):
-    """
-    Comprehensive unit tests for Sprint Metrics Dashboard Generator. 
-    
-    Tests cover:
-    - Sprint dropdown generation
-    - History management (load, save, delete)
-    - HTML generation
-    - Data validation
-    """
-    
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        # Create mock root window for testing
-        self.root = tk.Tk()
-        self.root.withdraw()  # Hide window during tests
-        self.app = SprintMetricsApp(self.root)
-        
-        # Clean up any existing test history file
-        self.test_history_file = Path("test_sprint_history.json")
-        if self.test_history_file.exists():
-            self.test_history_file.unlink()
-        
-        # Override history file path for testing and ensure it's empty
-        self.app.history_file = self.test_history_file
-        self.app.history = []
-        self.app.save_history()
-    
-    def tearDown(self):
-        """Clean up after each test method."""
-        # Destroy tkinter window
-        self.root.destroy()
-        
-        # Clean up test files
-        if self.test_history_file.exists():
-            self.test_history_file.unlink()
-    
-    def test_initial_values(self):
-        """Test that application initializes with correct default values."""
-        self.assertEqual(self.app.increment.get(), 17)
-        self.assertEqual(self.app.current_sprint.get(), "17.1")
-        self.assertEqual(self.app.sprint_range.get(), "17.1 - 17.1")
-        
-        # Test default metrics
-        self.assertEqual(self.app.metrics['digitalTechnology']['delivered'].get(), 5)
-        self.assertEqual(self.app.metrics['digital']['total'].get(), 39)
-        self.assertAlmostEqual(self.app.metrics['enterpriseApplications']['health'].get(), 3.58)
-    
-    def test_sprint_dropdown_generation(self):
-        """Test that sprint dropdown generates correct values for different increments."""
-        # Test increment 17
-        self.app.increment.set(17)
-        self.app.update_sprint_dropdown()
-        expected_sprints = ["17.1", "17.2", "17.3", "17.4", "17.5", "17.6"]
-        self.assertEqual(list(self.app.sprint_dropdown['values']), expected_sprints)
-        
-        # Test increment 18
-        self.app.increment.set(18)
-        self.app.update_sprint_dropdown()
-        expected_sprints = ["18.1", "18.2", "18.3", "18.4", "18.5", "18.6"]
-        self.assertEqual(list(self.app.sprint_dropdown['values']), expected_sprints)
-        
-        # Test that current sprint resets if invalid
-        self.app.current_sprint.set("17.1")
-        self.app.increment.set(19)
-        self.app.update_sprint_dropdown()
-        self.assertEqual(self.app.current_sprint.get(), "19.1")
-    
-    def test_save_and_load_history(self):
-        """Test saving and loading history from JSON file."""
-        # Override history file path for testing
-        self.app.history_file = self.test_history_file
-        
-        # Save a record
-        self.app.increment.set(17)
-        self.app.current_sprint.set("17.3")
-        self.app.metrics['digital']['delivered'].set(10)
-        
-        self.app.save_to_history()
-        
-        # Verify history was saved
-        self.assertEqual(len(self.app.history), 1)
-        self.assertEqual(self.app.history[0]['increment'], 17)
-        self.assertEqual(self.app.history[0]['current_sprint'], "17.3")
-        
-        # Create new app instance and verify history loads
-        new_app = SprintMetricsApp(self.root)
-        new_app.history_file = self.test_history_file
-        new_app.history = new_app.load_history()
-        
-        self.assertEqual(len(new_app.history), 1)
-        self.assertEqual(new_app.history[0]['metrics']['digital']['delivered'], 10)
-    
-    def test_load_from_history(self):
-        """Test loading configuration from a historical record."""
-        # Create a test record
-        test_record = {
-            'increment': 18,
-            'current_sprint': '18.4',
-            'sprint_range': '18.1 - 18.4',
-            'metrics': {
-                'digitalTechnology': {'delivered': 8, 'total': 200, 'health': 3.5},
-                'digital': {'delivered': 5, 'total': 50, 'health': 3.7},
-                'enterpriseApplications': {'delivered': 2, 'total': 30, 'health': 3.2},
-                'technologyOperations': {'delivered': 4, 'total': 80, 'health': 3.9}
-            },
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        # Create mock window
-        mock_window = Mock()
-        mock_window.destroy = Mock()
-        
-        # Load the record
-        self.app.load_from_history(test_record, mock_window)
-        
-        # Verify all values were loaded correctly
-        self.assertEqual(self.app.increment.get(), 18)
-        self.assertEqual(self.app.current_sprint.get(), '18.4')
-        self.assertEqual(self.app.sprint_range.get(), '18.1 - 18.4')
-        self.assertEqual(self.app.metrics['digitalTechnology']['delivered'].get(), 8)
-        self.assertEqual(self.app.metrics['digital']['health'].get(), 3.7)
-        
-        # Verify window was closed
-        mock_window.destroy.assert_called_once()
-    
-    def test_html_generation_structure(self):
-        """Test that HTML generation creates valid structure."""
-        # Set test values
-        self.app.increment.set(17)
-        self.app.current_sprint.set("17.3")
-        self.app.sprint_range.set("17.1 - 17.3") # Test a range
-        self.app.metrics['digitalTechnology']['delivered'].set(7)
-        
-        def run_thread_synchronously(target, args):
-            target(*args)
-            # Return a mock object that has a start method
-            thread_mock = Mock()
-            thread_mock.start = lambda: None
-            return thread_mock
-
-        # Mock the file dialog and threading
-        with patch('tkinter.filedialog.asksaveasfilename', return_value="test.html"), \
-             patch('threading.Thread', side_effect=run_thread_synchronously):
-            # Generate files
-            self.app.generate_files()
-
-        # Verify HTML structure
-        with open("test.html", "r") as f:
-            html = f.read()
-
-        self.assertIn('<!DOCTYPE html>', html)
-        self.assertIn('INCREMENT 17', html)
-        self.assertIn('DIGITAL TECHNOLOGY', html)
-        self.assertIn('FEATURES DELIVERED', html)
-        self.assertIn('HEALTH METRICS', html)
-        
-        # Verify metrics are included
-        self.assertIn('7', html)  # delivered count
-        self.assertIn('153', html)  # total count
-        self.assertIn('3.38', html)  # health score
-        
-        # Verify active sprints are marked
-        self.assertIn('class="progress-item active active-first">17.1</div>', html)
-        self.assertIn('class="progress-item active">17.2</div>', html)
-        self.assertIn('class="progress-item active active-last">17.3</div>', html)
-        self.assertNotIn('class="progress-item active">17.4', html)
-
-
-        # Verify that the image was created
-        self.assertTrue(Path("test.png").exists())
-
-        # Clean up the created files
-        Path("test.html").unlink()
-        Path("test.png").unlink()
-    
-    def test_html_formatting_precision(self):
-        """Test that health scores are formatted to 2 decimal places."""
-        metrics_data = {
-            'digitalTechnology': {'delivered': 5, 'total': 153, 'health': 3.3847},
-            'digital': {'delivered': 3, 'total': 39, 'health': 3.629},
-            'enterpriseApplications': {'delivered': 0, 'total': 43, 'health': 3.5},
-            'technologyOperations': {'delivered': 2, 'total': 71, 'health': 3.2145}
-        }
-        
-        html = self.app._generate_html_content(17, "17.1", ["17.1"], metrics_data)
-        
-        # Verify health scores are rounded to 2 decimals
-        self.assertIn('3.38', html)  # 3.3847 -> 3.38
-        self.assertIn('3.63', html)  # 3.629 -> 3.63
-        self.assertIn('3.50', html)  # 3.5 -> 3.50
-        self.assertIn('3.21', html)  # 3.2145 -> 3.21
-    
-    def test_delete_history_item(self):
-        """Test deleting a history record."""
-        # Override history file for testing
-        self.app.history_file = Path("test_sprint_history.json")
-        
-        # Add multiple records
-        for i in range(3):
-            self.app.increment.set(17)
-            self.app.current_sprint.set(f"17.{i+1}")
-            self.app.save_to_history()
-        
-        # Verify we have 3 records
-        self.assertEqual(len(self.app.history), 3)
-        
-        # Delete middle record (index 1)
-        self.app.history.pop(1)
-        self.app.save_history()
-        
-        # Reload and verify
-        self.app.history = self.app.load_history()
-        self.assertEqual(len(self.app.history), 2)
-    
-    def test_empty_history_handling(self):
-        """Test that application handles empty history gracefully."""
-        # Override history file to non-existent file
-        self.app.history_file = Path("non_existent_history.json")
-        
-        # Load history from non-existent file
-        history = self.app.load_history()
-        
-        self.assertEqual(history, [])
-        self.assertIsInstance(history, list)
-    
-    def test_corrupted_history_handling(self):
-        """Test that application handles corrupted history file gracefully."""
-        # Create corrupted JSON file
-        self.app.history_file = Path("test_sprint_history.json")
-        with open(self.app.history_file, 'w') as f:
-            f.write("This is not valid JSON{[]}")
-        
-        # Load history should return empty list
-        history = self.app.load_history()
-        self.assertEqual(history, [])
-    
-    def test_metrics_update(self):
-        """Test updating metric values through the application."""
-        # Update metrics
-        self.app.metrics['digital']['delivered'].set(15)
-        self.app.metrics['digital']['total'].set(100)
-        self.app.metrics['digital']['health'].set(3.95)
-        
-        # Verify updates
-        self.assertEqual(self.app.metrics['digital']['delivered'].get(), 15)
-        self.assertEqual(self.app.metrics['digital']['total'].get(), 100)
-        self.assertAlmostEqual(self.app.metrics['digital']['health'].get(), 3.95)
-
-
 def run_tests():
     """
     Run all unit tests and display results. 
@@ -1302,6 +1048,11 @@ def run_tests():
     Returns:
         bool: True if all tests passed, False otherwise
     """
+    # The tests live in their own module so that importing the app does not
+    # load unittest or the test fixtures
+    import unittest
+    from test_sprint_metrics_python import TestSprintMetricsApp
+
     # Create test suite
     loader = unittest.TestLoader()
     suite = loader.loadTestsFromTestCase(TestSprintMetricsApp)
@@ -0,0 +1,50 @@
+"""
+Unit tests for atomic_file.
+"""
+
+import os
+import shutil
+import unittest
+from pathlib import Path
+
+from atomic_file import replacement_mode
+from history_store import HistoryLog
+
+
+@unittest.skipIf(os.name == 'nt', "POSIX permission bits")
+class TestAtomicFile(unittest.TestCase):
+    """Unit tests for the mode given to atomically replaced files."""
+
+    def setUp(self):
+        """Create a scratch directory."""
+        self.directory = Path('test_atomic_file')
+        self.directory.mkdir(exist_ok=True)
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_existing_file_mode_is_kept(self):
+        """An existing file's mode is used, even if it is unusual."""
+        target = self.directory / 'shared.json'
+        target.write_text('[]')
+        os.chmod(target, 0o640)
+        self.assertEqual(replacement_mode(target), 0o640)
+
+    def test_new_file_follows_umask(self):
+        """A new file gets 0666 less the umask, not mkstemp's private 0600."""
+        mask = os.umask(0o022)
+        os.umask(mask)
+        self.assertEqual(replacement_mode(self.directory / 'missing.json'), 0o666 & ~mask)
+
+    def test_history_rewrite_keeps_mode(self):
+        """Rewriting the history log leaves it readable to the users it was shared with."""
+        log = HistoryLog(self.directory / 'history.jsonl')
+        log.append({'current_sprint': '17.1'})
+        os.chmod(log.log_path, 0o644)
+        log.rewrite(log.load())
+        self.assertEqual(log.log_path.stat().st_mode & 0o777, 0o644)
+
+
+if __name__ == "__main__":
+    unittest.main()
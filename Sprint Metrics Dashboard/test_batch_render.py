@@ -0,0 +1,214 @@
+"""
+Unit tests for batch_render.
+"""
+
+import base64
+import json
+import shutil
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from batch_render import filter_records, render_batch, write_manifest
+from browser_lifecycle import BrowserLifecycle
+from dashboard_export import parse_exports
+from history_store import sprint_key
+from metrics_cube import MetricsCube
+from render_cache import RenderCache
+from render_trace import MetricsLog
+from sparklines import latest_by_sprint
+
+
+def _make_record(increment, sprint, timestamp, delivered=1):
+    """Build a history record with identical metrics in every category."""
+    return {
+        'increment': increment,
+        'current_sprint': sprint,
+        'sprint_range': f"{increment}.1 - {sprint}",
+        'metrics': {
+            key: {'delivered': delivered, 'total': 10, 'health': 3.5}
+            for key in ('digitalTechnology', 'digital',
+                        'enterpriseApplications', 'technologyOperations')
+        },
+        'timestamp': timestamp,
+    }
+
+
+class _FakeElement:
+    """Element stand-in whose screenshot writes a placeholder file."""
+
+    def screenshot(self, path):
+        Path(path).write_bytes(b'PNG')
+
+
+class _FakeDriver:
+    """Minimal WebDriver stand-in for PNG capture without Chrome."""
+
+    def get(self, url):
+        pass
+
+    def set_script_timeout(self, seconds):
+        self.script_timeout = seconds
+
+    def execute_async_script(self, script, *args):
+        # Fonts loaded and layout settled immediately
+        return 800
+
+    def execute_script(self, script, *args):
+        # Container rect: x, y, width, height
+        return [20, 20, 1360, 800]
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands = getattr(self, 'commands', 0) + 1
+        return {'data': base64.b64encode(cmd.encode('ascii')).decode('ascii')}
+
+    def set_window_size(self, width, height):
+        pass
+
+    def find_element(self, by, value):
+        return _FakeElement()
+
+    def quit(self):
+        pass
+
+
+class TestBatchRender(unittest.TestCase):
+    """Unit tests for the headless batch renderer."""
+
+    def setUp(self):
+        """Create sample records and a scratch output directory."""
+        self.records = [
+            _make_record(17, '17.3', '2025-11-20T10:00:00', delivered=9),
+            _make_record(17, '17.2', '2025-11-19T10:00:00', delivered=7),
+            _make_record(17, '17.2', '2025-11-18T10:00:00', delivered=6),
+            _make_record(16, '16.6', '2025-08-01T10:00:00'),
+        ]
+        self.output_dir = Path('test_batch_output')
+
+    def tearDown(self):
+        """Remove any files written during the test."""
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def test_sprint_key_ordering(self):
+        """Test that sprint identifiers sort numerically, not as floats."""
+        self.assertLess(sprint_key('17.2'), sprint_key('17.10'))
+        self.assertLess(sprint_key('16.6'), sprint_key('17.1'))
+
+    def test_filter_by_increment_and_range(self):
+        """Test filtering on increment and an inclusive sprint range."""
+        selected = filter_records(self.records, increment=17, from_sprint='17.2', to_sprint='17.2')
+        self.assertEqual(len(selected), 2)
+        self.assertTrue(all(r['current_sprint'] == '17.2' for r in selected))
+
+    def test_filter_latest_per_sprint(self):
+        """Test that latest=True keeps only the newest snapshot of each sprint."""
+        selected = filter_records(self.records, latest=True)
+        self.assertEqual([r['current_sprint'] for r in selected], ['17.3', '17.2', '16.6'])
+        self.assertEqual(selected[1]['metrics']['digital']['delivered'], 7)
+
+    def test_render_batch_html_only(self):
+        """Test that HTML-only batches write one file per record."""
+        entries = render_batch(self.records, self.output_dir, workers=2, make_png=False)
+        self.assertEqual(len(entries), 4)
+        self.assertTrue(all(e['status'] == 'ok' for e in entries))
+        self.assertEqual(len({e['html'] for e in entries}), 4)
+        html = Path(entries[0]['html']).read_text(encoding='utf-8')
+        self.assertIn('INCREMENT 17', html)
+        self.assertIn('Sprint 17.1 - 17.3', html)
+
+    def test_render_batch_with_trends(self):
+        """Test that a trend index draws sprint-to-date sparklines into each card."""
+        entries = render_batch(self.records, self.output_dir, workers=2, make_png=False,
+                               trend_index=latest_by_sprint(self.records))
+        pages = {e['current_sprint']: Path(e['html']).read_text(encoding='utf-8') for e in entries}
+        # 16.6, 17.2 and 17.3: two trends per card
+        self.assertEqual(pages['17.3'].count('<svg class="sparkline"'), 8)
+        # Nothing before 16.6, so no series has two points
+        self.assertNotIn('<svg', pages['16.6'])
+    
+    def test_render_batch_with_forecast(self):
+        """Test that each record is forecast only from the sprints before it."""
+        entries = render_batch(self.records, self.output_dir, workers=2, make_png=False,
+                               forecast_cube=MetricsCube.from_records(self.records))
+        pages = {e['current_sprint']: Path(e['html']).read_text(encoding='utf-8') for e in entries}
+        self.assertEqual(pages['17.3'].count('<div class="forecast">'), 4)
+        # 17.2 follows a sprint without a snapshot and 17.3's own progress is
+        # not history yet, so there is no throughput to draw from
+        self.assertIn('FINISH P50 - · P85 -<br>0% BY 17.6', pages['17.3'])
+    
+    def test_render_batch_with_png(self):
+        """Test PNG capture through the browser pool with a fake driver."""
+        entries = render_batch(self.records[:2], self.output_dir, workers=2,
+                               driver_factory=_FakeDriver)
+        for entry in entries:
+            self.assertEqual(entry['status'], 'ok')
+            self.assertTrue(Path(entry['png']).exists())
+            self.assertIsNotNone(entry['png_seconds'])
+            self.assertIsNotNone(entry['ready_seconds'])
+
+    def test_render_batch_multiple_exports(self):
+        """Test that every requested export is written and listed in the manifest entry."""
+        exports = parse_exports("png,png@2x,thumbnail,pdf")
+        entries = render_batch(self.records[:1], self.output_dir, driver_factory=_FakeDriver,
+                               exports=exports)
+        entry = entries[0]
+        self.assertEqual(entry['status'], 'ok')
+        self.assertEqual(list(entry['exports']), ['png', 'png@2x', 'thumbnail', 'pdf'])
+        self.assertEqual(entry['png'], entry['exports']['png'])
+        self.assertTrue(entry['exports']['png@2x'].endswith('@2x.png'))
+        self.assertEqual(Path(entry['exports']['pdf']).read_bytes(), b'Page.printToPDF')
+
+    def test_manifest_reports_browser_counts(self):
+        """Test that every browser is shut down and the counts reach the manifest."""
+        lifecycle = BrowserLifecycle(registry_dir=None)
+        entries = render_batch(self.records[:2], self.output_dir, driver_factory=_FakeDriver,
+                               render_timeout=30, lifecycle=lifecycle)
+        stats = lifecycle.stats()
+        self.assertEqual(stats['live'], 0)
+        self.assertEqual(stats['timed_out'], 0)
+
+        manifest_path = self.output_dir / 'manifest.json'
+        write_manifest(manifest_path, 'history.json', {}, entries, 1.0, browsers=stats)
+        manifest = json.loads(manifest_path.read_text())
+        self.assertEqual(manifest['browsers'], stats)
+
+    def test_metrics_file_has_stage_trace_per_record(self):
+        """Test that each record appends one trace with every pipeline stage."""
+        log = MetricsLog(self.output_dir / 'metrics.jsonl')
+        self.output_dir.mkdir()
+        render_batch(self.records[:2], self.output_dir, driver_factory=_FakeDriver, metrics_log=log)
+        records = log.read()
+        self.assertEqual(len(records), 2)
+        self.assertEqual([s['name'] for s in records[0]['stages']],
+                         ['generate_html', 'write_html', 'chrome_launch', 'page_load', 'capture'])
+        self.assertEqual({r['context']['sprint'] for r in records}, {'17.3', '17.2'})
+
+    def test_cached_png_skips_browser(self):
+        """Test that a second run of the same record copies the cached PNG."""
+        cache = RenderCache(self.output_dir / 'cache')
+        first = render_batch(self.records[:1], self.output_dir, driver_factory=_FakeDriver, cache=cache)
+        second = render_batch(self.records[:1], self.output_dir, driver_factory=None, cache=cache)
+        self.assertFalse(first[0]['cached'])
+        self.assertTrue(second[0]['cached'])
+        self.assertEqual(second[0]['status'], 'ok')
+
+    def test_failure_recorded_in_manifest_entry(self):
+        """Test that a broken record is reported instead of stopping the batch."""
+        broken = dict(self.records[0])
+        del broken['metrics']
+        entries = render_batch([broken, self.records[1]], self.output_dir, make_png=False)
+        self.assertEqual(entries[0]['status'], 'error')
+        self.assertIn('KeyError', entries[0]['error'])
+        self.assertEqual(entries[1]['status'], 'ok')
+
+    def test_import_does_not_load_tkinter(self):
+        """Test that the batch renderer runs on hosts without Tk."""
+        probe = "import sys, batch_render; print('tkinter' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', probe], cwd=Path(__file__).resolve().parent,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+Unit tests for browser_lifecycle.
+
+Real child processes stand in for chromedriver and Chrome, so these tests
+need a POSIX system.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from browser_lifecycle import BrowserLifecycle, child_pids, process_start_time
+from browser_pool import BrowserPool
+
+# A "chromedriver" that starts one "Chrome" child and then waits
+TREE_SCRIPT = (
+    "import subprocess, sys, time\n"
+    "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+    "print('ready', flush=True)\n"
+    "time.sleep(60)\n"
+)
+
+
+class _Service:
+    def __init__(self, process):
+        self.process = process
+
+
+class _ProcessDriver:
+    """Driver stand-in backed by a real process tree."""
+
+    def __init__(self, hang_on_quit=False):
+        self.process = subprocess.Popen([sys.executable, '-c', TREE_SCRIPT],
+                                        stdout=subprocess.PIPE, text=True)
+        self.process.stdout.readline()
+        self.service = _Service(self.process)
+        self.hang_on_quit = hang_on_quit
+
+    def execute_script(self, script):
+        return 1
+
+    def quit(self):
+        if self.hang_on_quit:
+            time.sleep(5)
+        else:
+            self.process.terminate()
+            self.process.wait()
+
+
+def _alive(pid):
+    """True if a process exists and is not a zombie."""
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except OSError:
+        return False
+
+
+@unittest.skipUnless(os.path.isdir('/proc'), "needs /proc to inspect process trees")
+class TestBrowserLifecycle(unittest.TestCase):
+    """Unit tests for process tracking, timeouts and orphan reaping."""
+
+    def setUp(self):
+        """Use a scratch registry so real orphans on this host are not touched."""
+        self.registry = Path('test_browser_registry')
+        self.lifecycle = BrowserLifecycle(registry_dir=self.registry, quit_timeout=0.2)
+        self.drivers = []
+
+    def tearDown(self):
+        """Kill anything a failed test left running."""
+        self.lifecycle.shutdown()
+        for driver in self.drivers:
+            driver.process.kill()
+            driver.process.wait()
+        shutil.rmtree(self.registry, ignore_errors=True)
+
+    def make_driver(self, **kwargs):
+        """Start a process-backed driver and register it."""
+        driver = _ProcessDriver(**kwargs)
+        self.drivers.append(driver)
+        return self.lifecycle.register(driver)
+
+    def test_register_tracks_process_tree(self):
+        """The driver process and its child are tracked and recorded."""
+        driver = self.make_driver()
+        self.assertEqual(len(child_pids(driver.process.pid)), 1)
+        self.assertEqual(self.lifecycle.stats()['live'], 1)
+        self.assertEqual(self.lifecycle.stats()['processes'], 2)
+        registry = json.loads(next(self.registry.glob('*.json')).read_text())
+        self.assertIn(str(driver.process.pid), registry)
+        self.assertEqual(self.registry.stat().st_mode & 0o777, 0o700)
+
+    def test_hung_quit_is_killed(self):
+        """A quit that hangs is abandoned and the whole tree is killed."""
+        driver = self.make_driver(hang_on_quit=True)
+        child = child_pids(driver.process.pid)[0]
+        self.lifecycle.terminate(driver)
+        driver.process.wait(timeout=5)
+        time.sleep(0.1)
+        self.assertFalse(_alive(child))
+        self.assertEqual(self.lifecycle.live_count, 0)
+        self.assertEqual(self.lifecycle.reaped_count, 2)
+        self.assertEqual(list(self.registry.glob('*.json')), [])
+
+    def test_deadline_kills_and_raises_timeout(self):
+        """A render past its deadline has its browser killed and raises TimeoutError."""
+        driver = self.make_driver()
+        with self.assertRaises(TimeoutError):
+            with self.lifecycle.deadline(driver, 0.1):
+                driver.process.wait(timeout=5)
+                raise ConnectionError("browser went away")
+        self.assertEqual(self.lifecycle.stats()['timed_out'], 1)
+
+    def test_reap_orphans_of_dead_owner(self):
+        """Processes recorded by an owner that no longer runs are killed."""
+        orphan = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])
+        self.addCleanup(orphan.wait)
+        dead_owner = subprocess.Popen([sys.executable, '-c', 'pass'])
+        dead_owner.wait()
+        self.registry.mkdir()
+        record = self.registry / f"{dead_owner.pid}-1.json"
+        record.write_text(json.dumps({str(orphan.pid): process_start_time(orphan.pid)}))
+
+        self.assertEqual(self.lifecycle.reap_orphans(), 1)
+        orphan.wait(timeout=5)
+        self.assertFalse(record.exists())
+        self.assertEqual(self.lifecycle.stats()['orphans_reaped'], 1)
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), "needs POSIX file owners")
+    def test_reap_ignores_other_users_files(self):
+        """A registry file owned by another user is neither trusted nor removed."""
+        orphan = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])
+        self.addCleanup(orphan.wait)
+        self.addCleanup(orphan.kill)
+        dead_owner = subprocess.Popen([sys.executable, '-c', 'pass'])
+        dead_owner.wait()
+        self.registry.mkdir()
+        record = self.registry / f"{dead_owner.pid}-1.json"
+        record.write_text(json.dumps({str(orphan.pid): process_start_time(orphan.pid)}))
+
+        with patch('os.getuid', return_value=os.getuid() + 1):
+            self.assertEqual(self.lifecycle.reap_orphans(), 0)
+        self.assertIsNone(orphan.poll())
+        self.assertTrue(record.exists())
+
+    def test_pool_recycles_timed_out_session(self):
+        """The pool enforces render_timeout and replaces the killed session."""
+        def factory():
+            driver = _ProcessDriver()
+            self.drivers.append(driver)
+            return driver
+
+        pool = BrowserPool(size=1, render_timeout=0.1, lifecycle=self.lifecycle,
+                           driver_factory=factory)
+        self.addCleanup(pool.shutdown)
+        with self.assertRaises(TimeoutError):
+            with pool.session() as driver:
+                driver.process.wait(timeout=5)
+                raise ConnectionError("browser went away")
+        self.assertEqual(pool.live_sessions, 0)
+        self.assertEqual(self.lifecycle.live_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
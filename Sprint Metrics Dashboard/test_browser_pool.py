@@ -0,0 +1,137 @@
+"""
+Unit tests for browser_pool.
+"""
+
+import gc
+import threading
+import time
+import unittest
+import weakref
+
+from browser_lifecycle import BrowserLifecycle
+from browser_pool import BrowserPool
+
+
+class _FakeDriver:
+    """Stand-in for a Chrome driver that records lifecycle calls."""
+
+    def __init__(self):
+        self.quit_called = False
+        self.alive = True
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("session deleted")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+        hang = getattr(self, 'hang', None)
+        if hang is not None:
+            hang.wait()
+
+
+class TestBrowserPool(unittest.TestCase):
+    """Unit tests for BrowserPool using fake drivers instead of Chrome."""
+
+    def setUp(self):
+        """Create a pool whose factory records every driver it starts."""
+        self.started = []
+
+        def factory():
+            driver = _FakeDriver()
+            self.started.append(driver)
+            return driver
+
+        self.pool = BrowserPool(size=2, max_renders=3, acquire_timeout=0.1,
+                                driver_factory=factory)
+
+    def tearDown(self):
+        """Shut the pool down after each test."""
+        self.pool.shutdown()
+
+    def test_session_is_reused(self):
+        """Test that consecutive renders share one warm session."""
+        with self.pool.session() as first:
+            pass
+        with self.pool.session() as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(len(self.started), 1)
+
+    def test_recycle_after_max_renders(self):
+        """Test that a session is quit after serving max_renders renders."""
+        for _ in range(3):
+            with self.pool.session():
+                pass
+        self.assertTrue(self.started[0].quit_called)
+        with self.pool.session() as driver:
+            self.assertIsNot(driver, self.started[0])
+
+    def test_unhealthy_session_replaced(self):
+        """Test that a session failing its health check is replaced."""
+        with self.pool.session():
+            pass
+        self.started[0].alive = False
+        with self.pool.session() as driver:
+            self.assertIs(driver, self.started[1])
+        self.assertTrue(self.started[0].quit_called)
+
+    def test_failed_render_discards_session(self):
+        """Test that an exception inside a session recycles the driver."""
+        with self.assertRaises(ValueError):
+            with self.pool.session():
+                raise ValueError("screenshot failed")
+        self.assertTrue(self.started[0].quit_called)
+        self.assertEqual(self.pool.live_sessions, 0)
+
+    def test_size_limit_enforced(self):
+        """Test that acquire times out when every session is busy."""
+        first = self.pool.acquire()
+        second = self.pool.acquire()
+        with self.assertRaises(TimeoutError):
+            self.pool.acquire()
+        self.pool.release(first)
+        self.pool.release(second)
+
+    def test_shutdown_quits_idle_sessions(self):
+        """Test that shutdown quits sessions and blocks new acquisitions."""
+        with self.pool.session():
+            pass
+        self.pool.shutdown()
+        self.assertTrue(self.started[0].quit_called)
+        with self.assertRaises(RuntimeError):
+            self.pool.acquire()
+
+    def test_shutdown_releases_pool(self):
+        """Test that a shut down pool is no longer kept alive by its exit hook."""
+        pool = BrowserPool(size=1, driver_factory=_FakeDriver)
+        pool.shutdown()
+        ref = weakref.ref(pool)
+        del pool
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_hung_quit_does_not_block_other_sessions(self):
+        """Test that a session being quit does not hold up acquire and release."""
+        pool = BrowserPool(size=2, acquire_timeout=0.1, driver_factory=_FakeDriver,
+                           lifecycle=BrowserLifecycle(registry_dir=None, quit_timeout=5))
+        hung = pool.acquire()
+        hung.hang = threading.Event()
+        releasing = threading.Thread(target=pool.release, args=(hung,), kwargs={'broken': True})
+        releasing.start()
+        try:
+            while not hung.quit_called:
+                time.sleep(0.01)
+            started = time.perf_counter()
+            with pool.session():
+                pass
+            self.assertLess(time.perf_counter() - started, 1.0)
+        finally:
+            hung.hang.set()
+            releasing.join()
+            pool.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for dashboard_export.
+"""
+
+import base64
+import shutil
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from selenium.common.exceptions import TimeoutException
+
+from dashboard_export import (
+    THUMBNAIL_WIDTH, ExportTarget, export_dashboard,
+    parse_exports, wait_for_render_ready,
+)
+
+
+def _cdp_result(cmd, params):
+    """Answer a DevTools command with its name as the file content."""
+    return {'data': base64.b64encode(cmd.encode('ascii')).decode('ascii')}
+
+
+class TestRenderReadiness(unittest.TestCase):
+    """Unit tests for the font and layout readiness wait."""
+
+    def test_timeout_raises_timeout_error(self):
+        """A page that never settles fails with a clear TimeoutError."""
+        driver = Mock()
+        driver.execute_async_script.side_effect = TimeoutException("script timeout")
+        with self.assertRaises(TimeoutError):
+            wait_for_render_ready(driver, timeout=0.5)
+        driver.set_window_size.assert_not_called()
+
+
+class TestExportTargets(unittest.TestCase):
+    """Unit tests for export spec parsing."""
+
+    def test_parse_specs(self):
+        """Specs are normalised, de-duplicated and keep their order."""
+        targets = parse_exports("PNG, jpg@2x ,webp@0.5x,png,pdf")
+        self.assertEqual([t.spec for t in targets], ['png', 'jpeg@2x', 'webp@0.5x', 'pdf'])
+        self.assertEqual([t.suffix for t in targets], ['.png', '@2x.jpg', '@0.5x.webp', '.pdf'])
+
+    def test_fixed_size_kinds_ignore_scale(self):
+        """PDF and thumbnail exports have a single size."""
+        self.assertEqual(ExportTarget.parse('thumbnail@3x').spec, 'thumbnail')
+        self.assertEqual(ExportTarget('pdf', 2).suffix, '.pdf')
+
+    def test_invalid_specs(self):
+        """Unknown formats and bad scales are rejected."""
+        for spec in ('gif', 'png@0x', 'png@big'):
+            with self.assertRaises(ValueError):
+                ExportTarget.parse(spec)
+
+
+class TestExportDashboard(unittest.TestCase):
+    """Unit tests for the single-load export pipeline."""
+
+    def setUp(self):
+        """Create a scratch directory and a driver whose page is already laid out."""
+        self.output_dir = Path('test_export_output')
+        self.output_dir.mkdir(exist_ok=True)
+        self.driver = Mock()
+        self.driver.execute_async_script.return_value = 800
+        self.driver.execute_script.return_value = [20, 20, 1360, 800]
+        self.driver.execute_cdp_cmd.side_effect = _cdp_result
+
+    def tearDown(self):
+        """Remove any files written during the test."""
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def test_every_format_from_one_load(self):
+        """The page is loaded and waited for once, then captured per target."""
+        targets = parse_exports("png,png@2x,jpeg,webp,thumbnail,pdf")
+        html_path = str(self.output_dir / 'dashboard.html')
+        outputs, waited = export_dashboard(self.driver, html_path, targets, ready_timeout=3)
+
+        self.driver.get.assert_called_once()
+        self.driver.execute_async_script.assert_called_once()
+        self.assertEqual(self.driver.execute_cdp_cmd.call_count, len(targets))
+        self.assertEqual(sorted(Path(p).name for p in outputs.values()), [
+            'dashboard-thumb.jpg', 'dashboard.jpg', 'dashboard.pdf',
+            'dashboard.png', 'dashboard.webp', 'dashboard@2x.png',
+        ])
+        self.assertEqual(Path(outputs['pdf']).read_bytes(), b'Page.printToPDF')
+        self.assertGreaterEqual(waited, 0)
+
+    def test_capture_parameters(self):
+        """Scale factors, thumbnail width and lossy quality reach Chrome."""
+        targets = parse_exports("png@2x,thumbnail,webp")
+        export_dashboard(self.driver, 'dashboard.html', targets, stem=str(self.output_dir / 'd'))
+        params = [call.args[1] for call in self.driver.execute_cdp_cmd.call_args_list]
+
+        self.assertEqual(params[0]['format'], 'png')
+        self.assertEqual(params[0]['clip'], {'x': 20, 'y': 20, 'width': 1360, 'height': 800, 'scale': 2.0})
+        self.assertNotIn('quality', params[0])
+        self.assertAlmostEqual(params[1]['clip']['width'] * params[1]['clip']['scale'], THUMBNAIL_WIDTH)
+        self.assertEqual(params[1]['format'], 'jpeg')
+        self.assertIn('quality', params[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Unit tests for dashboard_template.
+"""
+
+import unittest
+
+from dashboard_template import PAGE, CompiledTemplate, render_dashboard, render_progress_bar
+
+
+class TestDashboardTemplate(unittest.TestCase):
+    """Unit tests for the compiled dashboard template."""
+
+    METRICS = {
+        'digitalTechnology': {'delivered': 5, 'total': 153, 'health': 3.375},
+        'digital': {'delivered': 2, 'total': 43, 'health': 3.58},
+        'enterpriseApplications': {'delivered': 0, 'total': 39, 'health': 3.63},
+        'technologyOperations': {'delivered': 3, 'total': 71, 'health': 3.21},
+    }
+    SPRINTS = [f"17.{i}" for i in range(1, 7)]
+
+    def test_compiled_template_fills_slots_in_order(self):
+        """Static text survives untouched and repeated slots are filled each time."""
+        slot = CompiledTemplate.slot
+        template = CompiledTemplate(f"100% {slot('a')} {{css}} {slot('b')} {slot('a')}")
+        self.assertEqual(template.slots, ('a', 'b', 'a'))
+        self.assertEqual(template.render(['x', 'y', 'z']), "100% x {css} y z")
+
+    def test_render_dashboard_values(self):
+        """The page carries the increment, sprint range and formatted metrics."""
+        html = render_dashboard(17, "17.3", self.SPRINTS, self.METRICS, "17.1 - 17.3")
+        self.assertTrue(html.startswith('<!DOCTYPE html>'))
+        self.assertIn('<title>Digital Technology - Increment 17</title>', html)
+        self.assertIn('INCREMENT 17</span>', html)
+        self.assertIn('Sprint 17.1 - 17.3</span>', html)
+        self.assertIn('<div class="metric-large">153</div>', html)
+        self.assertIn('<div class="health-score">3.38</div>', html)
+        self.assertIn('<div class="progress-item active">17.3</div>', html)
+        self.assertNotIn(CompiledTemplate.MARK, html)
+
+    def test_page_slot_count(self):
+        """Five header slots plus delivered, total, health, two trends and a forecast per card."""
+        self.assertEqual(len(PAGE.slots), 5 + 6 * len(self.METRICS))
+
+    def test_trends_render_inline_svg(self):
+        """Cards with two or more trend values get a sparkline; others stay empty."""
+        trends = {
+            'digital': {'delivered': [1, 4, 2], 'health': [3.1, 3.58]},
+            'digitalTechnology': {'delivered': [5], 'health': [3.375]},
+        }
+        html = render_dashboard(17, "17.3", self.SPRINTS, self.METRICS, "17.1 - 17.3", trends=trends)
+        self.assertEqual(html.count('<svg class="sparkline"'), 2)
+        self.assertIn('points="3.0,27.0 50.0,3.0 97.0,19.0"', html)
+        self.assertNotIn('<script', html)
+        self.assertEqual(render_dashboard(17, "17.3", self.SPRINTS, self.METRICS, "17.1 - 17.3").count('<svg'), 0)
+
+    def test_forecast_lines(self):
+        """Cards with a forecast show the completion sprints and the on-time share."""
+        forecast = {
+            'digital': {'remaining': 41, 'p50': '17.5', 'p85': '18.1', 'due': '17.6', 'on_time': 0.62},
+            'technologyOperations': {'remaining': 0, 'p50': '17.3', 'p85': '17.3', 'due': '17.6',
+                                     'on_time': 1.0},
+            'enterpriseApplications': {'remaining': 39, 'p50': None, 'p85': None, 'due': '17.6',
+                                       'on_time': 0.0},
+        }
+        html = render_dashboard(17, "17.3", self.SPRINTS, self.METRICS, "17.1 - 17.3", forecast=forecast)
+        self.assertIn('FINISH P50 17.5 · P85 18.1<br>62% BY 17.6', html)
+        self.assertIn('ALL FEATURES DELIVERED', html)
+        self.assertIn('FINISH P50 - · P85 -<br>0% BY 17.6', html)
+        self.assertEqual(html.count('<div class="forecast">'), 3)
+
+    def test_progress_bar_accepts_any_sequence(self):
+        """Lists and tuples render the same progress bar."""
+        self.assertEqual(render_progress_bar(self.SPRINTS, "17.1"),
+                         render_progress_bar(tuple(self.SPRINTS), "17.1"))
+        self.assertEqual(render_progress_bar(self.SPRINTS, "17.1").count('active'), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
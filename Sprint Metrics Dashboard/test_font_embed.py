@@ -0,0 +1,130 @@
+"""
+Unit tests for font_embed.
+"""
+
+import base64
+import io
+import re
+import shutil
+import unittest
+from pathlib import Path
+
+from dashboard_template import TEMPLATE_VERSION, render_dashboard, template_version
+from font_embed import EmbeddedFont, page_characters
+
+try:
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+    from fontTools.ttLib import TTFont
+except ImportError:
+    FontBuilder = None
+
+# Every character a dashboard can show, plus some it never does
+FONT_CHARACTERS = ''.join(chr(c) for c in range(32, 127)) + '–✓€'
+
+
+def _build_font(path, style):
+    """Write a small TrueType font with a box glyph for FONT_CHARACTERS."""
+    names = {ord(c): f"uni{ord(c):04X}" for c in FONT_CHARACTERS}
+    glyph_order = ['.notdef'] + list(names.values())
+    glyphs = {}
+    for name in glyph_order:
+        pen = TTGlyphPen(None)
+        pen.moveTo((50, 0))
+        pen.lineTo((50, 700))
+        pen.lineTo((450, 700))
+        pen.closePath()
+        glyphs[name] = pen.glyph()
+
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyph_order)
+    builder.setupCharacterMap(names)
+    builder.setupGlyf(glyphs)
+    builder.setupHorizontalMetrics({name: (500, 50) for name in glyph_order})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({'familyName': 'Test Sans', 'styleName': style})
+    builder.setupOS2()
+    builder.setupPost()
+    builder.save(str(path))
+
+
+@unittest.skipIf(FontBuilder is None, "fontTools is not installed")
+class TestFontEmbed(unittest.TestCase):
+    """Unit tests for subsetting and inlining the bundled font."""
+
+    METRICS = {
+        'digitalTechnology': {'delivered': 5, 'total': 153, 'health': 3.38},
+        'digital': {'delivered': 2, 'total': 43, 'health': 3.58},
+        'enterpriseApplications': {'delivered': 0, 'total': 39, 'health': 3.63},
+        'technologyOperations': {'delivered': 3, 'total': 71, 'health': 3.21},
+    }
+    SPRINTS = [f"17.{i}" for i in range(1, 7)]
+
+    def setUp(self):
+        """Build a regular and bold test font in a scratch directory."""
+        self.font_dir = Path("test_fonts")
+        self.font_dir.mkdir(exist_ok=True)
+        _build_font(self.font_dir / "TestSans-Regular.ttf", "Regular")
+        _build_font(self.font_dir / "TestSans-Bold.ttf", "Bold")
+
+    def tearDown(self):
+        """Remove the scratch font directory."""
+        shutil.rmtree(self.font_dir, ignore_errors=True)
+
+    def _render(self, font=None):
+        return render_dashboard(17, "17.2", self.SPRINTS, self.METRICS, "17.1 - 17.2", font=font)
+
+    def test_page_characters_ignore_markup_and_css(self):
+        """Only displayed text counts towards the subset."""
+        characters = page_characters('<style>body { color: red; }</style><div class="x">AB ✓</div>')
+        self.assertIn('✓', characters)
+        self.assertIn('7', characters)
+        self.assertNotIn('{', characters)
+        self.assertNotIn('=', characters)
+
+    def test_embedded_font_is_subset_and_offline(self):
+        """The page inlines both faces, keeping only glyphs it displays."""
+        font = EmbeddedFont.from_directory(self.font_dir)
+        html = self._render(font)
+        self.assertNotIn('http', html)
+        self.assertIn("font-family: 'DashboardSans', Arial, sans-serif;", html)
+
+        payloads = re.findall(r'data:font/woff;base64,([A-Za-z0-9+/=]+)', html)
+        self.assertEqual(len(payloads), 2)
+        subset = TTFont(io.BytesIO(base64.b64decode(payloads[0])))
+        kept = {chr(c) for c in subset.getBestCmap()}
+        self.assertEqual(kept, set(page_characters(self._render())))
+        self.assertNotIn('€', kept)
+
+    def test_embedding_is_deterministic(self):
+        """The same inputs always produce the same document."""
+        first = self._render(EmbeddedFont.from_directory(self.font_dir))
+        second = self._render(EmbeddedFont.from_directory(self.font_dir))
+        self.assertEqual(first, second)
+
+    def test_without_font_page_is_unchanged(self):
+        """Not embedding keeps the system-font page and template version."""
+        self.assertNotIn('@font-face', self._render())
+        self.assertEqual(template_version(), TEMPLATE_VERSION)
+        font = EmbeddedFont.from_directory(self.font_dir)
+        self.assertNotEqual(template_version(font), TEMPLATE_VERSION)
+
+    def test_from_directory_requires_regular_face(self):
+        """A directory with only a bold face is rejected."""
+        (self.font_dir / "TestSans-Regular.ttf").unlink()
+        with self.assertRaises(FileNotFoundError):
+            EmbeddedFont.from_directory(self.font_dir)
+
+
+    def test_bundled_fonts_cover_the_dashboard(self):
+        """The faces shipped in fonts/ load and hold every character a dashboard shows."""
+        font = EmbeddedFont.from_directory()
+        html = self._render(font)
+        self.assertEqual(len(re.findall(r'data:font/woff;base64,', html)), 2)
+        for face in (font.regular, font.bold):
+            cmap = TTFont(face).getBestCmap()
+            self.assertEqual([c for c in page_characters(html) if ord(c) not in cmap], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Unit tests for forecast.
+"""
+
+import time
+import unittest
+
+import numpy as np
+
+from forecast import forecast_completion, simulate_completion, sprint_after, sprint_throughput
+from metrics_cube import MetricsCube
+
+
+# Features delivered per sprint in each category of the sample history
+RATES = {'digitalTechnology': 1, 'digital': 3, 'enterpriseApplications': 1, 'technologyOperations': 2}
+
+
+def _make_record(increment, sprint, timestamp, delivered):
+    """Build a history record with the given delivered count per category."""
+    return {
+        'increment': increment,
+        'current_sprint': f"{increment}.{sprint}",
+        'sprint_range': f"{increment}.1 - {increment}.{sprint}",
+        'metrics': {key: {'delivered': delivered[key], 'total': 40, 'health': 3.5} for key in RATES},
+        'timestamp': timestamp,
+    }
+
+
+def _steady_history():
+    """Increment 16 and sprints 17.1 to 17.4, every category at its constant rate."""
+    records = []
+    for increment, sprints in ((16, 6), (17, 4)):
+        for sprint in range(1, sprints + 1):
+            delivered = {key: rate * sprint for key, rate in RATES.items()}
+            records.append(_make_record(increment, sprint, f"2025-{increment - 8:02d}-{sprint:02d}T10:00:00",
+                                        delivered))
+    return records
+
+
+class TestForecast(unittest.TestCase):
+    """Unit tests for the Monte Carlo delivery forecast."""
+
+    def test_sprint_throughput(self):
+        """Throughput is the per-sprint change; gaps give no sample and drops count as zero."""
+        counts = [(16, 1, 2), (16, 2, 5), (16, 3, 5), (17, 1, 3), (17, 2, 2), (17, 4, 6)]
+        records = [_make_record(inc, sprint, f"2025-{inc - 8:02d}-{sprint:02d}T10:00:00",
+                                {key: delivered for key in RATES})
+                   for inc, sprint, delivered in counts]
+        cube = MetricsCube.from_records(records)
+        np.testing.assert_array_equal(sprint_throughput(cube)[1], [2, 3, 0, 3, 0])
+        np.testing.assert_array_equal(sprint_throughput(cube, before='17.2')[1], [2, 3, 0, 3])
+
+    def test_simulation_edge_cases(self):
+        """Fixed throughput finishes on a known sprint; no throughput never finishes."""
+        needed = simulate_completion([5, 0, 5, 5], [np.array([2.0]), np.array([2.0]), np.array([]),
+                                                    np.array([0.0, 0.0])], trials=100, max_sprints=10)
+        self.assertEqual(needed.shape, (4, 100))
+        self.assertTrue((needed[0] == 3).all())
+        self.assertTrue((needed[1] == 0).all())
+        self.assertTrue((needed[2:] == 11).all())
+
+        mixed = simulate_completion([4], [np.array([1.0, 3.0])], trials=1000)
+        self.assertEqual((mixed.min(), mixed.max()), (2, 4))
+        np.testing.assert_array_equal(mixed, simulate_completion([4], [np.array([1.0, 3.0])], trials=1000))
+
+    def test_forecast_completion(self):
+        """Percentiles name completion sprints, rolling into the next increment."""
+        metrics = {
+            'digitalTechnology': {'delivered': 38, 'total': 40, 'health': 3.5},
+            'digital': {'delivered': 9, 'total': 18, 'health': 3.5},
+            'enterpriseApplications': {'delivered': 3, 'total': 12, 'health': 3.5},
+            'technologyOperations': {'delivered': 40, 'total': 40, 'health': 3.5},
+        }
+        sprints = [f"17.{i}" for i in range(1, 7)]
+        forecast = forecast_completion(MetricsCube.from_records(_steady_history()), "17.3", sprints, metrics)
+
+        self.assertEqual(forecast['digital'],
+                         {'remaining': 9, 'due': '17.6', 'on_time': 1.0, 'p50': '17.6', 'p85': '17.6'})
+        self.assertEqual(forecast['digitalTechnology']['p85'], '17.5')
+        self.assertEqual(forecast['enterpriseApplications']['p50'], '18.6')
+        self.assertEqual(forecast['enterpriseApplications']['on_time'], 0.0)
+        self.assertEqual(forecast['technologyOperations']['remaining'], 0)
+        self.assertEqual(sprint_after('17.6', 1, 6), '18.1')
+
+    def test_many_categories_under_a_second(self):
+        """Twenty thousand trials for each of a hundred categories stay under a second."""
+        rng = np.random.default_rng(3)
+        samples = [rng.integers(0, 8, size=12).astype(float) for _ in range(100)]
+        remaining = rng.integers(1, 40, size=100)
+        started = time.perf_counter()
+        needed = simulate_completion(remaining, samples, trials=20000)
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual(needed.shape, (100, 20000))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Unit tests for history_snapshot.
+"""
+
+import json
+import tracemalloc
+import unittest
+import uuid
+
+from history_snapshot import Snapshot, pack_history, unpack_history
+
+
+def _make_record(increment, sprint, delivered=1, health=3.5):
+    """Build a history record as the application saves it."""
+    return {
+        'increment': increment,
+        'current_sprint': sprint,
+        'sprint_range': f"{increment}.1 - {sprint}",
+        'metrics': {
+            key: {'delivered': delivered + i, 'total': 40 + i, 'health': health + i / 10}
+            for i, key in enumerate(('digitalTechnology', 'digital',
+                                     'enterpriseApplications', 'technologyOperations'))
+        },
+        'timestamp': '2025-11-20T10:00:00.123456',
+        'id': uuid.uuid4().hex,
+    }
+
+
+class TestSnapshot(unittest.TestCase):
+    """Unit tests for the compact snapshot type."""
+
+    def test_round_trip_matches_record_and_json(self):
+        """A snapshot converts back to an identical record and identical JSON."""
+        record = _make_record(17, '17.3', delivered=9, health=3.38)
+        snapshot = Snapshot.from_record(record)
+        self.assertEqual(snapshot.to_record(), record)
+        self.assertEqual(json.dumps(snapshot.to_record()), json.dumps(record))
+        self.assertIsInstance(snapshot.to_record()['metrics']['digital']['delivered'], int)
+
+    def test_metric_access(self):
+        """Single metrics are read and written through the grid."""
+        snapshot = Snapshot.from_record(_make_record(17, '17.2', delivered=5))
+        self.assertEqual(snapshot.metric('digital', 'delivered'), 6)
+        snapshot.set_metric('digital', 'delivered', 12)
+        self.assertEqual(snapshot.to_record()['metrics']['digital']['delivered'], 12)
+        self.assertEqual(snapshot.sprint_key, (17, 2))
+        with self.assertRaises(ValueError):
+            snapshot.metric('marketing', 'delivered')
+
+    def test_missing_category_is_omitted(self):
+        """A category absent from the record stays absent after the round trip."""
+        record = _make_record(17, '17.1')
+        del record['metrics']['digital']
+        snapshot = Snapshot.from_record(record)
+        self.assertIsNone(snapshot.metric('digital', 'health'))
+        self.assertEqual(snapshot.to_record(), record)
+
+    def test_pack_history_uses_fraction_of_dict_memory(self):
+        """Snapshots of a JSON-loaded history take well under a third of the dicts' memory."""
+        text = json.dumps([_make_record(17, f"17.{i % 6 + 1}", delivered=i) for i in range(2000)])
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            records = json.loads(text)
+            loaded = tracemalloc.get_traced_memory()[0]
+            snapshots = pack_history(records)
+            packed = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(packed - loaded, (loaded - before) / 3)
+        self.assertEqual(unpack_history(snapshots), records)
+
+
+if __name__ == "__main__":
+    unittest.main()
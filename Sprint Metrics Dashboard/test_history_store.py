@@ -0,0 +1,202 @@
+"""
+Unit tests for history_store.
+"""
+
+import json
+import unittest
+from pathlib import Path
+
+from history_store import HistoryLog, SqliteHistoryStore, open_history_store
+
+
+class TestHistoryLog(unittest.TestCase):
+    """Unit tests for the append-only history log."""
+
+    def setUp(self):
+        """Point a log at scratch files and make sure they are absent."""
+        self.legacy = Path('test_history_log.json')
+        self.log = HistoryLog(self.legacy, compact_min_garbage=4)
+        self._cleanup()
+
+    def tearDown(self):
+        """Remove scratch files."""
+        self.log.wait_for_compaction()
+        self._cleanup()
+
+    def _cleanup(self):
+        for path in (self.legacy, self.log.log_path, Path(str(self.legacy) + '.bak')):
+            if path.exists():
+                path.unlink()
+
+    def _record(self, sprint):
+        return {'increment': 17, 'current_sprint': sprint, 'sprint_range': '17.1 - ' + sprint,
+                'metrics': {}, 'timestamp': '2025-11-18T10:00:00'}
+
+    def test_empty_when_no_files(self):
+        """Test that a missing history loads as an empty list without creating files."""
+        self.assertEqual(self.log.load(), [])
+        self.assertFalse(self.log.log_path.exists())
+
+    def test_append_and_reload(self):
+        """Test that appended records reload in chronological order."""
+        self.log.append(self._record('17.1'))
+        self.log.append(self._record('17.2'))
+        records = HistoryLog(self.legacy).load()
+        self.assertEqual([r['current_sprint'] for r in records], ['17.1', '17.2'])
+        self.assertTrue(all('id' in r for r in records))
+
+    def test_append_does_not_rewrite(self):
+        """Test that saving appends exactly one line."""
+        self.log.append(self._record('17.1'))
+        before = self.log.log_path.read_text().count('\n')
+        self.log.append(self._record('17.2'))
+        self.assertEqual(self.log.log_path.read_text().count('\n'), before + 1)
+
+    def test_delete_writes_tombstone(self):
+        """Test that deleted records do not come back on reload."""
+        first = self.log.append(self._record('17.1'))
+        self.log.append(self._record('17.2'))
+        self.log.delete(first['id'])
+        records = HistoryLog(self.legacy).load()
+        self.assertEqual([r['current_sprint'] for r in records], ['17.2'])
+
+    def test_background_compaction(self):
+        """Test that enough deletes trigger compaction down to live records."""
+        kept = self.log.append(self._record('17.6'))
+        for i in range(1, 3):
+            self.log.delete(self.log.append(self._record(f'17.{i}'))['id'])
+        self.log.wait_for_compaction()
+        lines = self.log.log_path.read_text().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])['id'], kept['id'])
+
+    def test_legacy_migration(self):
+        """Test that a legacy JSON list is migrated and kept as a backup."""
+        with open(self.legacy, 'w') as f:
+            json.dump([self._record('17.2'), self._record('17.1')], f, indent=2)
+        records = self.log.load(migrate=True)
+        self.assertEqual([r['current_sprint'] for r in records], ['17.1', '17.2'])
+        self.assertTrue(self.log.log_path.exists())
+        self.assertFalse(self.legacy.exists())
+        self.assertTrue(Path(str(self.legacy) + '.bak').exists())
+
+    def test_migration_keeps_earlier_appends(self):
+        """Test that a save made before the legacy file was migrated survives migration."""
+        with open(self.legacy, 'w') as f:
+            json.dump([self._record('17.2'), self._record('17.1')], f)
+        saved = HistoryLog(self.legacy).append(self._record('17.3'))
+        records = self.log.load(migrate=True)
+        self.assertEqual([r['current_sprint'] for r in records], ['17.1', '17.2', '17.3'])
+        self.assertEqual(records[-1]['id'], saved['id'])
+        self.assertEqual(len(HistoryLog(self.legacy).load()), 3)
+
+    def test_plain_load_leaves_legacy_file(self):
+        """Test that reading without migrate includes the legacy records but writes nothing."""
+        with open(self.legacy, 'w') as f:
+            json.dump([self._record('17.2'), self._record('17.1')], f)
+        before = self.legacy.read_text()
+        records = self.log.load()
+        self.assertEqual([r['current_sprint'] for r in records], ['17.1', '17.2'])
+        self.assertEqual(self.legacy.read_text(), before)
+        self.assertFalse(self.log.log_path.exists())
+        self.assertFalse(Path(str(self.legacy) + '.bak').exists())
+
+    def test_truncated_line_skipped(self):
+        """Test that a partially written final line is ignored."""
+        self.log.append(self._record('17.1'))
+        with open(self.log.log_path, 'a') as f:
+            f.write('{"id": "abc", "incre')
+        self.assertEqual(len(HistoryLog(self.legacy).load()), 1)
+        self.log.append(self._record('17.2'))
+        self.assertEqual(len(HistoryLog(self.legacy).load()), 2)
+
+
+class TestSqliteHistoryStore(unittest.TestCase):
+    """Unit tests for the SQLite history backend and its query API."""
+
+    def setUp(self):
+        """Create a database seeded with snapshots across two increments."""
+        self.db_path = Path('test_history_store.db')
+        if self.db_path.exists():
+            self.db_path.unlink()
+        self.store = SqliteHistoryStore(self.db_path, import_from=Path('missing_history.json'))
+        snapshots = [
+            (16, '16.6', '2025-08-01T10:00:00'),
+            (17, '17.1', '2025-10-01T10:00:00'),
+            (17, '17.1', '2025-10-02T10:00:00'),
+            (17, '17.2', '2025-10-15T10:00:00'),
+            (17, '17.10', '2025-12-01T10:00:00'),
+        ]
+        for increment, sprint, timestamp in snapshots:
+            self.store.append({'increment': increment, 'current_sprint': sprint,
+                               'sprint_range': '', 'metrics': {}, 'timestamp': timestamp})
+
+    def tearDown(self):
+        """Close and remove the database."""
+        self.store.close()
+        self.db_path.unlink()
+
+    def _sprints(self, records):
+        return [(r['current_sprint'], r['timestamp'][:10]) for r in records]
+
+    def test_load_and_count(self):
+        """Test that every record is returned in chronological order."""
+        self.assertEqual(self.store.count(), 5)
+        self.assertEqual(self.store.load()[0]['current_sprint'], '16.6')
+
+    def test_increment_and_date_range(self):
+        """Test filtering by increment between two dates."""
+        records = self.store.query(increment=17, since='2025-10-02', until='2025-11-30')
+        self.assertEqual(self._sprints(records), [('17.1', '2025-10-02'), ('17.2', '2025-10-15')])
+
+    def test_sprint_range_orders_numerically(self):
+        """Test that sprint 17.10 sorts after 17.2."""
+        records = self.store.query(from_sprint='17.2', to_sprint='17.10')
+        self.assertEqual([r['current_sprint'] for r in records], ['17.2', '17.10'])
+
+    def test_latest_per_sprint(self):
+        """Test that only the newest snapshot of each sprint is returned."""
+        records = self.store.latest_per_sprint(increment=17)
+        self.assertEqual(self._sprints(records),
+                         [('17.1', '2025-10-02'), ('17.2', '2025-10-15'), ('17.10', '2025-12-01')])
+
+    def test_delete_and_newest_first(self):
+        """Test deleting a record and reading newest first with a limit."""
+        newest = self.store.query(newest_first=True, limit=1)[0]
+        self.store.delete(newest['id'])
+        self.assertEqual(self.store.query(newest_first=True, limit=1)[0]['current_sprint'], '17.2')
+
+    def test_pages_with_offset(self):
+        """Test that limit and offset page through the records newest first."""
+        pages = [self.store.query(newest_first=True, limit=2, offset=offset) for offset in (0, 2, 4)]
+        self.assertEqual([[r['current_sprint'] for r in page] for page in pages],
+                         [['17.10', '17.2'], ['17.1', '17.1'], ['16.6']])
+        self.assertEqual(len(self.store.query(offset=3)), 2)
+
+    def test_import_leaves_legacy_file(self):
+        """Test that seeding a new database reads a legacy JSON history without migrating it."""
+        db_path, legacy = Path('test_import_history.db'), Path('test_import_history.json')
+        records = [{'increment': 17, 'current_sprint': f'17.{i}', 'sprint_range': '', 'metrics': {},
+                    'timestamp': f'2025-10-0{i}T10:00:00'} for i in (2, 1)]
+        legacy.write_text(json.dumps(records))
+        try:
+            store = SqliteHistoryStore(db_path)
+            self.assertEqual([r['current_sprint'] for r in store.load()], ['17.1', '17.2'])
+            store.close()
+            self.assertEqual(json.loads(legacy.read_text()), records)
+            self.assertFalse(legacy.with_suffix('.jsonl').exists())
+        finally:
+            for path in (db_path, legacy):
+                if path.exists():
+                    path.unlink()
+
+    def test_open_history_store_selects_backend(self):
+        """Test that the file suffix picks the backend."""
+        self.assertIsInstance(open_history_store('history.json'), HistoryLog)
+        store = open_history_store(self.db_path)
+        self.assertIsInstance(store, SqliteHistoryStore)
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
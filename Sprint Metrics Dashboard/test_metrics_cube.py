@@ -0,0 +1,106 @@
+"""
+Unit tests for metrics_cube.
+"""
+
+import math
+import unittest
+
+import numpy as np
+
+from history_snapshot import Snapshot
+from metrics_cube import MetricsCube
+
+
+def _make_record(increment, sprint, timestamp, delivered=1, health=3.5):
+    """Build a history record with per-category offsets on the metric values."""
+    return {
+        'increment': increment,
+        'current_sprint': sprint,
+        'sprint_range': f"{increment}.1 - {sprint}",
+        'metrics': {
+            key: {'delivered': delivered + i, 'total': 40, 'health': health}
+            for i, key in enumerate(('digitalTechnology', 'digital',
+                                     'enterpriseApplications', 'technologyOperations'))
+        },
+        'timestamp': timestamp,
+    }
+
+
+class TestMetricsCube(unittest.TestCase):
+    """Unit tests for the columnar metrics cube."""
+
+    def setUp(self):
+        """Two increments, with a corrected second snapshot of sprint 17.2."""
+        self.records = [
+            _make_record(16, '16.1', '2025-09-01T10:00:00', delivered=2),
+            _make_record(16, '16.2', '2025-09-15T10:00:00', delivered=4),
+            _make_record(17, '17.1', '2025-11-03T10:00:00', delivered=1),
+            _make_record(17, '17.2', '2025-11-17T10:00:00', delivered=5),
+            _make_record(17, '17.2', '2025-11-18T10:00:00', delivered=6),
+        ]
+        self.cube = MetricsCube.from_records(self.records)
+
+    def test_shape_and_latest_per_sprint(self):
+        """The dense cube holds the newest snapshot of each sprint and NaN elsewhere."""
+        self.assertEqual(self.cube.values.shape, (2, 2, 4, 3))
+        self.assertEqual(list(self.cube.increments), [16, 17])
+        self.assertEqual(self.cube.values[1, 1, 0, 0], 6)
+        self.assertEqual(len(self.cube), 5)
+
+        earlier = self.cube.latest_per_sprint(as_of='2025-11-17T12:00:00')
+        self.assertEqual(earlier[1, 1, 0, 0], 5)
+        self.assertTrue(math.isnan(self.cube.latest_per_sprint(as_of='2025-09-02T00:00:00')[1, 0, 0, 0]))
+
+    def test_select_one_series(self):
+        """Selecting one category and metric over a range gives increments x sprints."""
+        delivered = self.cube.select(increments=(12, 17), categories='enterpriseApplications',
+                                     metrics='delivered')
+        np.testing.assert_array_equal(delivered, [[4, 6], [3, 8]])
+        both = self.cube.select(increments=17, sprints=2, categories=['digital', 'digitalTechnology'],
+                                metrics=['delivered', 'health'])
+        np.testing.assert_array_equal(both, [[7, 3.5], [6, 3.5]])
+        with self.assertRaises(KeyError):
+            self.cube.select(increments=18)
+        with self.assertRaises(ValueError):
+            self.cube.select(categories='marketing')
+
+    def test_rollups(self):
+        """Rollups reduce an axis, ignoring sprints without snapshots."""
+        np.testing.assert_array_equal(self.cube.rollup('delivered', over='sprint', how='sum')[:, 0], [6, 7])
+        np.testing.assert_array_equal(self.cube.rollup('delivered', over='sprint', how='last')[:, 0], [4, 6])
+        np.testing.assert_array_equal(self.cube.rollup('delivered', over='category')[1], [10, 30])
+
+        self.cube.append(_make_record(18, '18.3', '2026-01-01T10:00:00', delivered=3))
+        last = self.cube.rollup('delivered', over='sprint', how='last')
+        self.assertEqual(last[2, 0], 3)
+        self.assertEqual(self.cube.rollup('health', over='sprint', how='mean')[2, 0], 3.5)
+        self.assertTrue(math.isnan(self.cube.select(increments=18, sprints=1, categories='digital',
+                                                    metrics='total')))
+
+    def test_incremental_append_matches_rebuild(self):
+        """Appending out of order gives the same cube as building from scratch."""
+        cube = MetricsCube(capacity=1)
+        for record in reversed(self.records):
+            cube.append(Snapshot.from_record(record))
+        np.testing.assert_array_equal(cube.values, self.cube.values)
+        self.assertEqual(len(cube), len(self.records))
+
+    def test_sprint_without_number_is_skipped(self):
+        """A snapshot of sprint "17" (sprint 0) is left out instead of landing in the last column."""
+        unnumbered = _make_record(17, '17', '2025-12-01T10:00:00', delivered=99)
+        built = MetricsCube.from_records(self.records + [unnumbered])
+        appended = MetricsCube.from_records(self.records)
+        appended.append(unnumbered)
+        for cube in (built, appended):
+            np.testing.assert_array_equal(cube.values, self.cube.values)
+            self.assertEqual((len(cube), cube.skipped), (5, 1))
+
+    def test_snapshot_columns(self):
+        """Every snapshot is kept, not just the latest per sprint."""
+        columns = self.cube.snapshots(increment=17, category='digital', metric='delivered')
+        np.testing.assert_array_equal(columns['sprint'], [1, 2, 2])
+        np.testing.assert_array_equal(columns['values'], [2, 6, 7])
+
+
+if __name__ == "__main__":
+    unittest.main()
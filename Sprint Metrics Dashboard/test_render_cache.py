@@ -0,0 +1,86 @@
+"""
+Unit tests for render_cache.
+"""
+
+import json
+import os
+import shutil
+import time
+import unittest
+from pathlib import Path
+
+from render_cache import RenderCache, render_key
+
+
+class TestRenderCache(unittest.TestCase):
+    """Unit tests for render keys and the on-disk LRU cache."""
+
+    METRICS = {
+        'digitalTechnology': {'delivered': 5, 'total': 153, 'health': 3.38},
+        'digital': {'delivered': 3, 'total': 39, 'health': 3.63},
+    }
+
+    def setUp(self):
+        """Create an empty cache in a scratch directory."""
+        self.cache_dir = Path('test_render_cache')
+        self.cache = RenderCache(self.cache_dir, max_bytes=1000)
+
+    def tearDown(self):
+        """Remove the scratch cache directory."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _key(self, **overrides):
+        """Build a render key with optional field overrides."""
+        args = dict(increment=17, current_sprint='17.2', sprints=['17.1', '17.2'],
+                    metrics=self.METRICS, sprint_range='17.1 - 17.2', template_version='1')
+        args.update(overrides)
+        return render_key(**args)
+
+    def test_key_is_stable(self):
+        """Test that dict ordering does not change the key."""
+        reordered = dict(reversed(list(self.METRICS.items())))
+        self.assertEqual(self._key(), self._key(metrics=reordered))
+
+    def test_key_changes_with_inputs(self):
+        """Test that metrics and template version are part of the key."""
+        changed = json.loads(json.dumps(self.METRICS))
+        changed['digital']['delivered'] = 4
+        self.assertNotEqual(self._key(), self._key(metrics=changed))
+        self.assertNotEqual(self._key(), self._key(template_version='2'))
+
+    def test_html_round_trip(self):
+        """Test storing and retrieving HTML."""
+        key = self._key()
+        self.assertIsNone(self.cache.get_html(key))
+        self.cache.put_html(key, '<html>cached</html>')
+        self.assertEqual(self.cache.get_html(key), '<html>cached</html>')
+
+    def test_png_copy(self):
+        """Test that a stored PNG can be copied back out."""
+        key = self._key()
+        source = self.cache_dir / 'source.png'
+        source.write_bytes(b'PNGDATA')
+        self.cache.put_png(key, source)
+        destination = self.cache_dir / 'out.png'
+        self.assertTrue(self.cache.copy_png(key, destination))
+        self.assertEqual(destination.read_bytes(), b'PNGDATA')
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        old, recent, new = self._key(increment=1), self._key(increment=2), self._key(increment=3)
+        self.cache.put_html(old, 'x' * 400)
+        self.cache.put_html(recent, 'y' * 400)
+        # Age both entries, then use 'recent' so 'old' becomes the LRU entry
+        past = time.time() - 100
+        os.utime(self.cache_dir / old, (past, past))
+        os.utime(self.cache_dir / recent, (past + 1, past + 1))
+        self.cache.get_html(recent)
+        self.cache.put_html(new, 'z' * 400)
+        self.assertIsNone(self.cache.get_html(old))
+        self.assertIsNotNone(self.cache.get_html(recent))
+        self.assertIsNotNone(self.cache.get_html(new))
+        self.assertLessEqual(self.cache.size_bytes(), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Unit tests for render_queue.
+"""
+
+import gc
+import threading
+import unittest
+import weakref
+
+from render_queue import CANCELLED, DONE, FAILED, PENDING, RUNNING, RenderQueue
+
+
+class TestRenderQueue(unittest.TestCase):
+    """Unit tests for the bounded render job queue."""
+
+    def setUp(self):
+        """Create a single-worker queue and a gate that holds jobs open."""
+        self.queue = RenderQueue(workers=1)
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+    def tearDown(self):
+        """Release any blocked job and stop the workers."""
+        self.gate.set()
+        self.queue.shutdown()
+
+    def blocking_job(self, job, value):
+        """Job that waits on the gate, then returns its value."""
+        self.started.set()
+        self.gate.wait(5)
+        return value
+
+    def start_blocker(self):
+        """Occupy the only worker until the gate opens."""
+        job = self.queue.submit('blocker', self.blocking_job, 'blocker')
+        self.assertTrue(self.started.wait(5))
+        return job
+
+    def test_job_result_and_events(self):
+        """A job runs on a worker and reports queued, running, progress and done."""
+        def job_func(job, a, b):
+            job.report("halfway")
+            return a + b
+
+        job = self.queue.submit('sum', job_func, 2, 3)
+        self.assertTrue(job.wait(5))
+        self.assertTrue(self.queue.wait_idle(5))
+        self.assertEqual(job.status, DONE)
+        self.assertEqual(job.result, 5)
+        kinds = [kind for _, kind, _ in self.queue.drain_events()]
+        self.assertEqual(kinds, [PENDING, RUNNING, 'progress', DONE])
+        self.assertEqual(self.queue.drain_events(), [])
+
+    def test_pending_job_is_coalesced(self):
+        """A newer job with the same key replaces the one still waiting."""
+        self.start_blocker()
+        first = self.queue.submit('dashboard.html', lambda job: 'first')
+        second = self.queue.submit('dashboard.html', lambda job: 'second')
+        self.assertEqual(first.status, CANCELLED)
+        self.assertEqual(self.queue.pending_count, 1)
+
+        self.gate.set()
+        self.assertTrue(self.queue.wait_idle(5))
+        self.assertIsNone(first.result)
+        self.assertEqual(second.result, 'second')
+
+    def test_cancel_pending_and_running(self):
+        """Waiting jobs are dropped; running jobs finish as cancelled."""
+        running = self.start_blocker()
+        waiting = self.queue.submit('later', lambda job: 'never')
+        self.assertEqual(self.queue.cancel_all(), 2)
+        self.assertEqual(waiting.status, CANCELLED)
+        self.assertTrue(running.cancelled)
+
+        self.gate.set()
+        self.assertTrue(running.wait(5))
+        self.assertEqual(running.status, CANCELLED)
+        self.assertFalse(self.queue.cancel(running))
+
+    def test_failure_is_reported(self):
+        """An exception in a job is captured instead of killing the worker."""
+        def broken(job):
+            raise ValueError("bad metrics")
+
+        failed = self.queue.submit('broken', broken)
+        ok = self.queue.submit('ok', lambda job: 'fine')
+        self.assertTrue(self.queue.wait_idle(5))
+        self.assertEqual(failed.status, FAILED)
+        self.assertIsInstance(failed.error, ValueError)
+        self.assertEqual(ok.result, 'fine')
+        messages = [message for job, kind, message in self.queue.drain_events() if kind == FAILED]
+        self.assertEqual(messages, ["ValueError: bad metrics"])
+
+    def test_worker_count_is_fixed(self):
+        """Many submissions never start more worker threads than configured."""
+        queue = RenderQueue(workers=2)
+        self.addCleanup(queue.shutdown)
+        for i in range(10):
+            queue.submit(f"job-{i}", lambda job: None)
+        self.assertTrue(queue.wait_idle(5))
+        self.assertEqual(len(queue._threads), 2)
+
+    def test_submit_after_shutdown(self):
+        """A shut down queue refuses new jobs."""
+        self.queue.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.queue.submit('late', lambda job: None)
+
+    def test_shutdown_releases_queue(self):
+        """A shut down queue is no longer kept alive by its exit hook."""
+        queue = RenderQueue(workers=1)
+        queue.shutdown()
+        for thread in queue._threads:
+            thread.join(5)
+        ref = weakref.ref(queue)
+        del queue
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Unit tests for render_trace.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+import unittest
+
+from render_trace import MetricsLog, RenderTrace, current_rss_bytes, stage
+
+
+class TestRenderTrace(unittest.TestCase):
+    """Unit tests for per-stage timing records and the metrics file."""
+
+    def setUp(self):
+        """Use a scratch metrics file."""
+        self.metrics_file = 'test_render_metrics.jsonl'
+
+    def tearDown(self):
+        """Remove the metrics file."""
+        if os.path.exists(self.metrics_file):
+            os.unlink(self.metrics_file)
+
+    def test_stages_recorded_in_order(self):
+        """Each stage records its name, wall time and memory."""
+        trace = RenderTrace('dashboard', increment=17)
+        with trace.stage('generate_html'):
+            time.sleep(0.01)
+        trace.add('chrome_launch', 0.5)
+        record = trace.finish()
+
+        self.assertEqual([s['name'] for s in record['stages']], ['generate_html', 'chrome_launch'])
+        self.assertGreaterEqual(record['stages'][0]['seconds'], 0.01)
+        self.assertEqual(trace.seconds('chrome_launch'), 0.5)
+        self.assertGreaterEqual(record['total_seconds'], 0.01)
+        self.assertEqual(record['context'], {'increment': 17})
+        self.assertEqual(record['status'], 'ok')
+        if current_rss_bytes() is not None:
+            self.assertIn('rss_delta_bytes', record['stages'][0])
+
+    def test_failed_stage_still_recorded(self):
+        """A stage that raises is kept, and the error ends up in the record."""
+        trace = RenderTrace('dashboard')
+        with self.assertRaises(ValueError):
+            with trace.stage('page_load'):
+                raise ValueError("no page")
+        record = trace.finish(ValueError("no page"))
+        self.assertEqual(record['stages'][0]['name'], 'page_load')
+        self.assertEqual(record['status'], 'error')
+        self.assertEqual(record['error'], "ValueError: no page")
+
+    def test_python_peak_when_tracing(self):
+        """With tracemalloc running, a stage reports its peak Python allocation."""
+        tracemalloc.start()
+        try:
+            trace = RenderTrace('dashboard')
+            with trace.stage('generate_html'):
+                block = bytearray(2 * 1024 * 1024)
+                del block
+        finally:
+            tracemalloc.stop()
+        self.assertGreaterEqual(trace.stages[0]['py_peak_bytes'], 2 * 1024 * 1024)
+
+    def test_stage_helper_without_trace(self):
+        """stage(None, ...) is a no-op so callers need not branch."""
+        with stage(None, 'capture'):
+            pass
+        trace = RenderTrace('dashboard')
+        with stage(trace, 'capture'):
+            pass
+        self.assertEqual(len(trace.stages), 1)
+
+    def test_metrics_log_one_line_per_render(self):
+        """Records are appended as single JSON lines and read back in order."""
+        log = MetricsLog(self.metrics_file)
+        self.assertEqual(log.read(), [])
+        for sprint in ('17.1', '17.2'):
+            trace = RenderTrace('dashboard', sprint=sprint)
+            with trace.stage('write_html'):
+                pass
+            log.write(trace.finish())
+
+        with open(self.metrics_file) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])['context']['sprint'], '17.2')
+        self.assertEqual([r['context']['sprint'] for r in log.read()], ['17.1', '17.2'])
+
+
+if __name__ == "__main__":
+    unittest.main()
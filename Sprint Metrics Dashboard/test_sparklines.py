@@ -0,0 +1,63 @@
+"""
+Unit tests for sparklines.
+"""
+
+import unittest
+
+from sparklines import latest_by_sprint, render_sparkline, trend_series
+
+
+def _make_record(sprint, timestamp, delivered, health=3.5):
+    """Build a history record for one category."""
+    increment = int(sprint.split('.')[0])
+    return {
+        'increment': increment,
+        'current_sprint': sprint,
+        'sprint_range': f"{increment}.1 - {sprint}",
+        'metrics': {'digital': {'delivered': delivered, 'total': 40, 'health': health}},
+        'timestamp': timestamp,
+    }
+
+
+class TestSparklines(unittest.TestCase):
+    """Unit tests for the history trends and their SVG."""
+
+    def setUp(self):
+        """History out of order, with a corrected snapshot of 17.1."""
+        self.history = [
+            _make_record('17.2', '2025-11-17T10:00:00', 6, 3.4),
+            _make_record('16.6', '2025-10-20T10:00:00', 2, 3.0),
+            _make_record('17.1', '2025-11-03T10:00:00', 3, 3.1),
+            _make_record('17.1', '2025-11-04T10:00:00', 4, 3.2),
+            _make_record('17.3', '2025-12-01T10:00:00', 9, 3.9),
+        ]
+        self.index = latest_by_sprint(self.history)
+
+    def test_index_keeps_latest_snapshot_per_sprint(self):
+        """The index is sorted by sprint and holds the newest snapshot of each."""
+        self.assertEqual([key for key, _ in self.index], [(16, 6), (17, 1), (17, 2), (17, 3)])
+        self.assertEqual(self.index[1][1]['metrics']['digital']['delivered'], 4)
+
+    def test_trend_uses_earlier_sprints_and_current_values(self):
+        """Only sprints before the current one come from history; the form ends the series."""
+        current = {'digital': {'delivered': 7, 'total': 40, 'health': 3.6}}
+        trends = trend_series(self.index, '17.3', current)
+        self.assertEqual(trends['digital']['delivered'], [2, 4, 6, 7])
+        self.assertEqual(trends['digital']['health'], [3.0, 3.2, 3.4, 3.6])
+
+        self.assertEqual(trend_series(self.index, '17.3', current, points=2)['digital']['delivered'], [6, 7])
+        self.assertEqual(trend_series(self.index, '17.2')['digital']['delivered'], [2, 4])
+        self.assertEqual(trend_series(self.index, '16.1'), {})
+
+    def test_render_sparkline(self):
+        """Series of two or more values become an SVG polyline spanning the view box."""
+        svg = render_sparkline([1, 3, 2], "Delivered")
+        self.assertTrue(svg.startswith('<svg class="sparkline"'))
+        self.assertIn('points="3.0,27.0 50.0,3.0 97.0,15.0"', svg)
+        self.assertIn('aria-label="Delivered"', svg)
+        self.assertIn('points="3.0,15.0 97.0,15.0"', render_sparkline([2, 2], "Flat"))
+        self.assertEqual(render_sparkline([5], "Single"), '')
+
+
+if __name__ == "__main__":
+    unittest.main()
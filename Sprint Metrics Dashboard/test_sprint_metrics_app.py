@@ -0,0 +1,407 @@
+"""
+Unit tests for the Sprint Metrics Dashboard Generator (sprint_metrics_app).
+
+Run with ``python sprint_metrics_app.py --test`` or ``python -m unittest``.
+These tests create a hidden Tk root window, so they need a display.
+"""
+
+import shutil
+import time
+import tkinter as tk
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from sprint_metrics_app import SprintMetricsApp
+
+
+class TestSprintMetricsApp(unittest.TestCase):
+    """
+    Comprehensive unit tests for Sprint Metrics Dashboard Generator.
+    
+    Tests cover:
+    - Sprint dropdown generation
+    - History management (load, save, delete)
+    - HTML generation
+    - Data validation
+    """
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        # Scratch history and render cache, so tests never touch the
+        # repository's sprint_history.json or hit earlier renders
+        self.test_history_file = Path("test_sprint_history.json")
+        self.test_cache_dir = Path("test_render_cache")
+        self._remove_test_files()
+        
+        # Create mock root window for testing
+        self.root = tk.Tk()
+        self.root.withdraw()  # Hide window during tests
+        self.app = SprintMetricsApp(self.root, history_file=self.test_history_file,
+                                    render_cache_dir=self.test_cache_dir)
+        
+        # Wait for the (empty) background history load so it cannot
+        # overwrite the history a test sets up
+        self.app._history_thread.join(10)
+        self.app._poll_history_load()
+    
+    def tearDown(self):
+        """Clean up after each test method."""
+        # Stop render workers and destroy tkinter window
+        self.app.render_queue.shutdown()
+        self.root.destroy()
+        
+        self._remove_test_files()
+    
+    def _remove_test_files(self):
+        """Delete the scratch history files and render cache."""
+        for path in (self.test_history_file, self.test_history_file.with_suffix('.jsonl'),
+                     self.test_history_file.with_name(self.test_history_file.name + '.bak')):
+            if path.exists():
+                path.unlink()
+        shutil.rmtree(self.test_cache_dir, ignore_errors=True)
+    
+    def test_initial_values(self):
+        """Test that application initializes with correct default values."""
+        self.assertEqual(self.app.increment.get(), 17)
+        self.assertEqual(self.app.current_sprint.get(), "17.1")
+        self.assertEqual(self.app.sprint_range.get(), "17.1 - 17.1")
+        
+        # Test default metrics
+        self.assertEqual(self.app.metrics['digitalTechnology']['delivered'].get(), 5)
+        self.assertEqual(self.app.metrics['digital']['total'].get(), 39)
+        self.assertAlmostEqual(self.app.metrics['enterpriseApplications']['health'].get(), 3.58)
+    
+    def test_sprint_dropdown_generation(self):
+        """Test that sprint dropdown generates correct values for different increments."""
+        # Test increment 17
+        self.app.increment.set(17)
+        self.app.update_sprint_dropdown()
+        expected_sprints = ["17.1", "17.2", "17.3", "17.4", "17.5", "17.6"]
+        self.assertEqual(list(self.app.sprint_dropdown['values']), expected_sprints)
+        
+        # Test increment 18
+        self.app.increment.set(18)
+        self.app.update_sprint_dropdown()
+        expected_sprints = ["18.1", "18.2", "18.3", "18.4", "18.5", "18.6"]
+        self.assertEqual(list(self.app.sprint_dropdown['values']), expected_sprints)
+        
+        # Test that current sprint resets if invalid
+        self.app.current_sprint.set("17.1")
+        self.app.increment.set(19)
+        self.app.update_sprint_dropdown()
+        self.assertEqual(self.app.current_sprint.get(), "19.1")
+    
+    def test_save_and_load_history(self):
+        """Test saving and loading history from JSON file."""
+        # Save a record
+        self.app.increment.set(17)
+        self.app.current_sprint.set("17.3")
+        self.app.metrics['digital']['delivered'].set(10)
+        
+        self.app.save_to_history()
+        
+        # Verify history was saved
+        self.assertEqual(len(self.app.history), 1)
+        self.assertEqual(self.app.history[0]['increment'], 17)
+        self.assertEqual(self.app.history[0]['current_sprint'], "17.3")
+        
+        # Create new app instance and verify history loads
+        new_app = SprintMetricsApp(self.root, history_file=self.test_history_file,
+                                   render_cache_dir=self.test_cache_dir)
+        try:
+            new_app._history_thread.join(10)
+            new_app._poll_history_load()
+            self.assertEqual(len(new_app.history), 1)
+            self.assertEqual(new_app.history[0]['metrics']['digital']['delivered'], 10)
+        finally:
+            new_app.render_queue.shutdown()
+    
+    def test_load_from_history(self):
+        """Test loading configuration from a historical record."""
+        # Create a test record
+        test_record = {
+            'increment': 18,
+            'current_sprint': '18.4',
+            'sprint_range': '18.1 - 18.4',
+            'metrics': {
+                'digitalTechnology': {'delivered': 8, 'total': 200, 'health': 3.5},
+                'digital': {'delivered': 5, 'total': 50, 'health': 3.7},
+                'enterpriseApplications': {'delivered': 2, 'total': 30, 'health': 3.2},
+                'technologyOperations': {'delivered': 4, 'total': 80, 'health': 3.9}
+            },
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        # Create mock window
+        mock_window = Mock()
+        mock_window.destroy = Mock()
+        
+        # Load the record
+        self.app.load_from_history(test_record, mock_window)
+        
+        # Verify all values were loaded correctly
+        self.assertEqual(self.app.increment.get(), 18)
+        self.assertEqual(self.app.current_sprint.get(), '18.4')
+        self.assertEqual(self.app.sprint_range.get(), '18.1 - 18.4')
+        self.assertEqual(self.app.metrics['digitalTechnology']['delivered'].get(), 8)
+        self.assertEqual(self.app.metrics['digital']['health'].get(), 3.7)
+        
+        # Verify window was closed
+        mock_window.destroy.assert_called_once()
+    
+    def test_html_generation_structure(self):
+        """Test that HTML generation creates valid structure."""
+        # Set test values
+        self.app.increment.set(17)
+        self.app.current_sprint.set("17.2")
+        self.app.metrics['digitalTechnology']['delivered'].set(7)
+        
+        # Mock the file dialog, then wait for the queued render to finish
+        with patch('tkinter.filedialog.asksaveasfilename', return_value="test.html"):
+            # Generate files
+            self.app.generate_files()
+        self.assertTrue(self.app.render_queue.wait_idle(timeout=60))
+        self.app._poll_render_queue()
+        self.assertIn("Saved 1 export(s)", self.app.render_status.get())
+
+        # Verify HTML structure
+        with open("test.html", "r") as f:
+            html = f.read()
+
+        self.assertIn('<!DOCTYPE html>', html)
+        self.assertIn('INCREMENT 17', html)
+        self.assertIn('DIGITAL TECHNOLOGY', html)
+        self.assertIn('FEATURES DELIVERED', html)
+        self.assertIn('HEALTH METRICS', html)
+        
+        # Verify metrics are included
+        self.assertIn('7', html)  # delivered count
+        self.assertIn('153', html)  # total count
+        self.assertIn('3.38', html)  # health score
+        
+        # Verify active sprint is marked
+        self.assertIn('class="progress-item active">17.2', html)
+
+        # Verify that the image was created
+        self.assertTrue(Path("test.png").exists())
+
+        # Clean up the created files
+        Path("test.html").unlink()
+        Path("test.png").unlink()
+    
+    def test_html_formatting_precision(self):
+        """Test that health scores are formatted to 2 decimal places."""
+        metrics_data = {
+            'digitalTechnology': {'delivered': 5, 'total': 153, 'health': 3.3847},
+            'digital': {'delivered': 3, 'total': 39, 'health': 3.629},
+            'enterpriseApplications': {'delivered': 0, 'total': 43, 'health': 3.5},
+            'technologyOperations': {'delivered': 2, 'total': 71, 'health': 3.2145}
+        }
+        
+        html = self.app._generate_html_content(17, "17.1", ["17.1"], metrics_data)
+        
+        # Verify health scores are rounded to 2 decimals
+        self.assertIn('3.38', html)  # 3.3847 -> 3.38
+        self.assertIn('3.63', html)  # 3.629 -> 3.63
+        self.assertIn('3.50', html)  # 3.5 -> 3.50
+        self.assertIn('3.21', html)  # 3.2145 -> 3.21
+    
+    def test_delete_history_item(self):
+        """Test deleting a history record."""
+        # Add multiple records
+        for i in range(3):
+            self.app.increment.set(17)
+            self.app.current_sprint.set(f"17.{i+1}")
+            self.app.save_to_history()
+        
+        # Verify we have 3 records
+        self.assertEqual(len(self.app.history), 3)
+        
+        # Delete middle record (index 1)
+        self.app.history.pop(1)
+        self.app.save_history()
+        
+        # Reload and verify
+        self.app.history = self.app.load_history()
+        self.assertEqual(len(self.app.history), 2)
+    
+    def test_delete_history_item_removes_single_row(self):
+        """Test that deleting from the history list removes only that row."""
+        with patch('tkinter.messagebox.showinfo'):
+            for i in range(3):
+                self.app.current_sprint.set(f"17.{i+1}")
+                self.app.save_to_history()
+        
+        mock_tree = Mock()
+        with patch('tkinter.messagebox.askyesno', return_value=True):
+            deleted = self.app.delete_history_item(1, mock_tree, "row-2")
+        
+        self.assertTrue(deleted)
+        mock_tree.delete.assert_called_once_with("row-2")
+        self.assertEqual([r['current_sprint'] for r in self.app.load_history()], ["17.1", "17.3"])
+    
+    def test_empty_history_handling(self):
+        """Test that application handles empty history gracefully."""
+        # Override history file to non-existent file
+        self.app.history_file = Path("non_existent_history.json")
+        
+        # Load history from non-existent file
+        history = self.app.load_history()
+        
+        self.assertEqual(history, [])
+        self.assertIsInstance(history, list)
+    
+    def test_corrupted_history_handling(self):
+        """Test that application handles corrupted history file gracefully."""
+        # Create corrupted legacy JSON file with no log beside it, so the
+        # migration path has to read it
+        self._remove_test_files()
+        with open(self.test_history_file, 'w') as f:
+            f.write("This is not valid JSON{[]}")
+        
+        # Load history should return empty list and keep the file for recovery
+        history = self.app.load_history()
+        self.assertEqual(history, [])
+        self.assertTrue(self.test_history_file.exists())
+        self.assertFalse(self.test_history_file.with_suffix('.jsonl').exists())
+    
+    def test_history_loads_in_background(self):
+        """Test that history is loaded off the Tk thread and the button shows progress."""
+        with patch('tkinter.messagebox.showinfo'):
+            for i in range(3):
+                self.app.current_sprint.set(f"17.{i+1}")
+                self.app.save_to_history()
+        self.app.history = []
+        
+        self.app.start_history_load()
+        self.assertFalse(self.app.history_loaded)
+        self.assertEqual(self.app.history_button.cget('state'), tk.DISABLED)
+        
+        self.app._history_thread.join(10)
+        self.app._poll_history_load()
+        self.assertTrue(self.app.history_loaded)
+        self.assertEqual(self.app.history_button.cget('state'), tk.NORMAL)
+        self.assertEqual([r['current_sprint'] for r in self.app.history], ["17.1", "17.2", "17.3"])
+    
+    def test_save_while_history_loading_is_kept(self):
+        """Test that a snapshot saved during the background load is not lost."""
+        with patch('tkinter.messagebox.showinfo'):
+            self.app.current_sprint.set("17.1")
+            self.app.save_to_history()
+            self.app.history = []
+            self.app.start_history_load()
+            self.app.current_sprint.set("17.2")
+            self.app.save_to_history()
+        
+        self.app._history_thread.join(10)
+        self.app._poll_history_load()
+        self.assertEqual([r['current_sprint'] for r in self.app.history], ["17.1", "17.2"])
+    
+    def test_sqlite_history_keeps_latest_per_sprint(self):
+        """Test that a SQLite history loads one snapshot per sprint and deletes re-read it."""
+        db_path = Path("test_sprint_history.db")
+        self.app.history_file = db_path
+        self.addCleanup(db_path.unlink)
+        self.addCleanup(lambda: self.app.history_store().close())
+        with patch('tkinter.messagebox.showinfo'):
+            for sprint, delivered in (("17.1", 1), ("17.1", 2), ("17.2", 3)):
+                self.app.current_sprint.set(sprint)
+                self.app.metrics['digital']['delivered'].set(delivered)
+                self.app.save_to_history()
+        
+        self.app.start_history_load()
+        self.app._history_thread.join(10)
+        self.app._poll_history_load()
+        latest = {r['current_sprint']: r['metrics']['digital']['delivered'] for r in self.app.history}
+        self.assertEqual(latest, {"17.1": 2, "17.2": 3})
+        
+        newest_17_1 = next(r for r in self.app.history if r['current_sprint'] == "17.1")
+        with patch('tkinter.messagebox.askyesno', return_value=True):
+            self.assertTrue(self.app.delete_stored_record(newest_17_1))
+        latest = {r['current_sprint']: r['metrics']['digital']['delivered'] for r in self.app.history}
+        self.assertEqual(latest, {"17.1": 1, "17.2": 3})
+        self.assertEqual(self.app.history_store().count(), 2)
+    
+    def test_metrics_cube_tracks_saves(self):
+        """Test that the metrics cube is updated in place as snapshots are saved."""
+        with patch('tkinter.messagebox.showinfo'):
+            self.app.current_sprint.set("17.1")
+            self.app.save_to_history()
+            cube = self.app.metrics_cube()
+            self.app.metrics['digital']['delivered'].set(11)
+            self.app.current_sprint.set("17.2")
+            self.app.save_to_history()
+        
+        self.assertIs(self.app.metrics_cube(), cube)
+        self.assertEqual(len(cube), 2)
+        self.assertEqual(cube.select(increments=17, sprints=2, categories='digital', metrics='delivered'), 11)
+    
+    def test_metrics_cube_builds_in_background(self):
+        """Test that ticking Forecast builds the cube off the Tk thread, keeping later saves."""
+        with patch('tkinter.messagebox.showinfo') as showinfo:
+            self.app.current_sprint.set("17.1")
+            self.app.save_to_history()
+            self.app.show_forecast.set(True)
+            self.assertIsNotNone(self.app._cube_thread)
+            self.app.current_sprint.set("17.2")
+            self.app.save_to_history()
+            
+            # Generating before the cube is handed over only says so
+            with patch('tkinter.filedialog.asksaveasfilename') as dialog:
+                self.app.generate_files()
+            dialog.assert_not_called()
+            self.assertEqual(showinfo.call_args[0][0], "Forecast")
+        
+        deadline = time.monotonic() + 10
+        while self.app._metrics_cube is None and time.monotonic() < deadline:
+            self.root.update()
+            time.sleep(0.01)
+        self.assertEqual(len(self.app._metrics_cube), 2)
+    
+    def test_trend_data_from_history(self):
+        """Test that sparklines use saved earlier sprints and end with the form's values."""
+        with patch('tkinter.messagebox.showinfo'):
+            for i, delivered in enumerate((2, 4)):
+                self.app.current_sprint.set(f"17.{i+1}")
+                self.app.metrics['digital']['delivered'].set(delivered)
+                self.app.save_to_history()
+        
+        metrics = {key: {'delivered': 9, 'total': 40, 'health': 3.5} for key in self.app.metrics}
+        trends = self.app.trend_data("17.3", metrics)
+        self.assertEqual(trends['digital']['delivered'], [2, 4, 9])
+        html = self.app._generate_html_content(17, "17.3", [f"17.{i}" for i in range(1, 7)], metrics, trends)
+        self.assertEqual(html.count('<svg class="sparkline"'), 8)
+    
+    def test_forecast_data_from_history(self):
+        """Test that the forecast draws on saved sprint throughput."""
+        with patch('tkinter.messagebox.showinfo'):
+            for i in range(2):
+                self.app.current_sprint.set(f"17.{i+1}")
+                self.app.metrics['digital']['delivered'].set(3 * (i + 1))
+                self.app.save_to_history()
+        
+        sprints = [f"17.{i}" for i in range(1, 7)]
+        metrics = {key: {'delivered': 9, 'total': 18, 'health': 3.5} for key in self.app.metrics}
+        forecast = self.app.forecast_data("17.3", sprints, metrics)
+        self.assertEqual(forecast['digital']['p85'], '17.6')
+        self.assertEqual(forecast['digital']['on_time'], 1.0)
+        html = self.app._generate_html_content(17, "17.3", sprints, metrics, forecast=forecast)
+        self.assertIn('FINISH P50 17.6 · P85 17.6', html)
+    
+    def test_metrics_update(self):
+        """Test updating metric values through the application."""
+        # Update metrics
+        self.app.metrics['digital']['delivered'].set(15)
+        self.app.metrics['digital']['total'].set(100)
+        self.app.metrics['digital']['health'].set(3.95)
+        
+        # Verify updates
+        self.assertEqual(self.app.metrics['digital']['delivered'].get(), 15)
+        self.assertEqual(self.app.metrics['digital']['total'].get(), 100)
+        self.assertAlmostEqual(self.app.metrics['digital']['health'].get(), 3.95)
+
+
+if __name__ == "__main__":
+    unittest.main()